@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Generator
 import contextlib
 from datetime import timedelta
 import logging
@@ -78,9 +79,11 @@ from .setup import (
     BASE_PLATFORMS,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    async_get_setup_timeline,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_start_setup_timeline,
 )
 from .util.async_ import create_eager_task
 from .util.logging import async_activate_log_queue_handler
@@ -231,6 +234,7 @@ async def async_setup_hass(
 
     if not (recovery_mode := runtime_config.recovery_mode):
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
+        conf_util.async_enable_yaml_cache(hass)
 
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
@@ -362,20 +366,28 @@ async def async_from_config_dict(
     """
     start = monotonic()
 
+    async_start_setup_timeline(hass)
+    await asyncio.gather(
+        create_eager_task(loader.async_load_manifest_cache(hass)),
+        create_eager_task(loader.async_load_import_profile(hass)),
+    )
+    hass.async_create_background_task(
+        loader.async_prewarm_imports(hass), "prewarm integration imports"
+    )
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     await async_load_base_functionality(hass)
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
+    with _async_record_stage(hass, "core", CORE_INTEGRATIONS):
+        core_results = await asyncio.gather(
             *(
                 create_eager_task(async_setup_component(hass, domain, config))
                 for domain in CORE_INTEGRATIONS
             )
         )
-    ):
+    if not all(core_results):
         _LOGGER.error("Home Assistant core failed to initialize. ")
         return None
 
@@ -396,6 +408,26 @@ async def async_from_config_dict(
         return None
 
     await _async_set_up_integrations(hass, config)
+    loader.async_finish_import_profile(hass)
+    if timeline := async_get_setup_timeline(hass):
+        timeline.async_stop()
+        _LOGGER.debug(
+            "Startup critical path: %s",
+            " -> ".join(
+                f"{step['domain']} ({step['end'] - step['start']:.2f}s)"
+                for step in timeline.critical_path()
+            ),
+        )
+    hass.async_create_background_task(
+        loader.async_save_manifest_cache(hass),
+        "save integration manifest cache",
+        eager_start=True,
+    )
+    hass.async_create_background_task(
+        loader.async_save_import_profile(hass),
+        "save import profile",
+        eager_start=True,
+    )
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
@@ -652,6 +684,19 @@ class _WatchPendingSetups:
             self._handle = None
 
 
+@contextlib.contextmanager
+def _async_record_stage(
+    hass: core.HomeAssistant, name: str, domains: set[str]
+) -> Generator[None, None, None]:
+    """Record a bootstrap stage on the setup timeline."""
+    start = monotonic()
+    try:
+        yield
+    finally:
+        if timeline := async_get_setup_timeline(hass):
+            timeline.async_add_stage(name, domains, start, monotonic())
+
+
 async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
@@ -839,7 +884,8 @@ async def _async_set_up_integrations(
         if domain_group:
             stage_2_domains -= domain_group
             _LOGGER.info("Setting up %s: %s", name, domain_group)
-            await async_setup_multi_components(hass, domain_group, config)
+            with _async_record_stage(hass, name, domain_group):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -851,7 +897,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with _async_record_stage(hass, "stage 1", stage_1_domains):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -867,7 +914,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with _async_record_stage(hass, "stage 2", stage_2_domains):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -878,7 +926,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with _async_record_stage(hass, "wrap up", set()):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -1,7 +1,8 @@
 """Rest API for Home Assistant."""
 
 import asyncio
-from asyncio import shield, timeout
+from asyncio import shield
+from collections.abc import Mapping
 from functools import lru_cache
 from http import HTTPStatus
 import logging
@@ -21,10 +22,8 @@ from homeassistant.components.http import (
 )
 from homeassistant.const import (
     CONTENT_TYPE_JSON,
-    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     KEY_DATA_LOGGING as DATA_LOGGING,
-    MATCH_ALL,
     URL_API,
     URL_API_COMPONENTS,
     URL_API_CONFIG,
@@ -37,7 +36,7 @@ from homeassistant.const import (
     URL_API_TEMPLATE,
 )
 import homeassistant.core as ha
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import Event, HomeAssistant, valid_entity_id
 from homeassistant.exceptions import (
     InvalidEntityFormatError,
     InvalidStateError,
@@ -47,11 +46,13 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.event import EventStateChangedData
-from homeassistant.helpers.json import json_dumps, json_fragment
+from homeassistant.helpers.json import json_fragment
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.json import json_loads
 
+from .event_stream import DATA_EVENT_STREAM, STOP_FRAME, EventStreamHub, StreamFilter
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_BASE_URL = "base_url"
@@ -64,8 +65,6 @@ ATTR_UUID = "uuid"
 ATTR_VERSION = "version"
 
 DOMAIN = "api"
-STREAM_PING_PAYLOAD = "ping"
-STREAM_PING_INTERVAL = 50  # seconds
 SERVICE_WAIT_TIMEOUT = 10
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -73,6 +72,9 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Register the API with the HTTP interface."""
+    hub = hass.data[DATA_EVENT_STREAM] = EventStreamHub(hass)
+    hub.async_setup()
+
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APICoreStateView)
     hass.http.register_view(APIEventStream)
@@ -132,63 +134,56 @@ class APIEventStream(HomeAssistantView):
     async def get(self, request: web.Request) -> web.StreamResponse:
         """Provide a streaming interface for the event bus."""
         hass = request.app[KEY_HASS]
-        stop_obj = object()
-        to_write: asyncio.Queue[object | str] = asyncio.Queue()
-
-        restrict: list[str] | None = None
-        if restrict_str := request.query.get("restrict"):
-            restrict = restrict_str.split(",") + [EVENT_HOMEASSISTANT_STOP]
-
-        async def forward_events(event: Event) -> None:
-            """Forward events to the open request."""
-            if restrict and event.event_type not in restrict:
-                return
-
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
-
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json_dumps(event)
-
-            await to_write.put(data)
+        stream_filter = _async_stream_filter_from_query(request.query)
+        hub: EventStreamHub = hass.data[DATA_EVENT_STREAM]
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        client = hub.async_attach(stream_filter)
+        client_id = id(client)
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
-
-            # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
-
-            while True:
-                try:
-                    async with timeout(STREAM_PING_INTERVAL):
-                        payload = await to_write.get()
+            _LOGGER.debug("STREAM %s ATTACHED %s", client_id, stream_filter)
 
-                    if payload is stop_obj:
-                        break
-
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
-                except TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+            while (payload := await client.async_next_frames()) is not STOP_FRAME:
+                _LOGGER.debug("STREAM %s WRITING %s", client_id, payload.strip())
+                await response.write(payload)
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", client_id)
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            _LOGGER.debug("STREAM %s RESPONSE CLOSED", client_id)
+            hub.async_detach(client)
 
         return response
 
 
+def _async_stream_filter_from_query(query: Mapping[str, str]) -> StreamFilter:
+    """Build the stream filter from the request query.
+
+    ``restrict`` is the legacy name of ``event_type``.
+    """
+
+    def _split(key: str) -> frozenset[str] | None:
+        if not (value := query.get(key)):
+            return None
+        return frozenset(item.strip() for item in value.split(",") if item.strip())
+
+    event_types = _split("event_type")
+    if restrict := _split("restrict"):
+        event_types = restrict | (event_types or frozenset())
+    entity_ids = _split("entity_id")
+    domains = _split("domain")
+
+    if entity_ids and (invalid := [e for e in entity_ids if not valid_entity_id(e)]):
+        raise HTTPBadRequest(text=f"Invalid entity_id: {', '.join(sorted(invalid))}")
+
+    return StreamFilter(event_types, entity_ids, domains)
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -0,0 +1,259 @@
+"""Shared event bus fan-out for the server-sent events stream."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Final
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_dumps
+
+DATA_EVENT_STREAM: Final = "api_event_stream"
+
+STREAM_PING_PAYLOAD = "ping"
+STREAM_PING_INTERVAL = 50  # seconds
+
+PING_FRAME: Final = f"data: {STREAM_PING_PAYLOAD}\n\n".encode()
+STOP_FRAME: Final = b""
+
+
+@dataclass(slots=True, frozen=True)
+class StreamFilter:
+    """Filter applied to an event stream client.
+
+    ``None`` means the dimension is not filtered.
+    """
+
+    event_types: frozenset[str] | None = None
+    entity_ids: frozenset[str] | None = None
+    domains: frozenset[str] | None = None
+
+    @property
+    def by_entity(self) -> bool:
+        """Return if the filter restricts events by entity."""
+        return self.entity_ids is not None or self.domains is not None
+
+
+class StreamClient:
+    """A single consumer of the event stream."""
+
+    __slots__ = ("stream_filter", "queue", "idle")
+
+    def __init__(self, stream_filter: StreamFilter) -> None:
+        """Initialize the client."""
+        self.stream_filter = stream_filter
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self.idle = True
+
+    @callback
+    def async_put(self, frame: bytes) -> None:
+        """Queue a frame for the client."""
+        self.idle = False
+        self.queue.put_nowait(frame)
+
+    async def async_next_frames(self) -> bytes:
+        """Wait for the next frames and return everything queued.
+
+        Returns ``STOP_FRAME`` when the stream should be closed.
+        """
+        frames = [await self.queue.get()]
+        while not self.queue.empty():
+            frames.append(self.queue.get_nowait())
+        if STOP_FRAME in frames:
+            return STOP_FRAME
+        return b"".join(frames)
+
+
+class _StreamRoute:
+    """Clients subscribed to a single event type.
+
+    Clients filtering by entity are indexed by entity id and
+    domain so an event is only matched against the clients
+    that can be interested in it.
+    """
+
+    __slots__ = ("clients", "entity_clients", "domain_clients", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the route."""
+        self.clients: set[StreamClient] = set()
+        self.entity_clients: dict[str, set[StreamClient]] = {}
+        self.domain_clients: dict[str, set[StreamClient]] = {}
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @property
+    def empty(self) -> bool:
+        """Return if no clients are subscribed."""
+        return not (self.clients or self.entity_clients or self.domain_clients)
+
+    @callback
+    def async_add(self, client: StreamClient) -> None:
+        """Add a client to the route."""
+        stream_filter = client.stream_filter
+        if not stream_filter.by_entity:
+            self.clients.add(client)
+            return
+        for entity_id in stream_filter.entity_ids or ():
+            self.entity_clients.setdefault(entity_id, set()).add(client)
+        for domain in stream_filter.domains or ():
+            self.domain_clients.setdefault(domain, set()).add(client)
+
+    @callback
+    def async_remove(self, client: StreamClient) -> None:
+        """Remove a client from the route."""
+        stream_filter = client.stream_filter
+        if not stream_filter.by_entity:
+            self.clients.discard(client)
+            return
+        _async_remove_indexed(self.entity_clients, stream_filter.entity_ids, client)
+        _async_remove_indexed(self.domain_clients, stream_filter.domains, client)
+
+    @callback
+    def async_recipients(self, event: Event) -> set[StreamClient]:
+        """Return the clients that should receive an event."""
+        if not self.entity_clients and not self.domain_clients:
+            return self.clients
+        entity_id = event.data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return self.clients
+        recipients = set(self.clients)
+        if by_entity := self.entity_clients.get(entity_id):
+            recipients.update(by_entity)
+        if by_domain := self.domain_clients.get(entity_id.partition(".")[0]):
+            recipients.update(by_domain)
+        return recipients
+
+
+@callback
+def _async_remove_indexed(
+    index: dict[str, set[StreamClient]],
+    keys: Iterable[str] | None,
+    client: StreamClient,
+) -> None:
+    """Remove a client from an index and drop empty keys."""
+    for key in keys or ():
+        if (clients := index.get(key)) is None:
+            continue
+        clients.discard(client)
+        if not clients:
+            del index[key]
+
+
+class EventStreamHub:
+    """Fan out bus events to all event stream clients.
+
+    Each event type is subscribed to on the bus once, no matter how many
+    clients are interested in it, each event is serialized once and the
+    same frame is shared by every client, and a single timer sends the
+    keep-alive pings for all clients that have been idle.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_routes",
+        "_clients",
+        "_cancel_ping",
+        "_last_event",
+        "_last_frame",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._routes: dict[str, _StreamRoute] = {}
+        self._clients: set[StreamClient] = set()
+        self._cancel_ping: CALLBACK_TYPE | None = None
+        self._last_event: Event | None = None
+        self._last_frame = b""
+
+    @property
+    def client_count(self) -> int:
+        """Return the number of attached clients."""
+        return len(self._clients)
+
+    @callback
+    def async_setup(self) -> None:
+        """Set up the hub."""
+        self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_stop, run_immediately=True
+        )
+
+    @callback
+    def async_attach(self, stream_filter: StreamFilter) -> StreamClient:
+        """Attach a new client."""
+        client = StreamClient(stream_filter)
+        for event_type in stream_filter.event_types or (MATCH_ALL,):
+            if (route := self._routes.get(event_type)) is None:
+                route = self._routes[event_type] = _StreamRoute()
+                route.unsub = self._hass.bus.async_listen(
+                    event_type,
+                    partial(self._async_dispatch, route),
+                    run_immediately=True,
+                )
+            route.async_add(client)
+        if not self._clients:
+            self._cancel_ping = async_track_time_interval(
+                self._hass,
+                self._async_ping,
+                timedelta(seconds=STREAM_PING_INTERVAL),
+                name="api event stream ping",
+                cancel_on_shutdown=True,
+            )
+        self._clients.add(client)
+        # Fire off one message so browsers fire open event right away
+        client.async_put(PING_FRAME)
+        return client
+
+    @callback
+    def async_detach(self, client: StreamClient) -> None:
+        """Detach a client."""
+        if client not in self._clients:
+            return
+        self._clients.remove(client)
+        for event_type in client.stream_filter.event_types or (MATCH_ALL,):
+            route = self._routes[event_type]
+            route.async_remove(client)
+            if route.empty:
+                if route.unsub:
+                    route.unsub()
+                del self._routes[event_type]
+        if not self._clients and self._cancel_ping:
+            self._cancel_ping()
+            self._cancel_ping = None
+            self._last_event = None
+
+    @callback
+    def _async_dispatch(self, route: _StreamRoute, event: Event) -> None:
+        """Forward an event to the clients of a route."""
+        if event.event_type == EVENT_HOMEASSISTANT_STOP:
+            return
+        if not (recipients := route.async_recipients(event)):
+            return
+        # An event can reach the hub through both its own event type
+        # route and the match all route, only serialize it once.
+        if event is not self._last_event:
+            self._last_event = event
+            self._last_frame = f"data: {json_dumps(event)}\n\n".encode()
+        frame = self._last_frame
+        for client in recipients:
+            client.async_put(frame)
+
+    @callback
+    def _async_ping(self, _now: datetime) -> None:
+        """Send a keep-alive ping to every client that has been idle."""
+        for client in self._clients:
+            if client.idle:
+                client.queue.put_nowait(PING_FRAME)
+            client.idle = True
+
+    @callback
+    def _async_stop(self, _event: Event[Any]) -> None:
+        """Close all streams when Home Assistant stops."""
+        for client in self._clients:
+            client.queue.put_nowait(STOP_FRAME)
@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_stats
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -72,6 +73,7 @@ from homeassistant.helpers.script import (
     ATTR_MAX,
     CONF_MAX,
     CONF_MAX_EXCEEDED,
+    CONF_QUEUE_OVERFLOW,
     Script,
     ScriptRunResult,
     script_stack_cv,
@@ -322,6 +324,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     websocket_api.async_register_command(hass, websocket_config)
+    websocket_api.async_register_command(hass, websocket_queue_stats)
 
     return True
 
@@ -701,6 +704,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self.async_disable()
+        async_remove_stats(self.hass, f"{DOMAIN}.{self.unique_id}")
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
@@ -862,6 +866,7 @@ async def _create_automation_entities(
             script_mode=config_block[CONF_MODE],
             max_runs=config_block[CONF_MAX],
             max_exceeded=config_block[CONF_MAX_EXCEEDED],
+            queue_overflow=config_block[CONF_QUEUE_OVERFLOW],
             logger=LOGGER,
             # We don't pass variables here
             # Automation will already render them to use them in the condition
@@ -1109,6 +1114,26 @@ def websocket_config(
     )
 
 
+@websocket_api.websocket_command({"type": "automation/queue_stats", "entity_id": str})
+def websocket_queue_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get automation queue stats."""
+    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
+
+    automation = component.get_entity(msg["entity_id"])
+
+    if not isinstance(automation, AutomationEntity):
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "Entity not found"
+        )
+        return
+
+    connection.send_result(msg["id"], automation.action_script.queue_stats)
+
+
 # These can be removed if no deprecated constant are in this module anymore
 __getattr__ = partial(check_if_deprecated_constant, module_globals=globals())
 __dir__ = partial(
@@ -9,20 +9,40 @@ import voluptuous as vol
 from homeassistant import loader
 from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api.decorators import require_admin
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import (
+    EVENT_DEVICE_REGISTRY_UPDATED,
     DeviceEntry,
     DeviceEntryDisabler,
     async_get,
 )
+from homeassistant.helpers.registry import RegistryChanges
+
+from .registry_changes import CHANGES_SCHEMA, async_send_changes
+
+DATA_CHANGES = "config_device_registry_changes"
 
 
 @callback
 def async_setup(hass: HomeAssistant) -> bool:
     """Enable the Device Registry views."""
+    changes = hass.data[DATA_CHANGES] = RegistryChanges()
+
+    @callback
+    def _async_device_registry_updated(event: Event) -> None:
+        """Track the changed devices."""
+        data = event.data
+        changes.async_changed(data["device_id"], removed=data["action"] == "remove")
+
+    hass.bus.async_listen(
+        EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_device_registry_updated,
+        run_immediately=True,
+    )
 
     websocket_api.async_register_command(hass, websocket_list_devices)
+    websocket_api.async_register_command(hass, websocket_list_device_changes)
     websocket_api.async_register_command(hass, websocket_update_device)
     websocket_api.async_register_command(
         hass, websocket_remove_config_entry_from_device
@@ -60,6 +80,25 @@ def websocket_list_devices(
     connection.send_message(msg_json)
 
 
+@websocket_api.websocket_command(
+    {vol.Required("type"): "config/device_registry/list_changes", **CHANGES_SCHEMA}
+)
+@callback
+def websocket_list_device_changes(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle list changed devices command."""
+    async_send_changes(
+        connection,
+        msg,
+        hass.data[DATA_CHANGES],
+        async_get(hass).devices,
+        lambda entry: entry.json_repr,
+    )
+
+
 @require_admin
 @websocket_api.websocket_command(
     {
@@ -10,23 +10,44 @@ from homeassistant import config_entries
 from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api import ERR_NOT_FOUND
 from homeassistant.components.websocket_api.decorators import require_admin
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
 )
 from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.registry import RegistryChanges
+
+from .registry_changes import CHANGES_SCHEMA, async_send_changes
+
+DATA_CHANGES = "config_entity_registry_changes"
 
 
 @callback
 def async_setup(hass: HomeAssistant) -> bool:
     """Enable the Entity Registry views."""
+    changes = hass.data[DATA_CHANGES] = RegistryChanges()
+
+    @callback
+    def _async_entity_registry_updated(event: Event) -> None:
+        """Track the changed entities."""
+        data = event.data
+        if old_entity_id := data.get("old_entity_id"):
+            changes.async_changed(old_entity_id, removed=True)
+        changes.async_changed(data["entity_id"], removed=data["action"] == "remove")
+
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_entity_registry_updated,
+        run_immediately=True,
+    )
 
     websocket_api.async_register_command(hass, websocket_get_entities)
     websocket_api.async_register_command(hass, websocket_get_entity)
     websocket_api.async_register_command(hass, websocket_list_entities_for_display)
     websocket_api.async_register_command(hass, websocket_list_entities)
+    websocket_api.async_register_command(hass, websocket_list_entity_changes)
     websocket_api.async_register_command(hass, websocket_remove_entity)
     websocket_api.async_register_command(hass, websocket_update_entity)
     return True
@@ -58,6 +79,25 @@ def websocket_list_entities(
     connection.send_message(msg_json)
 
 
+@websocket_api.websocket_command(
+    {vol.Required("type"): "config/entity_registry/list_changes", **CHANGES_SCHEMA}
+)
+@callback
+def websocket_list_entity_changes(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle list changed registry entries command."""
+    async_send_changes(
+        connection,
+        msg,
+        hass.data[DATA_CHANGES],
+        er.async_get(hass).entities,
+        lambda entry: entry.partial_json_repr,
+    )
+
+
 _ENTITY_CATEGORIES_JSON = json_dumps(er.ENTITY_CATEGORY_INDEX_TO_VALUE)
 
 
@@ -0,0 +1,78 @@
+"""Send the changes of a registry to websocket clients."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import heapq
+from typing import Any, TypeVar
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.registry import RegistryChanges
+
+_EntryT = TypeVar("_EntryT")
+
+DEFAULT_LIMIT = 1000
+
+CHANGES_SCHEMA = {
+    vol.Optional("revision"): str,
+    vol.Optional("after"): str,
+    vol.Optional("limit", default=DEFAULT_LIMIT): vol.All(int, vol.Range(min=1)),
+}
+
+
+def async_send_changes(
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    changes: RegistryChanges,
+    entries: Mapping[str, _EntryT],
+    json_repr: Callable[[_EntryT], bytes | None],
+) -> None:
+    """Send the entries changed since a revision, or a page of all entries.
+
+    If the changes since the requested revision are known, only the changed
+    entries and the keys of removed entries are sent. Otherwise the entries
+    are listed in the order of their keys, starting after the "after" key.
+    Clients keep the revision of the first page, and request the changes
+    since that revision once all pages are fetched.
+    """
+    limit: int = msg["limit"]
+    removed: list[str] = []
+    if "revision" in msg and (
+        since := changes.async_changes_since(msg["revision"], limit)
+    ):
+        revision, changed, more = since
+        full = False
+        keys: list[str] = []
+        for key, was_removed in changed:
+            if was_removed or key not in entries:
+                removed.append(key)
+            else:
+                keys.append(key)
+    else:
+        revision = changes.revision
+        full = True
+        if (after := msg.get("after")) is None:
+            candidates: Any = entries
+        else:
+            candidates = (key for key in entries if key > after)
+        keys = heapq.nsmallest(limit + 1, candidates)
+        if more := len(keys) > limit:
+            del keys[limit:]
+
+    inner = b",".join(
+        [
+            entry_json
+            for key in keys
+            if (entry_json := json_repr(entries[key])) is not None
+        ]
+    )
+    msg_json_prefix = (
+        f'{{"id":{msg["id"]},"type":"{websocket_api.const.TYPE_RESULT}",'
+        f'"success":true,"result":{{"revision":{json_dumps(revision)},'
+        f'"full":{json_dumps(full)},"more":{json_dumps(more)},'
+        f'"removed":{json_dumps(removed)},"entries":['
+    ).encode()
+    connection.send_message(b"".join((msg_json_prefix, inner, b"]}}")))
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any
+from functools import partial
+from typing import Any, cast
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import DOMAIN
@@ -33,6 +36,22 @@ async def async_setup_entry(
         ]
     )
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_bulk_service_handler(
+        "async_turn_on", partial(_async_turn_all, True)
+    )
+    platform.async_register_bulk_service_handler(
+        "async_turn_off", partial(_async_turn_all, False)
+    )
+
+
+async def _async_turn_all(
+    is_on: bool, entities: list[Entity], data: dict[str, Any]
+) -> None:
+    """Turn many switches on or off with one command."""
+    for entity in entities:
+        cast(DemoSwitch, entity).async_set_is_on(is_on)
+
 
 class DemoSwitch(SwitchEntity):
     """Representation of a demo switch."""
@@ -70,3 +89,8 @@ class DemoSwitch(SwitchEntity):
         """Turn the device off."""
         self._attr_is_on = False
         self.schedule_update_ha_state()
+
+    @callback
+    def async_set_is_on(self, is_on: bool) -> None:
+        """Set the state of the switch without writing it."""
+        self._attr_is_on = is_on
@@ -9,7 +9,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 import homeassistant.config as conf_util
 from homeassistant.const import (
     ATTR_ELEVATION,
@@ -43,6 +43,7 @@ from .const import (
     SERVICE_HOMEASSISTANT_STOP,
 )
 from .exposed_entities import ExposedEntities
+from .triggers.state import async_get_state_trigger_stats
 
 ATTR_ENTRY_ID = "entry_id"
 ATTR_SAFE_MODE = "safe_mode"
@@ -373,10 +374,25 @@ async def async_setup(hass: ha.HomeAssistant, config: ConfigType) -> bool:  # no
     await exposed_entities.async_initialize()
     hass.data[DATA_EXPOSED_ENTITIES] = exposed_entities
     async_set_stop_handler(hass, _async_stop)
+    websocket_api.async_register_command(hass, websocket_state_trigger_stats)
 
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "homeassistant/state_trigger_stats"}
+)
+@ha.callback
+def websocket_state_trigger_stats(
+    hass: ha.HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return how often each state trigger was evaluated and matched."""
+    connection.send_result(msg["id"], async_get_state_trigger_stats(hass))
+
+
 async def _async_stop(hass: ha.HomeAssistant, restart: bool) -> None:
     """Stop home assistant."""
     exit_code = RESTART_EXIT_CODE if restart else 0
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import ItemsView
+from collections.abc import Callable, Hashable, ItemsView
+from functools import partial
+import itertools
+import logging
 from typing import Any
 
 import voluptuous as vol
@@ -13,9 +16,23 @@ from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
+_LOGGER = logging.getLogger(__name__)
+
+DATA_EVENT_TRIGGER_INDEX = "event_trigger_index"
+
 CONF_EVENT_TYPE = "event_type"
 CONF_EVENT_CONTEXT = "context"
 
+# Event data keys which usually identify the device or entity that fired an
+# event, preferred when indexing triggers
+_SELECTIVE_EVENT_DATA_KEYS = (
+    "device_id",
+    "device_ieee",
+    "unique_id",
+    "entity_id",
+    "id",
+)
+
 TRIGGER_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "event",
@@ -33,6 +50,184 @@ def _schema_value(value: Any) -> Any:
     return value
 
 
+class _IndexedEventTrigger:
+    """An event trigger listening to events of a type."""
+
+    __slots__ = ("order", "event_filter", "listener", "index_key")
+
+    def __init__(
+        self,
+        order: int,
+        event_filter: Callable[[Event], bool],
+        listener: Callable[[Event], None],
+        index_key: tuple[str, Hashable] | None,
+    ) -> None:
+        """Initialize the trigger."""
+        self.order = order
+        self.event_filter = event_filter
+        self.listener = listener
+        self.index_key = index_key
+
+
+class _EventTypeTriggers:
+    """Event triggers of an event type, indexed by an event data value."""
+
+    __slots__ = ("by_value", "keys", "unindexed", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the event type triggers."""
+        # Triggers which only match events with a value, by key and value
+        self.by_value: dict[tuple[str, Hashable], list[_IndexedEventTrigger]] = {}
+        # The keys of the triggers in by_value, with their number of values
+        self.keys: dict[str, int] = {}
+        # Triggers which have to be checked for every event
+        self.unindexed: list[_IndexedEventTrigger] = []
+        self.unsub: CALLBACK_TYPE | None = None
+
+
+class EventTriggerIndex:
+    """Dispatch events to the event triggers of each event type.
+
+    Triggers which compare the event data with fixed values are indexed by
+    one of those values, so an event is only compared with the triggers
+    indexed by its own values and the triggers which are not indexed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._event_types: dict[str, _EventTypeTriggers] = {}
+        self._order = itertools.count()
+
+    @callback
+    def async_add(
+        self,
+        event_type: str,
+        event_data: dict[str, Any] | None,
+        event_filter: Callable[[Event], bool],
+        listener: Callable[[Event], None],
+    ) -> CALLBACK_TYPE:
+        """Add a trigger for events of a type.
+
+        The filter is called for each event which has the event data the
+        trigger is indexed by, event_data is None if the trigger can not be
+        indexed.
+        """
+        triggers = self._event_types.get(event_type)
+        if triggers is None:
+            triggers = self._event_types[event_type] = _EventTypeTriggers()
+            triggers.unsub = self._hass.bus.async_listen(
+                event_type,
+                partial(self._async_dispatch, triggers),
+                run_immediately=True,
+            )
+
+        index_key = None
+        if event_data and (key := _index_key(triggers, event_data)) is not None:
+            index_key = (key, event_data[key])
+        trigger = _IndexedEventTrigger(
+            next(self._order), event_filter, listener, index_key
+        )
+        if index_key is None:
+            triggers.unindexed.append(trigger)
+        else:
+            if (indexed := triggers.by_value.get(index_key)) is None:
+                indexed = triggers.by_value[index_key] = []
+                triggers.keys[index_key[0]] = triggers.keys.get(index_key[0], 0) + 1
+            indexed.append(trigger)
+        return partial(self._async_remove, event_type, triggers, trigger)
+
+    @callback
+    def _async_remove(
+        self,
+        event_type: str,
+        triggers: _EventTypeTriggers,
+        trigger: _IndexedEventTrigger,
+    ) -> None:
+        """Remove a trigger."""
+        if (index_key := trigger.index_key) is None:
+            triggers.unindexed.remove(trigger)
+        else:
+            indexed = triggers.by_value[index_key]
+            indexed.remove(trigger)
+            if not indexed:
+                del triggers.by_value[index_key]
+                key = index_key[0]
+                if not (count := triggers.keys[key] - 1):
+                    del triggers.keys[key]
+                else:
+                    triggers.keys[key] = count
+        if not triggers.by_value and not triggers.unindexed:
+            del self._event_types[event_type]
+            if triggers.unsub:
+                triggers.unsub()
+
+    @callback
+    def _async_dispatch(self, triggers: _EventTypeTriggers, event: Event) -> None:
+        """Dispatch an event to the triggers which match it."""
+        candidates: list[_IndexedEventTrigger] = []
+        sources = 0
+        if triggers.keys:
+            data = event.data
+            by_value = triggers.by_value
+            for key in triggers.keys:
+                if key not in data:
+                    continue
+                try:
+                    indexed = by_value.get((key, data[key]))
+                except TypeError:
+                    # Unhashable values are not equal to any indexed value
+                    continue
+                if indexed:
+                    candidates.extend(indexed)
+                    sources += 1
+        if triggers.unindexed:
+            candidates.extend(triggers.unindexed)
+            sources += 1
+        if sources > 1:
+            # Call the triggers in the order they were added
+            candidates.sort(key=lambda trigger: trigger.order)
+        for trigger in candidates:
+            try:
+                if trigger.event_filter(event):
+                    trigger.listener(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running event trigger for %s", event)
+
+
+def _index_key(triggers: _EventTypeTriggers, event_data: dict[str, Any]) -> str | None:
+    """Return the event data key to index a trigger by.
+
+    Keys which already index other triggers of the event type are preferred,
+    so fewer keys are looked up for each event, followed by keys which
+    usually identify the device or entity that fired the event.
+    """
+    keys: list[str] = []
+    for key, value in event_data.items():
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        keys.append(key)
+    if not keys:
+        return None
+    if indexed_keys := [key for key in keys if key in triggers.keys]:
+        return max(indexed_keys, key=triggers.keys.__getitem__)
+    for key in _SELECTIVE_EVENT_DATA_KEYS:
+        if key in keys:
+            return key
+    return keys[0]
+
+
+@callback
+def async_get_event_trigger_index(hass: HomeAssistant) -> EventTriggerIndex:
+    """Return the index of the event triggers."""
+    index: EventTriggerIndex | None = hass.data.get(DATA_EVENT_TRIGGER_INDEX)
+    if index is None:
+        index = hass.data[DATA_EVENT_TRIGGER_INDEX] = EventTriggerIndex(hass)
+    return index
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -146,10 +341,10 @@ async def async_attach_trigger(
             event.context,
         )
 
+    index = async_get_event_trigger_index(hass)
+    indexed_event_data = dict(event_data_items) if event_data_items else None
     removes = [
-        hass.bus.async_listen(
-            event_type, handle_event, event_filter=filter_event, run_immediately=True
-        )
+        index.async_add(event_type, indexed_event_data, filter_event, handle_event)
         for event_type in event_types
     ]
 
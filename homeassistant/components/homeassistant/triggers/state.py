@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from datetime import timedelta
+from functools import partial
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -34,6 +36,8 @@ from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+
 CONF_ENTITY_ID = "entity_id"
 CONF_FROM = "from"
 CONF_TO = "to"
@@ -91,6 +95,301 @@ async def async_validate_trigger_config(
     return config
 
 
+_StateTriggerListener = Callable[[Event[EventStateChangedData], Any, Any], None]
+# The attribute, what the from and to options match and if all changes match
+_MatcherGroupKey = tuple[str | None, tuple[bool, Hashable], tuple[bool, Hashable], bool]
+
+
+class _MatcherGroup:
+    """State triggers of an entity which match the same state changes."""
+
+    __slots__ = (
+        "attribute",
+        "match_from_state",
+        "match_to_state",
+        "match_all",
+        "triggers",
+        "evaluations",
+    )
+
+    def __init__(
+        self,
+        attribute: str | None,
+        match_from_state: Callable[[Any], bool],
+        match_to_state: Callable[[Any], bool],
+        match_all: bool,
+    ) -> None:
+        """Initialize the group."""
+        self.attribute = attribute
+        self.match_from_state = match_from_state
+        self.match_to_state = match_to_state
+        self.match_all = match_all
+        self.triggers: list[_IndexedStateTrigger] = []
+        self.evaluations = 0
+
+
+class _IndexedStateTrigger:
+    """A state trigger listening to the state changes of an entity."""
+
+    __slots__ = ("name", "entity_id", "group", "listener", "evaluated", "matches")
+
+    def __init__(
+        self,
+        name: str,
+        entity_id: str,
+        group: _MatcherGroup,
+        listener: _StateTriggerListener,
+    ) -> None:
+        """Initialize the trigger."""
+        self.name = name
+        self.entity_id = entity_id
+        self.group = group
+        self.listener = listener
+        # The evaluations of the group before the trigger joined it
+        self.evaluated = group.evaluations
+        self.matches = 0
+
+
+class _EntityStateTriggers:
+    """State triggers of an entity, grouped by what they match."""
+
+    __slots__ = ("groups", "by_to_state", "unindexed", "attributes", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the entity triggers."""
+        self.groups: dict[_MatcherGroupKey, _MatcherGroup] = {}
+        # Groups which only match specific new values, by attribute and value
+        self.by_to_state: dict[tuple[str | None, Any], list[_MatcherGroup]] = {}
+        # Groups which have to be checked for every state change
+        self.unindexed: list[_MatcherGroup] = []
+        # The attributes of the groups in by_to_state, with their number
+        self.attributes: dict[str | None, int] = {}
+        self.unsub: CALLBACK_TYPE | None = None
+
+
+def _match_key(value: Any, invert: bool) -> tuple[bool, Hashable]:
+    """Return a key of what a from or to option matches.
+
+    The key follows the matcher created by process_state_match.
+    """
+    if value is None or value == MATCH_ALL:
+        return (invert, None)
+    if isinstance(value, str) or not hasattr(value, "__iter__"):
+        value = (value,)
+    try:
+        return (invert, frozenset(value))
+    except TypeError:
+        # Triggers matching unhashable values are not grouped
+        return (invert, object())
+
+
+class StateTriggerIndex:
+    """Dispatch state changes to the state triggers of each entity.
+
+    Triggers of an entity which match the same state changes share a group,
+    so each state change is compared once per group instead of once per
+    trigger. Groups which only match specific new values are looked up by
+    the new value, and are not compared at all for other state changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._entities: dict[str, _EntityStateTriggers] = {}
+
+    @callback
+    def async_add(
+        self,
+        name: str,
+        entity_id: str,
+        config: ConfigType,
+        listener: _StateTriggerListener,
+    ) -> CALLBACK_TYPE:
+        """Add a trigger for the state changes of an entity."""
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            entity = self._entities[entity_id] = _EntityStateTriggers()
+            entity.unsub = async_track_state_change_event(
+                self._hass, entity_id, self._async_dispatch
+            )
+
+        attribute = config.get(CONF_ATTRIBUTE)
+        if (from_state := config.get(CONF_FROM)) is not None:
+            from_key = _match_key(from_state, False)
+        elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
+            from_key = _match_key(not_from_state, True)
+        else:
+            from_key = _match_key(MATCH_ALL, False)
+        if (to_state := config.get(CONF_TO)) is not None:
+            to_key = _match_key(to_state, False)
+        elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
+            to_key = _match_key(not_to_state, True)
+        else:
+            to_key = _match_key(MATCH_ALL, False)
+        # If neither CONF_FROM or CONF_TO are specified,
+        # fire on all changes to the state or an attribute
+        match_all = all(
+            item not in config
+            for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+        )
+        key: _MatcherGroupKey = (attribute, from_key, to_key, match_all)
+
+        group = entity.groups.get(key)
+        if group is None:
+            group = entity.groups[key] = _MatcherGroup(
+                attribute,
+                _process_match(config, CONF_FROM, CONF_NOT_FROM),
+                _process_match(config, CONF_TO, CONF_NOT_TO),
+                match_all,
+            )
+            invert, to_values = to_key
+            if invert or not isinstance(to_values, frozenset):
+                entity.unindexed.append(group)
+            else:
+                for value in to_values:
+                    entity.by_to_state.setdefault((attribute, value), []).append(group)
+                entity.attributes[attribute] = entity.attributes.get(attribute, 0) + 1
+
+        trigger = _IndexedStateTrigger(name, entity_id, group, listener)
+        group.triggers.append(trigger)
+        return partial(self._async_remove, entity, key, trigger)
+
+    @callback
+    def _async_remove(
+        self,
+        entity: _EntityStateTriggers,
+        key: _MatcherGroupKey,
+        trigger: _IndexedStateTrigger,
+    ) -> None:
+        """Remove a trigger."""
+        group = trigger.group
+        attribute, _, (_, to_values), _ = key
+        group.triggers.remove(trigger)
+        if group.triggers:
+            return
+        del entity.groups[key]
+        if group in entity.unindexed:
+            entity.unindexed.remove(group)
+        else:
+            assert isinstance(to_values, frozenset)
+            for value in to_values:
+                groups = entity.by_to_state[(attribute, value)]
+                groups.remove(group)
+                if not groups:
+                    del entity.by_to_state[(attribute, value)]
+            if not (count := entity.attributes[attribute] - 1):
+                del entity.attributes[attribute]
+            else:
+                entity.attributes[attribute] = count
+        if not entity.groups:
+            del self._entities[trigger.entity_id]
+            if entity.unsub:
+                entity.unsub()
+
+    @callback
+    def _async_dispatch(self, event: Event[EventStateChangedData]) -> None:
+        """Dispatch a state change to the triggers which match it."""
+        if (entity := self._entities.get(event.data["entity_id"])) is None:
+            return
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
+        values: dict[str | None, tuple[Any, Any]] = {}
+
+        def _values(attribute: str | None) -> tuple[Any, Any]:
+            """Return the old and new value of the state or an attribute."""
+            if (old_new := values.get(attribute)) is None:
+                if attribute is None:
+                    old_new = (
+                        None if from_s is None else from_s.state,
+                        None if to_s is None else to_s.state,
+                    )
+                else:
+                    old_new = (
+                        None if from_s is None else from_s.attributes.get(attribute),
+                        None if to_s is None else to_s.attributes.get(attribute),
+                    )
+                values[attribute] = old_new
+            return old_new
+
+        groups = list(entity.unindexed)
+        for attribute in entity.attributes:
+            try:
+                indexed = entity.by_to_state.get((attribute, _values(attribute)[1]))
+            except TypeError:
+                # Unhashable values never equal the values of the index
+                continue
+            if indexed:
+                groups.extend(indexed)
+
+        for group in groups:
+            group.evaluations += 1
+            old_value, new_value = _values(group.attribute)
+            # When we listen for state changes with `match_all`, we
+            # will trigger even if just an attribute changes. When
+            # we listen to just an attribute, we should ignore all
+            # other attribute changes.
+            if group.attribute is not None and old_value == new_value:
+                continue
+            if (
+                not group.match_from_state(old_value)
+                or not group.match_to_state(new_value)
+                or (not group.match_all and old_value == new_value)
+            ):
+                continue
+            for trigger in group.triggers.copy():
+                trigger.matches += 1
+                try:
+                    trigger.listener(event, old_value, new_value)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error while dispatching event for %s to %s",
+                        trigger.entity_id,
+                        trigger.name,
+                    )
+
+    @callback
+    def async_get_stats(self) -> list[dict[str, Any]]:
+        """Return how often each trigger was evaluated and matched."""
+        return [
+            {
+                "name": trigger.name,
+                "entity_id": trigger.entity_id,
+                "evaluations": group.evaluations - trigger.evaluated,
+                "matches": trigger.matches,
+            }
+            for entity in self._entities.values()
+            for group in entity.groups.values()
+            for trigger in group.triggers
+        ]
+
+
+def _process_match(
+    config: ConfigType, conf_match: str, conf_not_match: str
+) -> Callable[[Any], bool]:
+    """Return the matcher of a from or to option."""
+    if (value := config.get(conf_match)) is not None:
+        return process_state_match(value)
+    if (not_value := config.get(conf_not_match)) is not None:
+        return process_state_match(not_value, invert=True)
+    return process_state_match(MATCH_ALL)
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the index of the state triggers."""
+    index: StateTriggerIndex | None = hass.data.get(DATA_STATE_TRIGGER_INDEX)
+    if index is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
+@callback
+def async_get_state_trigger_stats(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return how often each state trigger was evaluated and matched."""
+    index: StateTriggerIndex | None = hass.data.get(DATA_STATE_TRIGGER_INDEX)
+    return [] if index is None else index.async_get_stats()
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -102,27 +401,8 @@ async def async_attach_trigger(
     """Listen for state changes based on configuration."""
     entity_ids = config[CONF_ENTITY_ID]
 
-    if (from_state := config.get(CONF_FROM)) is not None:
-        match_from_state = process_state_match(from_state)
-    elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
-        match_from_state = process_state_match(not_from_state, invert=True)
-    else:
-        match_from_state = process_state_match(MATCH_ALL)
-
-    if (to_state := config.get(CONF_TO)) is not None:
-        match_to_state = process_state_match(to_state)
-    elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
-        match_to_state = process_state_match(not_to_state, invert=True)
-    else:
-        match_to_state = process_state_match(MATCH_ALL)
-
     time_delta = config.get(CONF_FOR)
     template.attach(hass, time_delta)
-    # If neither CONF_FROM or CONF_TO are specified,
-    # fire on all changes to the state or an attribute
-    match_all = all(
-        item not in config for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
-    )
     unsub_track_same: dict[str, Callable[[], None]] = {}
     period: dict[str, timedelta] = {}
     attribute = config.get(CONF_ATTRIBUTE)
@@ -132,40 +412,14 @@ async def async_attach_trigger(
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def state_automation_listener(
+        event: Event[EventStateChangedData], old_value: Any, new_value: Any
+    ) -> None:
+        """Listen for matching state changes and calls action."""
         entity = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action() -> None:
             """Call action with right context."""
@@ -221,9 +475,9 @@ async def async_attach_trigger(
                 cur_value = new_st.attributes.get(attribute)
 
             if CONF_FROM in config and CONF_TO not in config:
-                return cur_value != old_value
+                return bool(cur_value != old_value)
 
-            return cur_value == new_value
+            return bool(cur_value == new_value)
 
         unsub_track_same[entity] = async_track_same_state(
             hass,
@@ -233,12 +487,21 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    index = async_get_state_trigger_index(hass)
+    unsubs = [
+        index.async_add(
+            trigger_info["name"], entity_id.lower(), config, state_automation_listener
+        )
+        for entity_id in entity_ids
+    ]
 
     @callback
     def async_remove() -> None:
         """Remove state listeners async."""
-        unsub()
+        for unsub in unsubs:
+            unsub()
         for async_remove in unsub_track_same.values():
             async_remove()
         unsub_track_same.clear()
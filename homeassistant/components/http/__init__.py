@@ -56,6 +56,7 @@ from .decorators import require_admin  # noqa: F401
 from .forwarded import async_setup_forwarded
 from .headers import setup_headers
 from .request_context import setup_request_context
+from .request_timing import setup_request_timing
 from .security_filter import setup_security_filter
 from .static import CACHE_HEADERS, CachingStaticResource
 from .web_runner import HomeAssistantTCPSite
@@ -74,7 +75,9 @@ CONF_USE_X_FRAME_OPTIONS: Final = "use_x_frame_options"
 CONF_TRUSTED_PROXIES: Final = "trusted_proxies"
 CONF_LOGIN_ATTEMPTS_THRESHOLD: Final = "login_attempts_threshold"
 CONF_IP_BAN_ENABLED: Final = "ip_ban_enabled"
+CONF_IP_BAN_DURATION: Final = "ip_ban_duration"
 CONF_SSL_PROFILE: Final = "ssl_profile"
+CONF_REQUEST_TIMING: Final = "request_timing"
 
 SSL_MODERN: Final = "modern"
 SSL_INTERMEDIATE: Final = "intermediate"
@@ -117,10 +120,12 @@ HTTP_SCHEMA: Final = vol.All(
                 CONF_LOGIN_ATTEMPTS_THRESHOLD, default=NO_LOGIN_ATTEMPT_THRESHOLD
             ): vol.Any(cv.positive_int, NO_LOGIN_ATTEMPT_THRESHOLD),
             vol.Optional(CONF_IP_BAN_ENABLED, default=True): cv.boolean,
+            vol.Optional(CONF_IP_BAN_DURATION): cv.positive_time_period,
             vol.Optional(CONF_SSL_PROFILE, default=SSL_MODERN): vol.In(
                 [SSL_INTERMEDIATE, SSL_MODERN]
             ),
             vol.Optional(CONF_USE_X_FRAME_OPTIONS, default=True): cv.boolean,
+            vol.Optional(CONF_REQUEST_TIMING, default=False): cv.boolean,
         }
     ),
 )
@@ -143,7 +148,9 @@ class ConfData(TypedDict, total=False):
     trusted_proxies: list[IPv4Network | IPv6Network]
     login_attempts_threshold: int
     ip_ban_enabled: bool
+    ip_ban_duration: datetime.timedelta
     ssl_profile: str
+    request_timing: bool
 
 
 @bind_hass
@@ -189,8 +196,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     use_x_frame_options = conf[CONF_USE_X_FRAME_OPTIONS]
     trusted_proxies = conf.get(CONF_TRUSTED_PROXIES) or []
     is_ban_enabled = conf[CONF_IP_BAN_ENABLED]
+    ban_duration = conf.get(CONF_IP_BAN_DURATION)
     login_threshold = conf[CONF_LOGIN_ATTEMPTS_THRESHOLD]
     ssl_profile = conf[CONF_SSL_PROFILE]
+    request_timing = conf[CONF_REQUEST_TIMING]
 
     source_ip_task = create_eager_task(async_get_source_ip(hass))
 
@@ -209,7 +218,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         use_x_forwarded_for=use_x_forwarded_for,
         login_threshold=login_threshold,
         is_ban_enabled=is_ban_enabled,
+        ban_duration=ban_duration,
         use_x_frame_options=use_x_frame_options,
+        request_timing=request_timing,
     )
 
     async def stop_server(event: Event) -> None:
@@ -228,6 +239,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     hass.http = server
 
+    # Circular import with websocket_api
+    # pylint: disable-next=import-outside-toplevel
+    from . import websocket_api
+
+    websocket_api.async_setup(hass)
+
     local_ip = await source_ip_task
 
     host = local_ip
@@ -323,6 +340,8 @@ class HomeAssistantHTTP:
         login_threshold: int,
         is_ban_enabled: bool,
         use_x_frame_options: bool,
+        request_timing: bool = False,
+        ban_duration: datetime.timedelta | None = None,
     ) -> None:
         """Initialize the server."""
         self.app[KEY_HASS] = self.hass
@@ -336,8 +355,11 @@ class HomeAssistantHTTP:
 
         setup_request_context(self.app, current_request)
 
+        if request_timing:
+            setup_request_timing(self.hass, self.app)
+
         if is_ban_enabled:
-            setup_bans(self.hass, self.app, login_threshold)
+            setup_bans(self.hass, self.app, login_threshold, ban_duration)
 
         await async_setup_auth(self.hass, self.app)
 
@@ -568,4 +590,7 @@ async def start_http_server_and_save_config(
             for ip in conf[CONF_TRUSTED_PROXIES]
         ]
 
+    if CONF_IP_BAN_DURATION in conf:
+        conf[CONF_IP_BAN_DURATION] = conf[CONF_IP_BAN_DURATION].total_seconds()
+
     store.async_delay_save(lambda: conf, SAVE_DELAY)
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 from http import HTTPStatus
-from ipaddress import IPv4Address, IPv6Address, ip_address
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 import logging
 from socket import gethostbyaddr, herror
 from typing import Any, Concatenate, Final, ParamSpec, TypeVar
@@ -24,10 +32,12 @@ from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
 import voluptuous as vol
 
 from homeassistant.config import load_yaml_config_file
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.util import dt as dt_util, yaml
+from homeassistant.util.file import write_utf8_file_atomic
 
 from .const import KEY_HASS
 from .view import HomeAssistantView
@@ -42,24 +52,41 @@ KEY_FAILED_LOGIN_ATTEMPTS = AppKey[defaultdict[IPv4Address | IPv6Address, int]](
     "ha_failed_login_attempts"
 )
 KEY_LOGIN_THRESHOLD = AppKey[int]("ban_manager.ip_bans_lookup")
+KEY_BAN_DURATION = AppKey[timedelta | None]("ban_manager.ban_duration")
 
 NOTIFICATION_ID_BAN: Final = "ip-ban"
 NOTIFICATION_ID_LOGIN: Final = "http-login"
 
 IP_BANS_FILE: Final = "ip_bans.yaml"
 ATTR_BANNED_AT: Final = "banned_at"
+ATTR_EXPIRES_AT: Final = "expires_at"
+
+# Expired bans are dropped and the ban file is rewritten without them
+COMPACT_INTERVAL: Final = timedelta(hours=24)
 
 SCHEMA_IP_BAN_ENTRY: Final = vol.Schema(
-    {vol.Optional("banned_at"): vol.Any(None, cv.datetime)}
+    {
+        vol.Optional(ATTR_BANNED_AT): vol.Any(None, cv.datetime),
+        vol.Optional(ATTR_EXPIRES_AT): vol.Any(None, cv.datetime),
+    }
 )
 
 
 @callback
-def setup_bans(hass: HomeAssistant, app: Application, login_threshold: int) -> None:
-    """Create IP Ban middleware for the app."""
+def setup_bans(
+    hass: HomeAssistant,
+    app: Application,
+    login_threshold: int,
+    ban_duration: timedelta | None = None,
+) -> None:
+    """Create IP Ban middleware for the app.
+
+    Bans are permanent unless a ban duration is given.
+    """
     app.middlewares.append(ban_middleware)
     app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict[IPv4Address | IPv6Address, int](int)
     app[KEY_LOGIN_THRESHOLD] = login_threshold
+    app[KEY_BAN_DURATION] = ban_duration
     app[KEY_BAN_MANAGER] = IpBanManager(hass)
 
     async def ban_startup(app: Application) -> None:
@@ -78,10 +105,10 @@ async def ban_middleware(
         _LOGGER.error("IP Ban middleware loaded but banned IPs not loaded")
         return await handler(request)
 
-    if ip_bans_lookup := ban_manager.ip_bans_lookup:
+    if ban_manager.ip_bans_lookup or ban_manager.ip_network_bans_lookup:
         # Verify if IP is not banned
         ip_address_ = ip_address(request.remote)  # type: ignore[arg-type]
-        if ip_address_ in ip_bans_lookup:
+        if ban_manager.async_is_banned(ip_address_):
             raise HTTPForbidden()
 
     try:
@@ -164,7 +191,7 @@ async def process_wrong_login(request: Request) -> None:
     ):
         ban_manager = request.app[KEY_BAN_MANAGER]
         _LOGGER.warning("Banned IP %s for too many login attempts", remote_addr)
-        await ban_manager.async_add_ban(remote_addr)
+        await ban_manager.async_add_ban(remote_addr, request.app[KEY_BAN_DURATION])
 
         persistent_notification.async_create(
             hass,
@@ -197,26 +224,110 @@ def process_success_login(request: Request) -> None:
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents a banned IP address or network."""
 
     def __init__(
         self,
-        ip_ban: str | IPv4Address | IPv6Address,
+        ip_ban: str | IPv4Address | IPv6Address | IPv4Network | IPv6Network,
         banned_at: datetime | None = None,
+        expires_at: datetime | None = None,
     ) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        self.ip_network = ip_network(ip_ban)
         self.banned_at = banned_at or dt_util.utcnow()
+        self.expires_at = dt_util.as_utc(expires_at) if expires_at else None
+
+    @property
+    def ip_address(self) -> IPv4Address | IPv6Address:
+        """Return the banned address, or the first address of the network."""
+        return self.ip_network.network_address
+
+    @property
+    def is_network(self) -> bool:
+        """Return if the ban covers more than one address."""
+        return self.ip_network.prefixlen != self.ip_network.max_prefixlen
+
+    def expired(self, now: datetime) -> bool:
+        """Return if the ban has expired."""
+        return self.expires_at is not None and self.expires_at <= now
+
+    def as_yaml_entry(self) -> dict[str, dict[str, str]]:
+        """Return the entry as written to the ban file."""
+        key = str(self.ip_network if self.is_network else self.ip_address)
+        data = {ATTR_BANNED_AT: self.banned_at.isoformat()}
+        if self.expires_at is not None:
+            data[ATTR_EXPIRES_AT] = self.expires_at.isoformat()
+        return {key: data}
+
+
+class IpBanPrefixSet:
+    """Banned networks indexed by IP version and prefix length.
+
+    A lookup masks the address once for every prefix length that has
+    bans and does a dict lookup, so it costs at most the address length
+    in lookups no matter how many addresses or ranges are banned.
+    """
+
+    __slots__ = ("_prefixes",)
+
+    def __init__(self) -> None:
+        """Initialize the set."""
+        # version -> prefix length -> (mask, network address -> ban)
+        self._prefixes: dict[int, dict[int, tuple[int, dict[int, IpBan]]]] = {
+            4: {},
+            6: {},
+        }
+
+    @callback
+    def async_add(self, ban: IpBan) -> None:
+        """Add a ban."""
+        network = ban.ip_network
+        prefixes = self._prefixes[network.version]
+        if (prefix := prefixes.get(network.prefixlen)) is None:
+            prefix = prefixes[network.prefixlen] = (int(network.netmask), {})
+        prefix[1][int(network.network_address)] = ban
+
+    @callback
+    def async_remove(self, ban: IpBan) -> None:
+        """Remove a ban."""
+        network = ban.ip_network
+        prefixes = self._prefixes[network.version]
+        if (prefix := prefixes.get(network.prefixlen)) is None:
+            return
+        prefix[1].pop(int(network.network_address), None)
+        if not prefix[1]:
+            del prefixes[network.prefixlen]
+
+    @callback
+    def async_match(self, address: IPv4Address | IPv6Address) -> IpBan | None:
+        """Return the ban matching an address."""
+        packed = int(address)
+        for mask, bans in self._prefixes[address.version].values():
+            if ban := bans.get(packed & mask):
+                return ban
+        return None
 
 
 class IpBanManager:
-    """Manage IP bans."""
+    """Manage IP bans.
+
+    The ban file is used as an append only journal, new bans are
+    appended to it and it is only rewritten to drop expired bans.
+
+    Banned addresses are kept in ip_bans_lookup by address, and banned
+    networks in ip_network_bans_lookup by network.
+    """
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Init the ban manager."""
         self.hass = hass
         self.path = hass.config.path(IP_BANS_FILE)
         self.ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        self.ip_network_bans_lookup: dict[IPv4Network | IPv6Network, IpBan] = {}
+        self._prefix_set = IpBanPrefixSet()
+        self._cancel_compact: CALLBACK_TYPE | None = None
+        # Serializes appending bans to the ban file and rewriting it
+        self._file_lock = asyncio.Lock()
 
     async def async_load(self) -> None:
         """Load the existing IP bans."""
@@ -225,34 +336,120 @@ class IpBanManager:
                 load_yaml_config_file, self.path
             )
         except FileNotFoundError:
-            return
+            list_ = {}
         except HomeAssistantError as err:
             _LOGGER.error("Unable to load %s: %s", self.path, str(err))
             return
 
-        ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        self.ip_bans_lookup = {}
+        self.ip_network_bans_lookup = {}
+        self._prefix_set = IpBanPrefixSet()
+        now = dt_util.utcnow()
+        expired = 0
         for ip_ban, ip_info in list_.items():
             try:
                 ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
-                ban = IpBan(ip_ban, ip_info["banned_at"])
-                ip_bans_lookup[ban.ip_address] = ban
-            except vol.Invalid as err:
+                ban = IpBan(
+                    ip_ban, ip_info.get(ATTR_BANNED_AT), ip_info.get(ATTR_EXPIRES_AT)
+                )
+            except (vol.Invalid, ValueError) as err:
                 _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
                 continue
+            if ban.expired(now):
+                expired += 1
+                continue
+            self._async_add(ban)
+
+        if expired:
+            await self._async_compact()
+        if self._cancel_compact is None:
+            self._cancel_compact = async_track_time_interval(
+                self.hass,
+                self._async_purge_expired,
+                COMPACT_INTERVAL,
+                name="http ip ban compaction",
+                cancel_on_shutdown=True,
+            )
 
-        self.ip_bans_lookup = ip_bans_lookup
+    @callback
+    def async_is_banned(self, address: IPv4Address | IPv6Address) -> bool:
+        """Return if an address is banned."""
+        now: datetime | None = None
+        # A broader ban may still match once an expired ban is removed
+        while (ban := self._prefix_set.async_match(address)) is not None:
+            if now is None:
+                now = dt_util.utcnow()
+            if not ban.expired(now):
+                return True
+            self._async_remove(ban)
+        return False
+
+    def _bans(self) -> list[IpBan]:
+        """Return the banned addresses and networks."""
+        return [*self.ip_bans_lookup.values(), *self.ip_network_bans_lookup.values()]
+
+    def _get_ban(self, network: IPv4Network | IPv6Network) -> IpBan | None:
+        """Return the ban of an address or network."""
+        if network.prefixlen == network.max_prefixlen:
+            return self.ip_bans_lookup.get(network.network_address)
+        return self.ip_network_bans_lookup.get(network)
+
+    @callback
+    def _async_add(self, ban: IpBan) -> None:
+        """Add a ban to memory."""
+        if ban.is_network:
+            self.ip_network_bans_lookup[ban.ip_network] = ban
+        else:
+            self.ip_bans_lookup[ban.ip_address] = ban
+        self._prefix_set.async_add(ban)
+
+    @callback
+    def _async_remove(self, ban: IpBan) -> None:
+        """Remove a ban from memory, it stays in the file until compaction."""
+        self._prefix_set.async_remove(ban)
+        if ban.is_network:
+            self.ip_network_bans_lookup.pop(ban.ip_network, None)
+        else:
+            self.ip_bans_lookup.pop(ban.ip_address, None)
+
+    async def _async_purge_expired(self, now: datetime) -> None:
+        """Drop expired bans and compact the ban file."""
+        if expired := [ban for ban in self._bans() if ban.expired(now)]:
+            for ban in expired:
+                self._async_remove(ban)
+            await self._async_compact()
+
+    async def _async_compact(self) -> None:
+        """Rewrite the ban file with only the active bans."""
+        async with self._file_lock:
+            content = "".join(yaml.dump(ban.as_yaml_entry()) for ban in self._bans())
+            try:
+                await self.hass.async_add_executor_job(
+                    write_utf8_file_atomic, self.path, content
+                )
+            except HomeAssistantError as err:
+                _LOGGER.error("Unable to compact %s: %s", self.path, err)
 
     def _add_ban(self, ip_ban: IpBan) -> None:
         """Update config file with new banned IP address."""
         with open(self.path, "a", encoding="utf8") as out:
-            ip_ = {
-                str(ip_ban.ip_address): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}
-            }
             # Write in a single write call to avoid interleaved writes
-            out.write("\n" + yaml.dump(ip_))
+            out.write("\n" + yaml.dump(ip_ban.as_yaml_entry()))
+
+    async def async_add_ban(
+        self,
+        remote_addr: IPv4Address | IPv6Address | IPv4Network | IPv6Network,
+        ban_time: timedelta | None = None,
+    ) -> None:
+        """Add a new IP address or network to the banned list.
 
-    async def async_add_ban(self, remote_addr: IPv4Address | IPv6Address) -> None:
-        """Add a new IP address to the banned list."""
-        if remote_addr not in self.ip_bans_lookup:
-            new_ban = self.ip_bans_lookup[remote_addr] = IpBan(remote_addr)
+        Bans are permanent unless a ban time is passed.
+        """
+        network = ip_network(remote_addr)
+        if self._get_ban(network) is not None:
+            return
+        expires_at = dt_util.utcnow() + ban_time if ban_time is not None else None
+        new_ban = IpBan(network, expires_at=expires_at)
+        self._async_add(new_ban)
+        async with self._file_lock:
             await self.hass.async_add_executor_job(self._add_ban, new_ban)
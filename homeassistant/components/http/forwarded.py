@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from ipaddress import IPv4Network, IPv6Network, ip_address
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network, ip_address
 import logging
+from typing import Final
 
 from aiohttp.hdrs import X_FORWARDED_FOR, X_FORWARDED_HOST, X_FORWARDED_PROTO
 from aiohttp.web import Application, HTTPBadRequest, Request, StreamResponse, middleware
@@ -14,6 +16,9 @@ from homeassistant.core import callback
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of distinct addresses to remember the trust decision for.
+TRUSTED_ADDRESS_CACHE_SIZE: Final = 512
+
 
 @callback
 def async_setup_forwarded(
@@ -67,6 +72,15 @@ def async_setup_forwarded(
         an HTTP 400 status code is thrown.
     """
 
+    @lru_cache(maxsize=TRUSTED_ADDRESS_CACHE_SIZE)
+    def _parse_address(address: str) -> tuple[IPv4Address | IPv6Address, bool]:
+        """Parse an address and return it with whether it is a trusted proxy.
+
+        Raises ValueError for invalid addresses, those are not cached.
+        """
+        parsed = ip_address(address)
+        return parsed, any(parsed in trusted_proxy for trusted_proxy in trusted_proxies)
+
     @middleware
     async def forwarded_middleware(
         request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
@@ -90,7 +104,9 @@ def async_setup_forwarded(
             # Connected IP isn't retrieveable from the request transport, continue
             return await handler(request)
 
-        connected_ip = ip_address(request.transport.get_extra_info("peername")[0])
+        connected_ip, connected_ip_trusted = _parse_address(
+            request.transport.get_extra_info("peername")[0]
+        )
 
         # We have X-Forwarded-For, but config does not agree
         if not use_x_forwarded_for:
@@ -104,7 +120,7 @@ def async_setup_forwarded(
             raise HTTPBadRequest
 
         # Ensure the IP of the connected peer is trusted
-        if not any(connected_ip in trusted_proxy for trusted_proxy in trusted_proxies):
+        if not connected_ip_trusted:
             _LOGGER.error(
                 "Received X-Forwarded-For header from an untrusted proxy %s",
                 connected_ip,
@@ -121,7 +137,9 @@ def async_setup_forwarded(
         # Process X-Forwarded-For from the right side (by reversing the list)
         forwarded_for_split = list(reversed(forwarded_for_headers[0].split(",")))
         try:
-            forwarded_for = [ip_address(addr.strip()) for addr in forwarded_for_split]
+            forwarded_for = [
+                _parse_address(addr.strip()) for addr in forwarded_for_split
+            ]
         except ValueError as err:
             _LOGGER.error(
                 "Invalid IP address in X-Forwarded-For: %s", forwarded_for_headers[0]
@@ -132,8 +150,8 @@ def async_setup_forwarded(
 
         # Find the last trusted index in the X-Forwarded-For list
         forwarded_for_index = 0
-        for forwarded_ip in forwarded_for:
-            if any(forwarded_ip in trusted_proxy for trusted_proxy in trusted_proxies):
+        for forwarded_ip, forwarded_ip_trusted in forwarded_for:
+            if forwarded_ip_trusted:
                 forwarded_for_index += 1
                 continue
             overrides["remote"] = str(forwarded_ip)
@@ -141,7 +159,7 @@ def async_setup_forwarded(
         else:
             # If all the IP addresses are from trusted networks, take the left-most.
             forwarded_for_index = -1
-            overrides["remote"] = str(forwarded_for[-1])
+            overrides["remote"] = str(forwarded_for[-1][0])
 
         # Handle X-Forwarded-Proto
         forwarded_proto_headers: list[str] = request.headers.getall(
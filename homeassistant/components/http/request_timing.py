@@ -0,0 +1,218 @@
+"""Middleware and storage for per view request timings."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from math import inf
+import time
+from typing import Any, Final
+
+from aiohttp.web import Application, Request, StreamResponse, middleware
+from aiohttp.web_exceptions import HTTPException
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+DATA_REQUEST_TIMINGS: Final = "http_request_timings"
+
+# Upper bounds of the latency histogram buckets in seconds,
+# these line up with the default Prometheus buckets.
+LATENCY_BUCKETS: Final = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+    inf,
+)
+
+UNMATCHED_ROUTE: Final = "unmatched"
+
+RequestTimingListener = Callable[[str, float, int, int, int], None]
+
+
+class RequestTimingStats:
+    """Latency histogram and counters for a single view or command."""
+
+    __slots__ = (
+        "count",
+        "total_time",
+        "bucket_counts",
+        "bytes_in",
+        "bytes_out",
+        "status_counts",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.total_time = 0.0
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.status_counts: dict[int, int] = {}
+
+    @callback
+    def async_record(
+        self, duration: float, bytes_in: int, bytes_out: int, status: int
+    ) -> None:
+        """Record a single request."""
+        self.count += 1
+        self.total_time += duration
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def percentile(self, quantile: float) -> float:
+        """Estimate a latency percentile from the histogram.
+
+        The estimate is interpolated linearly inside the matching bucket,
+        requests slower than the last finite bucket report its bound.
+        """
+        if not self.count:
+            return 0.0
+        rank = quantile * self.count
+        cumulative = 0
+        lower = 0.0
+        for upper, bucket_count in zip(LATENCY_BUCKETS, self.bucket_counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                if upper == inf:
+                    return lower
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+            if upper != inf:
+                lower = upper
+        return lower
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the stats."""
+        return {
+            "count": self.count,
+            "total_time": self.total_time,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "status": {
+                str(status): count for status, count in self.status_counts.items()
+            },
+            "buckets": self.bucket_counts.copy(),
+        }
+
+
+class RequestTimings:
+    """Collect request timings keyed by view name or websocket command."""
+
+    __slots__ = ("stats", "_listeners")
+
+    def __init__(self) -> None:
+        """Initialize the timings."""
+        self.stats: dict[str, RequestTimingStats] = {}
+        self._listeners: list[RequestTimingListener] = []
+
+    @callback
+    def async_record(
+        self,
+        name: str,
+        duration: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        status: int = 200,
+    ) -> None:
+        """Record a request and forward it to the listeners."""
+        if (stats := self.stats.get(name)) is None:
+            stats = self.stats[name] = RequestTimingStats()
+        stats.async_record(duration, bytes_in, bytes_out, status)
+        for listener in self._listeners:
+            listener(name, duration, bytes_in, bytes_out, status)
+
+    @callback
+    def async_add_listener(self, listener: RequestTimingListener) -> CALLBACK_TYPE:
+        """Add a listener called for every recorded request.
+
+        This is the hook for exporters like Prometheus.
+        """
+        self._listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return _remove_listener
+
+    @callback
+    def async_reset(self) -> None:
+        """Reset all the collected stats."""
+        self.stats.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the timings."""
+        return {
+            "buckets": [bound for bound in LATENCY_BUCKETS if bound != inf],
+            "timings": {name: stats.as_dict() for name, stats in self.stats.items()},
+        }
+
+
+@callback
+def async_get_request_timings(hass: HomeAssistant) -> RequestTimings | None:
+    """Return the request timings if timing is enabled."""
+    timings: RequestTimings | None = hass.data.get(DATA_REQUEST_TIMINGS)
+    return timings
+
+
+def _request_name(request: Request) -> str:
+    """Return the name the request is recorded under."""
+    match_info = request.match_info
+    if name := getattr(match_info.handler, "view_name", None):
+        return name  # type: ignore[no-any-return]
+    if (resource := match_info.route.resource) is None:
+        return UNMATCHED_ROUTE
+    return resource.canonical
+
+
+@callback
+def setup_request_timing(hass: HomeAssistant, app: Application) -> None:
+    """Create request timing middleware for the app."""
+    timings = hass.data[DATA_REQUEST_TIMINGS] = RequestTimings()
+    monotonic = time.monotonic
+
+    @middleware
+    async def request_timing_middleware(
+        request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
+    ) -> StreamResponse:
+        """Record the latency of the request."""
+        start = monotonic()
+        status = 500
+        bytes_out = 0
+        try:
+            response = await handler(request)
+        except HTTPException as err:
+            status = err.status
+            raise
+        else:
+            status = response.status
+            # Plain responses are written after the middlewares ran,
+            # streamed responses have already been written
+            bytes_out = response.content_length or response.body_length
+        finally:
+            timings.async_record(
+                _request_name(request),
+                monotonic() - start,
+                request.content_length or 0,
+                bytes_out,
+                status,
+            )
+        return response
+
+    app.middlewares.append(request_timing_middleware)
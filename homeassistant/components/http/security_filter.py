@@ -10,6 +10,7 @@ from typing import Final
 from urllib.parse import unquote
 
 from aiohttp.web import Application, HTTPBadRequest, Request, StreamResponse, middleware
+from lru import LRU
 
 from homeassistant.core import callback
 
@@ -39,6 +40,11 @@ FILTERS: Final = re.compile(
 
 # Unsafe bytes to be removed per WHATWG spec
 UNSAFE_URL_BYTES = ["\t", "\r", "\n"]
+UNSAFE_URL_BYTES_RE: Final = re.compile("[" + "".join(UNSAFE_URL_BYTES) + "]")
+
+# Number of distinct path and query string combinations that have
+# passed the filters and are not checked again.
+VALIDATED_CACHE_SIZE: Final = 1024
 
 
 @callback
@@ -52,26 +58,22 @@ def setup_security_filter(app: Application) -> None:
             unquoted = _recursive_unquote(unquoted)
         return unquoted
 
-    @middleware
-    async def security_filter_middleware(
-        request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
-    ) -> StreamResponse:
-        """Process request and block commonly known exploit attempts."""
-        path_with_query_string = f"{request.path}?{request.query_string}"
+    validated: LRU[str, bool] = LRU(VALIDATED_CACHE_SIZE)
 
-        for unsafe_byte in UNSAFE_URL_BYTES:
-            if unsafe_byte in path_with_query_string:
-                if unsafe_byte in request.query_string:
-                    _LOGGER.warning(
-                        "Filtered a request with unsafe byte query string: %s",
-                        request.raw_path,
-                    )
-                    raise HTTPBadRequest
+    def _check_request(request: Request, path_with_query_string: str) -> None:
+        """Raise if the request is unsafe."""
+        if UNSAFE_URL_BYTES_RE.search(path_with_query_string):
+            if UNSAFE_URL_BYTES_RE.search(request.query_string):
                 _LOGGER.warning(
-                    "Filtered a request with an unsafe byte in path: %s",
+                    "Filtered a request with unsafe byte query string: %s",
                     request.raw_path,
                 )
                 raise HTTPBadRequest
+            _LOGGER.warning(
+                "Filtered a request with an unsafe byte in path: %s",
+                request.raw_path,
+            )
+            raise HTTPBadRequest
 
         if FILTERS.search(_recursive_unquote(path_with_query_string)):
             # Check the full path with query string first, if its
@@ -89,6 +91,19 @@ def setup_security_filter(app: Application) -> None:
             )
             raise HTTPBadRequest
 
+    @middleware
+    async def security_filter_middleware(
+        request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
+    ) -> StreamResponse:
+        """Process request and block commonly known exploit attempts."""
+        path_with_query_string = f"{request.path}?{request.query_string}"
+
+        # Frequently requested urls, like webhooks and static files,
+        # only have to pass the filters once.
+        if path_with_query_string not in validated:
+            _check_request(request, path_with_query_string)
+            validated[path_with_query_string] = True
+
         return await handler(request)
 
     app.middlewares.append(security_filter_middleware)
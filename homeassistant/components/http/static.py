@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+import gzip
+import hashlib
 import mimetypes
 from pathlib import Path
+import re
+import time
 from typing import Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -18,8 +24,122 @@ from .const import KEY_HASS
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {hdrs.CACHE_CONTROL: CACHE_HEADER}
+IMMUTABLE_CACHE_HEADER = f"{CACHE_HEADER}, immutable"
 PATH_CACHE: LRU[tuple[str, Path], tuple[Path | None, str | None]] = LRU(512)
 
+# Content hashed assets are indexed once and served from memory afterwards,
+# as long as the size and modification time of the file and the modification
+# time of its precompressed variant did not change. They are checked at most
+# once per ASSET_REVALIDATE_INTERVAL seconds.
+ASSET_CACHE: LRU[Path, StaticAsset] = LRU(256)
+ASSET_REVALIDATE_INTERVAL: Final = 60
+MAX_CACHED_ASSET_SIZE: Final = 512 * 1024
+# Matches file names like app.3f8a2c91d0e4b5a6.js, shorter runs of hex
+# digits are often dates or versions rather than content hashes
+FINGERPRINT_RE: Final = re.compile(r"[.-][0-9a-f]{16,}\.[^/]+$")
+COMPRESSIBLE_CONTENT_TYPES: Final = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "image/svg+xml",
+}
+
+
+@dataclass(slots=True)
+class StaticAsset:
+    """A content hashed asset that has been indexed."""
+
+    content_type: str
+    etag: str
+    body: bytes | None
+    gzip_body: bytes | None
+    signature: tuple[int, int, int | None]
+    checked_at: float = 0.0
+
+
+def _gzip_path(filepath: Path) -> Path:
+    """Return the path of the precompressed variant of a file."""
+    return filepath.with_name(f"{filepath.name}.gz")
+
+
+def _asset_signature(filepath: Path) -> tuple[int, int, int | None]:
+    """Return the size and modification time of a file and of its gzip variant."""
+    stat = filepath.stat()
+    try:
+        gzip_mtime_ns: int | None = _gzip_path(filepath).stat().st_mtime_ns
+    except FileNotFoundError:
+        gzip_mtime_ns = None
+    return (stat.st_size, stat.st_mtime_ns, gzip_mtime_ns)
+
+
+def _is_compressible(content_type: str) -> bool:
+    """Return if a content type benefits from compression."""
+    return (
+        content_type.startswith("text/") or content_type in COMPRESSIBLE_CONTENT_TYPES
+    )
+
+
+def _index_asset(filepath: Path, content_type: str) -> StaticAsset:
+    """Hash and precompress an asset.
+
+    Assets larger than MAX_CACHED_ASSET_SIZE are only hashed and
+    keep being streamed from disk.
+    """
+    signature = _asset_signature(filepath)
+    body = filepath.read_bytes()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    if len(body) > MAX_CACHED_ASSET_SIZE:
+        return StaticAsset(content_type, etag, None, None, signature)
+
+    gzip_body: bytes | None = None
+    gzip_path = _gzip_path(filepath)
+    if signature[2] is not None:
+        # Prefer the variant that was compressed at build time
+        gzip_body = gzip_path.read_bytes()
+    elif _is_compressible(content_type):
+        gzip_body = gzip.compress(body, mtime=0)
+    if gzip_body is not None and len(gzip_body) >= len(body):
+        gzip_body = None
+
+    return StaticAsset(content_type, etag, body, gzip_body, signature)
+
+
+def _revalidate_asset(
+    filepath: Path, content_type: str, asset: StaticAsset | None
+) -> StaticAsset:
+    """Return the indexed asset, indexing it again if the file changed."""
+    if asset is not None and asset.signature == _asset_signature(filepath):
+        return asset
+    return _index_asset(filepath, content_type)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return if an Accept-Encoding header value accepts gzip.
+
+    A coding with a q-value of 0 is not acceptable, and an explicit
+    gzip coding takes precedence over the wildcard.
+    """
+    gzip_qvalue: float | None = None
+    wildcard_qvalue: float | None = None
+    for coding in accept_encoding.lower().split(","):
+        name, *params = coding.split(";")
+        name = name.strip()
+        if name not in ("gzip", "*"):
+            continue
+        qvalue = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                with suppress(ValueError):
+                    qvalue = float(value)
+        if name == "gzip":
+            gzip_qvalue = qvalue
+        else:
+            wildcard_qvalue = qvalue
+    if gzip_qvalue is None:
+        gzip_qvalue = wildcard_qvalue
+    return gzip_qvalue is not None and gzip_qvalue > 0
+
 
 def _get_file_path(rel_url: str, directory: Path) -> Path | None:
     """Return the path to file on disk or None."""
@@ -70,6 +190,14 @@ class CachingStaticResource(StaticResource):
         else:
             filepath, content_type = filepath_content_type
 
+        if (
+            filepath
+            and content_type
+            and FINGERPRINT_RE.search(filepath.name)
+            and hdrs.RANGE not in request.headers
+        ):
+            return await self._handle_fingerprinted(request, filepath, content_type)
+
         if filepath and content_type:
             return FileResponse(
                 filepath,
@@ -81,3 +209,46 @@ class CachingStaticResource(StaticResource):
             )
 
         return await super()._handle(request)
+
+    async def _handle_fingerprinted(
+        self, request: Request, filepath: Path, content_type: str
+    ) -> StreamResponse:
+        """Return a content hashed asset, from memory when possible."""
+        now = time.monotonic()
+        if (
+            asset := ASSET_CACHE.get(filepath)
+        ) is None or now - asset.checked_at >= ASSET_REVALIDATE_INTERVAL:
+            hass = request.app[KEY_HASS]
+            try:
+                asset = await hass.async_add_executor_job(
+                    _revalidate_asset, filepath, content_type, asset
+                )
+            except OSError as error:
+                ASSET_CACHE.pop(filepath, None)
+                raise HTTPNotFound() from error
+            asset.checked_at = now
+            ASSET_CACHE[filepath] = asset
+
+        headers: dict[str, str] = {
+            hdrs.CACHE_CONTROL: IMMUTABLE_CACHE_HEADER,
+            hdrs.CONTENT_TYPE: asset.content_type,
+            hdrs.ETAG: asset.etag,
+        }
+
+        if asset.body is None:
+            return FileResponse(filepath, chunk_size=self._chunk_size, headers=headers)
+
+        if any(
+            etag.value in (asset.etag[1:-1], "*")
+            for etag in request.if_none_match or ()
+        ):
+            return Response(status=304, headers=headers)
+
+        body = asset.body
+        if asset.gzip_body is not None:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+            if _accepts_gzip(request.headers.get(hdrs.ACCEPT_ENCODING, "")):
+                headers[hdrs.CONTENT_ENCODING] = "gzip"
+                body = asset.gzip_body
+
+        return Response(body=body, headers=headers)
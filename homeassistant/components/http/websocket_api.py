@@ -0,0 +1,40 @@
+"""The HTTP websocket API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .request_timing import async_get_request_timings
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the HTTP websocket API."""
+    websocket_api.async_register_command(hass, ws_request_timings)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "http/request_timings",
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@callback
+def ws_request_timings(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle request timings command."""
+    if (timings := async_get_request_timings(hass)) is None:
+        connection.send_result(msg["id"], {"enabled": False})
+        return
+    connection.send_result(msg["id"], {"enabled": True, **timings.as_dict()})
+    if msg["reset"]:
+        timings.async_reset()
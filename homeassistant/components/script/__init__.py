@@ -12,6 +12,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_stats
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -49,6 +50,7 @@ from homeassistant.helpers.script import (
     ATTR_MAX,
     CONF_MAX,
     CONF_MAX_EXCEEDED,
+    CONF_QUEUE_OVERFLOW,
     Script,
     script_stack_cv,
 )
@@ -251,6 +253,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DOMAIN, SERVICE_TOGGLE, toggle_service, schema=SCRIPT_TURN_ONOFF_SCHEMA
     )
     websocket_api.async_register_command(hass, websocket_config)
+    websocket_api.async_register_command(hass, websocket_queue_stats)
 
     return True
 
@@ -479,6 +482,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             script_mode=cfg[CONF_MODE],
             max_runs=cfg[CONF_MAX],
             max_exceeded=cfg[CONF_MAX_EXCEEDED],
+            queue_overflow=cfg[CONF_QUEUE_OVERFLOW],
             logger=logging.getLogger(f"{__name__}.{key}"),
             variables=cfg.get(CONF_VARIABLES),
         )
@@ -647,6 +651,8 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
         # remove service
         self.hass.services.async_remove(DOMAIN, self.unique_id)
 
+        async_remove_stats(self.hass, f"{DOMAIN}.{self.unique_id}")
+
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
 def websocket_config(
@@ -671,3 +677,23 @@ def websocket_config(
             "config": script.raw_config,
         },
     )
+
+
+@websocket_api.websocket_command({"type": "script/queue_stats", "entity_id": str})
+def websocket_queue_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get script queue stats."""
+    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
+
+    script = component.get_entity(msg["entity_id"])
+
+    if not isinstance(script, ScriptEntity):
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "Entity not found"
+        )
+        return
+
+    connection.send_result(msg["id"], script.script.queue_stats)
@@ -13,7 +13,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import discovery
 from homeassistant.helpers.reload import async_reload_integration_platforms
 from homeassistant.helpers.service import async_register_admin_service
-from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.loader import async_get_integration
 
 from .const import CONF_TRIGGER, DOMAIN, PLATFORMS
@@ -43,10 +43,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if conf is None:
             return
 
-        await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
+        # Only the entities of changed sections are replaced
+        await async_reload_integration_platforms(
+            hass, DOMAIN, PLATFORMS, _platform_discovery_infos(conf)
+        )
 
         if DOMAIN in conf:
-            await _process_config(hass, conf)
+            await _process_config(hass, conf, discover_platforms=False)
 
         hass.bus.async_fire(f"event_{DOMAIN}_reloaded", context=call.context)
 
@@ -76,7 +79,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
 
-async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
+def _platform_discovery_infos(
+    hass_config: ConfigType,
+) -> dict[str, list[DiscoveryInfoType]]:
+    """Return the discovery info of the sections without a trigger by platform."""
+    discovery_infos: dict[str, list[DiscoveryInfoType]] = {
+        platform_domain: [] for platform_domain in PLATFORMS
+    }
+    for conf_section in hass_config.get(DOMAIN, ()):
+        if CONF_TRIGGER in conf_section:
+            continue
+        for platform_domain in PLATFORMS:
+            if platform_domain in conf_section:
+                discovery_infos[platform_domain].append(
+                    {
+                        "unique_id": conf_section.get(CONF_UNIQUE_ID),
+                        "entities": conf_section[platform_domain],
+                    }
+                )
+    return discovery_infos
+
+
+async def _process_config(
+    hass: HomeAssistant, hass_config: ConfigType, discover_platforms: bool = True
+) -> None:
     """Process config."""
     coordinators: list[TriggerUpdateCoordinator] | None = hass.data.pop(DOMAIN, None)
 
@@ -90,25 +116,20 @@ async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
         await coordinator.async_setup(hass_config)
         return coordinator
 
-    coordinator_tasks = []
-
-    for conf_section in hass_config[DOMAIN]:
-        if CONF_TRIGGER in conf_section:
-            coordinator_tasks.append(init_coordinator(hass, conf_section))
-            continue
-
-        for platform_domain in PLATFORMS:
-            if platform_domain in conf_section:
+    coordinator_tasks = [
+        init_coordinator(hass, conf_section)
+        for conf_section in hass_config[DOMAIN]
+        if CONF_TRIGGER in conf_section
+    ]
+
+    if discover_platforms:
+        for platform_domain, discovery_infos in _platform_discovery_infos(
+            hass_config
+        ).items():
+            for discovery_info in discovery_infos:
                 hass.async_create_task(
                     discovery.async_load_platform(
-                        hass,
-                        platform_domain,
-                        DOMAIN,
-                        {
-                            "unique_id": conf_section.get(CONF_UNIQUE_ID),
-                            "entities": conf_section[platform_domain],
-                        },
-                        hass_config,
+                        hass, platform_domain, DOMAIN, discovery_info, hass_config
                     )
                 )
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
 import logging
 from typing import Any
 
@@ -14,18 +15,29 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.trace import trace_variables_cv
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_SETTINGS,
+    DATA_TRACE_STATS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    DEFAULT_TRACE_MODE,
+    TRACE_MODE_FULL,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODE_STATS,
+    TRACE_MODES,
 )
-from .models import ActionTrace, BaseTrace, RestoredTrace
+from .models import ActionTrace, BaseTrace, RestoredTrace, TraceStats
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,10 +47,23 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    # Fall back to the mode and sample rate of the trace integration
+    vol.Optional(CONF_TRACE_MODE): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_RATE): cv.positive_int,
 }
 
-CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+TRACE_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_TRACE_MODE, default=DEFAULT_TRACE_MODE): vol.In(TRACE_MODES),
+        vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): cv.positive_int,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {vol.Optional(DOMAIN): vol.Any(None, TRACE_SETTINGS_SCHEMA)},
+    extra=vol.ALLOW_EXTRA,
+)
 
 TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
@@ -51,6 +76,8 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_SETTINGS] = config.get(DOMAIN) or TRACE_SETTINGS_SCHEMA({})
+    hass.data[DATA_TRACE_STATS] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -148,6 +175,70 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@contextmanager
+def async_trace_run(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> Generator[None, None, None]:
+    """Store a trace, or the statistics of its run, according to the trace mode.
+
+    In all modes but full, the variables are not captured for runs which are
+    not stored up front, and only the trace of a failed run is stored when
+    the run is finished.
+    """
+    settings: ConfigType = hass.data[DATA_TRACE_SETTINGS]
+    mode = trace_config.get(CONF_TRACE_MODE, settings[CONF_TRACE_MODE])
+    stored_traces: int = trace_config[CONF_STORED_TRACES]
+    if mode == TRACE_MODE_FULL:
+        async_store_trace(hass, trace, stored_traces)
+        yield
+        return
+
+    all_stats: dict[str, TraceStats] = hass.data[DATA_TRACE_STATS]
+    if (stats := all_stats.get(trace.key)) is None:
+        stats = all_stats[trace.key] = TraceStats()
+    sample_rate = trace_config.get(CONF_SAMPLE_RATE, settings[CONF_SAMPLE_RATE])
+    sampled = mode == TRACE_MODE_SAMPLED and not stats.started % sample_rate
+    stats.started += 1
+    if sampled:
+        async_store_trace(hass, trace, stored_traces)
+        token = None
+    else:
+        token = trace_variables_cv.set(False)
+    try:
+        yield
+    finally:
+        if token is not None:
+            trace_variables_cv.reset(token)
+            if mode != TRACE_MODE_STATS and trace.failed:
+                async_store_trace(hass, trace, stored_traces)
+        stats.add_run(trace)
+
+
+@callback
+def async_get_stats(
+    hass: HomeAssistant, wanted_domain: str, wanted_key: str | None
+) -> dict[str, dict[str, Any]]:
+    """Return the run statistics of the scripts or automations of a domain."""
+    all_stats: dict[str, TraceStats] = hass.data[DATA_TRACE_STATS]
+    if wanted_key:
+        if (stats := all_stats.get(wanted_key)) is None:
+            return {}
+        return {wanted_key.split(".", 1)[1]: stats.as_dict()}
+    result = {}
+    for key, stats in all_stats.items():
+        domain, item_id = key.split(".", 1)
+        if domain == wanted_domain:
+            result[item_id] = stats.as_dict()
+    return result
+
+
+@callback
+def async_remove_stats(hass: HomeAssistant, key: str) -> None:
+    """Remove the run statistics of a removed script or automation."""
+    all_stats: dict[str, TraceStats] = hass.data[DATA_TRACE_STATS]
+    all_stats.pop(key, None)
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -5,3 +5,16 @@ DATA_TRACE = "trace"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+CONF_TRACE_MODE = "mode"
+CONF_SAMPLE_RATE = "sample_rate"
+DATA_TRACE_SETTINGS = "trace_settings"
+DATA_TRACE_STATS = "trace_stats"
+TRACE_MODE_FULL = "full"  # Store every run with its variables
+TRACE_MODE_SAMPLED = "sampled"  # Store 1 in sample_rate runs, and failed runs
+TRACE_MODE_ERROR = "error"  # Store only failed runs
+TRACE_MODE_STATS = "stats"  # Store only run and step timing statistics
+TRACE_MODES = [TRACE_MODE_FULL, TRACE_MODE_SAMPLED, TRACE_MODE_ERROR, TRACE_MODE_STATS]
+DEFAULT_TRACE_MODE = TRACE_MODE_FULL
+DEFAULT_SAMPLE_RATE = 10
+# Upper bounds in seconds of the buckets of the step timing histograms
+STATS_BUCKETS = (0.001, 0.01, 0.1, 1, 10, 60)
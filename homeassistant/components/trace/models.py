@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import abc
+from bisect import bisect_left
 from collections import deque
 import datetime as dt
 from typing import Any
@@ -18,6 +19,8 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 import homeassistant.util.uuid as uuid_util
 
+from .const import STATS_BUCKETS
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -86,6 +89,11 @@ class ActionTrace(BaseTrace):
         self._state = "stopped"
         self._script_execution = script_execution_get()
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run failed."""
+        return self._error is not None or self._script_execution == "error"
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
         if self._dict:
@@ -169,3 +177,75 @@ class RestoredTrace(BaseTrace):
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
         return self._short_dict  # type: ignore[no-any-return]
+
+
+class TimingHistogram:
+    """Histogram of durations."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # The last bucket counts the durations above all bounds
+        self.buckets = [0] * (len(STATS_BUCKETS) + 1)
+
+    def add(self, duration: float) -> None:
+        """Add a duration."""
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.buckets[bisect_left(STATS_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary version of this histogram."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "buckets": self.buckets,
+        }
+
+
+class TraceStats:
+    """Run and step timing statistics of a script or automation."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.started = 0
+        self.failed = 0
+        self.runs = TimingHistogram()
+        self.steps: dict[str, TimingHistogram] = {}
+
+    def add_run(self, trace: ActionTrace) -> None:
+        """Add the timing of a finished run."""
+        # pylint: disable=protected-access
+        if trace.failed:
+            self.failed += 1
+        if trace._timestamp_finish is not None:
+            self.runs.add(
+                (trace._timestamp_finish - trace._timestamp_start).total_seconds()
+            )
+        if not trace._trace:
+            return
+        for path, elements in trace._trace.items():
+            for element in elements:
+                if (duration := element.duration) is None:
+                    continue
+                if (histogram := self.steps.get(path)) is None:
+                    histogram = self.steps[path] = TimingHistogram()
+                histogram.add(duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary version of these statistics."""
+        return {
+            "started": self.started,
+            "failed": self.failed,
+            "buckets": STATS_BUCKETS,
+            "runs": self.runs.as_dict(),
+            "steps": {
+                path: histogram.as_dict() for path, histogram in self.steps.items()
+            },
+        }
@@ -37,6 +37,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_trace_get)
     websocket_api.async_register_command(hass, websocket_trace_list)
     websocket_api.async_register_command(hass, websocket_trace_contexts)
+    websocket_api.async_register_command(hass, websocket_trace_stats)
     websocket_api.async_register_command(hass, websocket_breakpoint_clear)
     websocket_api.async_register_command(hass, websocket_breakpoint_list)
     websocket_api.async_register_command(hass, websocket_breakpoint_set)
@@ -103,6 +104,26 @@ async def websocket_trace_list(
     connection.send_result(msg["id"], traces)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "trace/stats",
+        vol.Required("domain"): vol.In(TRACE_DOMAINS),
+        vol.Optional("item_id"): str,
+    }
+)
+@callback
+def websocket_trace_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the run statistics of scripts or automations not traced in full."""
+    key = f"{msg['domain']}.{msg['item_id']}" if "item_id" in msg else None
+
+    connection.send_result(msg["id"], trace.async_get_stats(hass, msg["domain"], key))
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
@@ -51,11 +51,17 @@ from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     Integration,
     IntegrationNotFound,
+    async_get_import_report,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    async_get_config_entry_setup_progress,
+    async_get_loaded_integrations,
+    async_get_setup_timeline,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -82,6 +88,9 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_import_info)
+    async_reg(hass, handle_integration_setup_trace)
+    async_reg(hass, handle_integration_config_entry_setup_progress)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -549,6 +558,50 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle the report of the imports done during startup."""
+    connection.send_result(msg["id"], async_get_import_report(hass))
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_trace"})
+def handle_integration_setup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle the timeline of the setups done during startup."""
+    if (timeline := async_get_setup_timeline(hass)) is None:
+        connection.send_result(msg["id"], None)
+        return
+    connection.send_result(
+        msg["id"],
+        {
+            "critical_path": timeline.critical_path(),
+            "trace": timeline.chrome_trace(),
+        },
+    )
+
+
+@callback
+@decorators.websocket_command(
+    {vol.Required("type"): "integration/config_entry_setup_progress"}
+)
+def handle_integration_config_entry_setup_progress(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle the progress of setting up the config entries of integrations."""
+    connection.send_result(
+        msg["id"],
+        {
+            domain: progress.as_dict()
+            for domain, progress in async_get_config_entry_setup_progress(hass).items()
+        },
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
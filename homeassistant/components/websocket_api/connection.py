@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
+from homeassistant.components.http.request_timing import async_get_request_timings
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
@@ -45,6 +47,7 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "timings",
     )
 
     def __init__(
@@ -69,6 +72,7 @@ class ActiveConnection:
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.timings = async_get_request_timings(hass)
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -219,11 +223,18 @@ class ActiveConnection:
 
         handler, schema = handler_schema
 
+        timings = self.timings
+        start = time.monotonic() if timings is not None else 0.0
+
         try:
             handler(self.hass, self, schema(msg))
         except Exception as err:  # pylint: disable=broad-except
             self.async_handle_exception(msg, err)
 
+        # Async handlers record their timing once they are done
+        if timings is not None and not getattr(handler, "_ws_async", False):
+            timings.async_record(f"{const.DOMAIN}:{type_}", time.monotonic() - start)
+
         self.last_id = cur_id
 
     @callback
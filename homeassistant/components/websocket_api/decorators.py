@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from functools import wraps
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -23,10 +24,13 @@ async def _handle_async_response(
     msg: dict[str, Any],
 ) -> None:
     """Create a response and handle exception."""
+    start = time.monotonic()
     try:
         await func(hass, connection, msg)
     except Exception as err:  # pylint: disable=broad-except
         connection.async_handle_exception(msg, err)
+    if (timings := connection.timings) is not None:
+        timings.async_record(f"{const.DOMAIN}:{msg['type']}", time.monotonic() - start)
 
 
 def async_response(
@@ -49,6 +53,8 @@ def async_response(
             eager_start=True,
         )
 
+    # pylint: disable-next=protected-access
+    schedule_handler._ws_async = True  # type: ignore[attr-defined]
     return schedule_handler
 
 
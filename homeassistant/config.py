@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Callable, Iterable, Sequence
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from dataclasses import dataclass
 from enum import StrEnum
 from functools import reduce
@@ -67,7 +67,7 @@ from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import SECRET_YAML, Secrets, YamlCache, YamlTypeError, load_yaml_dict
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -78,6 +78,8 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_CACHE = "yaml_cache"
+YAML_CACHE_FILE = "core.yaml_cache"
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -476,6 +478,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             load_yaml_config_file,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            hass.data.get(DATA_YAML_CACHE),
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -516,8 +519,18 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     return config
 
 
+@callback
+def async_enable_yaml_cache(hass: HomeAssistant) -> None:
+    """Cache the parsed YAML files of the configuration between loads."""
+    hass.data[DATA_YAML_CACHE] = YamlCache(
+        hass.config.path(".storage", YAML_CACHE_FILE)
+    )
+
+
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    yaml_cache: YamlCache | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -526,7 +539,8 @@ def load_yaml_config_file(
     This method needs to run in an executor.
     """
     try:
-        conf_dict = load_yaml_dict(config_path, secrets)
+        with yaml_cache.activate() if yaml_cache else nullcontext():
+            conf_dict = load_yaml_dict(config_path, secrets)
     except YamlTypeError as exc:
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
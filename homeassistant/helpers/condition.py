@@ -91,6 +91,8 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+_MISSING = object()
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -534,6 +536,69 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     return if_numeric_state
 
 
+class _RequiredStates:
+    """The states a state condition requires, prepared for matching.
+
+    Required states which are not input entity ids are looked up in a dict,
+    which is built once when the condition is created instead of comparing
+    and matching each required state against INPUT_ENTITY_ID on each check.
+    """
+
+    __slots__ = ("values", "static")
+
+    def __init__(self, req_state: Any) -> None:
+        """Prepare the required states."""
+        if not isinstance(req_state, list):
+            req_state = [req_state]
+        # The required states, and whether they are input entity ids
+        self.values: list[tuple[Any, bool]] = [
+            (
+                value,
+                isinstance(value, str) and INPUT_ENTITY_ID.match(value) is not None,
+            )
+            for value in req_state
+        ]
+        self.static: dict[Any, Any] | None = None
+        if any(is_entity_id for _, is_entity_id in self.values):
+            return
+        static: dict[Any, Any] = {}
+        try:
+            for value, _ in self.values:
+                static.setdefault(value, value)
+        except TypeError:
+            # Unhashable required states are compared one by one
+            return
+        self.static = static
+
+    @callback
+    def async_match(self, hass: HomeAssistant, value: Any) -> tuple[bool, Any]:
+        """Return if the value matches, and the required state it was matched to."""
+        if self.static is not None:
+            try:
+                state_value = self.static.get(value, _MISSING)
+            except TypeError:
+                pass
+            else:
+                if state_value is not _MISSING:
+                    return True, state_value
+                return False, self.values[-1][0] if self.values else None
+
+        is_state = False
+        state_value = None
+        for req_state_value, is_entity_id in self.values:
+            state_value = req_state_value
+            if is_entity_id:
+                if not (state_entity := hass.states.get(req_state_value)):
+                    raise ConditionErrorMessage(
+                        "state", f"the 'state' entity {req_state_value} is unavailable"
+                    )
+                state_value = state_entity.state
+            is_state = value == state_value
+            if is_state:
+                break
+        return is_state, state_value
+
+
 def state(
     hass: HomeAssistant,
     entity: None | str | State,
@@ -571,24 +636,12 @@ def state(
     else:
         value = entity.attributes.get(attribute)
 
-    if not isinstance(req_state, list):
-        req_state = [req_state]
-
-    is_state = False
-    for req_state_value in req_state:
-        state_value = req_state_value
-        if (
-            isinstance(req_state_value, str)
-            and INPUT_ENTITY_ID.match(req_state_value) is not None
-        ):
-            if not (state_entity := hass.states.get(req_state_value)):
-                raise ConditionErrorMessage(
-                    "state", f"the 'state' entity {req_state_value} is unavailable"
-                )
-            state_value = state_entity.state
-        is_state = value == state_value
-        if is_state:
-            break
+    required_states = (
+        req_state
+        if isinstance(req_state, _RequiredStates)
+        else _RequiredStates(req_state)
+    )
+    is_state, state_value = required_states.async_match(hass, value)
 
     if for_period is None or not is_state:
         condition_trace_set_result(is_state, state=value, wanted_state=state_value)
@@ -610,14 +663,11 @@ def state(
 def state_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     entity_ids = config.get(CONF_ENTITY_ID, [])
-    req_states: str | list[str] = config.get(CONF_STATE, [])
+    req_states = _RequiredStates(config.get(CONF_STATE, []))
     for_period = config.get(CONF_FOR)
     attribute = config.get(CONF_ATTRIBUTE)
     match = config.get(CONF_MATCH, ENTITY_MATCH_ALL)
 
-    if not isinstance(req_states, list):
-        req_states = [req_states]
-
     @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
@@ -780,6 +830,20 @@ def async_template_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
 
+    if value_template.is_static:
+        # A template without any jinja always has the same result
+        static_result = value_template.template.strip().lower() == "true"
+
+        @trace_condition_function
+        def static_template_if(
+            hass: HomeAssistant, variables: TemplateVarsType = None
+        ) -> bool:
+            """Validate static template based if-condition."""
+            condition_trace_set_result(static_result, entities=[])
+            return static_result
+
+        return static_template_if
+
     @trace_condition_function
     def template_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate template based if-condition."""
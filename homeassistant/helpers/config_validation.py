@@ -1203,12 +1203,36 @@ PLATFORM_SCHEMA = vol.Schema(
 
 PLATFORM_SCHEMA_BASE = PLATFORM_SCHEMA.extend({}, extra=vol.ALLOW_EXTRA)
 
+
+def _service_entity_ids(validator: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Return a validator of the entity IDs of a service call.
+
+    A valid entity ID, or a list of valid entity IDs, is the most common
+    value and is accepted without running the given validator, which tries
+    each of its alternatives in turn.
+    """
+
+    def validate(value: Any) -> Any:
+        """Validate the entity IDs."""
+        if type(value) is str:  # noqa: E721
+            if valid_entity_id(value):
+                return [value]
+        elif type(value) is list and all(  # noqa: E721
+            type(item) is str and valid_entity_id(item)  # noqa: E721
+            for item in value
+        ):
+            return list(value)
+        return validator(value)
+
+    return validate
+
+
 ENTITY_SERVICE_FIELDS = {
     # Either accept static entity IDs, a single dynamic template or a mixed list
     # of static and dynamic templates. While this could be solved with a single
     # complex template, handling it like this, keeps config validation useful.
-    vol.Optional(ATTR_ENTITY_ID): vol.Any(
-        comp_entity_ids, dynamic_template, vol.All(list, template_complex)
+    vol.Optional(ATTR_ENTITY_ID): _service_entity_ids(
+        vol.Any(comp_entity_ids, dynamic_template, vol.All(list, template_complex))
     ),
     vol.Optional(ATTR_DEVICE_ID): vol.Any(
         ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
@@ -1224,8 +1248,10 @@ TARGET_SERVICE_FIELDS = {
     # Either accept static entity IDs, a single dynamic template or a mixed list
     # of static and dynamic templates. While this could be solved with a single
     # complex template, handling it like this, keeps config validation useful.
-    vol.Optional(ATTR_ENTITY_ID): vol.Any(
-        comp_entity_ids_or_uuids, dynamic_template, vol.All(list, template_complex)
+    vol.Optional(ATTR_ENTITY_ID): _service_entity_ids(
+        vol.Any(
+            comp_entity_ids_or_uuids, dynamic_template, vol.All(list, template_complex)
+        )
     ),
     vol.Optional(ATTR_DEVICE_ID): vol.Any(
         ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
@@ -7,9 +7,11 @@ from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import partial
+import hashlib
 from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any, Protocol
 
+import orjson
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -64,6 +66,10 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
+BulkServiceHandler = Callable[
+    [list["Entity"], dict[str, Any]], Coroutine[Any, Any, None]
+]
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -104,6 +110,62 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+def _fingerprint_default(obj: Any) -> Any:
+    """Convert validated config values to a stable representation."""
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    # Templates are compared by their source, their repr includes render stats
+    if isinstance(template := getattr(obj, "template", None), str):
+        return [type(obj).__name__, template]
+    # Objects without a meaningful repr include their address and never match
+    return repr(obj)
+
+
+def _config_fingerprint(
+    platform_config: ConfigType, discovery_info: DiscoveryInfoType | None
+) -> bytes:
+    """Return a fingerprint of a platform config and discovery info."""
+    return hashlib.blake2b(
+        orjson.dumps(
+            [platform_config, discovery_info],
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS,
+            default=_fingerprint_default,
+        ),
+        digest_size=16,
+    ).digest()
+
+
+class _PlatformSource:
+    """Entities added by setting up a platform from a config file or discovery."""
+
+    __slots__ = (
+        "platform_config",
+        "discovery_info",
+        "entities",
+        "ready",
+        "_fingerprint",
+    )
+
+    def __init__(
+        self, platform_config: ConfigType, discovery_info: DiscoveryInfoType | None
+    ) -> None:
+        """Initialize the source."""
+        self.platform_config = platform_config
+        self.discovery_info = discovery_info
+        self.entities: list[Entity] = []
+        self.ready = False
+        self._fingerprint: bytes | None = None
+
+    @property
+    def fingerprint(self) -> bytes:
+        """Return the fingerprint of the config the source was set up with."""
+        if self._fingerprint is None:
+            self._fingerprint = _config_fingerprint(
+                self.platform_config, self.discovery_info
+            )
+        return self._fingerprint
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -135,6 +197,9 @@ class EntityPlatform:
         self.object_id_component_translations: dict[str, str] = {}
         self.object_id_platform_translations: dict[str, str] = {}
         self._tasks: list[asyncio.Task[None]] = []
+        # Entities per platform config or discovery info, used to only
+        # replace the entities of changed configs when reconfiguring
+        self._sources: list[_PlatformSource] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
         # Method to cancel the state change listener
@@ -142,6 +207,9 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Handlers calling an entity method on many entities at once,
+        # indexed by the name of the entity method
+        self.bulk_service_handlers: dict[str, BulkServiceHandler] = {}
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -260,6 +328,9 @@ class EntityPlatform:
 
             return
 
+        source = _PlatformSource(platform_config, discovery_info)
+        self._sources.append(source)
+
         @callback
         def async_create_setup_awaitable() -> (
             Coroutine[Any, Any, None] | asyncio.Future[None]
@@ -269,7 +340,7 @@ class EntityPlatform:
                 return platform.async_setup_platform(  # type: ignore[union-attr]
                     hass,
                     platform_config,
-                    self._async_schedule_add_entities,
+                    partial(self._async_schedule_add_source_entities, source),
                     discovery_info,
                 )
 
@@ -280,11 +351,78 @@ class EntityPlatform:
                 platform.setup_platform,  # type: ignore[union-attr]
                 hass,
                 platform_config,
-                self._schedule_add_entities,
+                partial(self._schedule_add_source_entities, source),
                 discovery_info,
             )
 
-        await self._async_setup_platform(async_create_setup_awaitable)
+        source.ready = await self._async_setup_platform(async_create_setup_awaitable)
+
+    async def async_reconfig(
+        self,
+        platform_configs: list[ConfigType],
+        discovery_infos: list[DiscoveryInfoType] | None = None,
+    ) -> None:
+        """Reconfigure the platform from a config file.
+
+        The entities of platform configs and discovery infos that did not
+        change are kept, the entities of the others are removed and the new
+        configs are set up. If discovery_infos is None all discovered
+        entities are removed as the integration will discover them again.
+
+        This method must be run in the event loop.
+        """
+        self.async_cancel_retry_setup()
+
+        pending: dict[tuple[bool, bytes], list[_PlatformSource]] = {}
+        for p_config in platform_configs:
+            new_source = _PlatformSource(p_config, None)
+            pending.setdefault((False, new_source.fingerprint), []).append(new_source)
+        for discovery_info in discovery_infos or ():
+            new_source = _PlatformSource({}, discovery_info)
+            pending.setdefault((True, new_source.fingerprint), []).append(new_source)
+
+        kept: list[_PlatformSource] = []
+        removed: list[_PlatformSource] = []
+        for source in self._sources:
+            discovered = source.discovery_info is not None
+            if (
+                source.ready
+                and (not discovered or discovery_infos is not None)
+                and (matches := pending.get((discovered, source.fingerprint)))
+            ):
+                matches.pop()
+                kept.append(source)
+            else:
+                removed.append(source)
+        self._sources = kept
+
+        for source in removed:
+            for entity in source.entities:
+                if self.entities.get(entity.entity_id) is not entity:
+                    continue
+                try:
+                    await entity.async_remove()
+                except Exception:  # pylint: disable=broad-except
+                    self.logger.exception(
+                        "Error while removing entity %s", entity.entity_id
+                    )
+
+        if not any(entity.should_poll for entity in self.entities.values()):
+            self.async_unsub_polling()
+
+        if not (
+            new_sources := [
+                source for sources in pending.values() for source in sources
+            ]
+        ):
+            return
+        self._setup_complete = False
+        await asyncio.gather(
+            *(
+                self.async_setup(source.platform_config, source.discovery_info)
+                for source in new_sources
+            )
+        )
 
     @callback
     def async_shutdown(self) -> None:
@@ -459,6 +597,32 @@ class EntityPlatform:
                 object_id_language, "entity", self.platform_name
             )
 
+    def _schedule_add_source_entities(
+        self,
+        source: _PlatformSource,
+        new_entities: Iterable[Entity],
+        update_before_add: bool = False,
+    ) -> None:
+        """Schedule adding entities set up from a config, synchronously."""
+        self.hass.loop.call_soon_threadsafe(
+            self._async_schedule_add_source_entities,
+            source,
+            list(new_entities),
+            update_before_add,
+        )
+
+    @callback
+    def _async_schedule_add_source_entities(
+        self,
+        source: _PlatformSource,
+        new_entities: Iterable[Entity],
+        update_before_add: bool = False,
+    ) -> None:
+        """Schedule adding entities set up from a config async."""
+        new_entities = list(new_entities)
+        source.entities.extend(new_entities)
+        self._async_schedule_add_entities(new_entities, update_before_add)
+
     def _schedule_add_entities(
         self, new_entities: Iterable[Entity], update_before_add: bool = False
     ) -> None:
@@ -883,6 +1047,7 @@ class EntityPlatform:
         This method must be run in the event loop.
         """
         self.async_cancel_retry_setup()
+        self._sources.clear()
 
         if not self.entities:
             return
@@ -984,6 +1149,24 @@ class EntityPlatform:
             supports_response,
         )
 
+    @callback
+    def async_register_bulk_service_handler(
+        self, func: str, handler: BulkServiceHandler
+    ) -> None:
+        """Register a handler calling an entity method on many entities at once.
+
+        When an entity service call targets more than one entity of this
+        platform, and the service calls the entity method func, the handler is
+        called once with the targeted entities of this platform and the service
+        data, instead of calling the method of each entity. This allows
+        sending one command for many entities to a device, like a group command
+        to a gateway. The handler runs under the parallel updates semaphore of
+        the platform. It updates the entities without writing their states,
+        the states are written together once all handlers of the service call
+        have returned.
+        """
+        self.bulk_service_handlers[func] = handler
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
@@ -455,11 +455,15 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains four additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> list[key]
     - device_id -> list[key]
+    - area_id -> list[key]
+    - label_id -> list[key]
+    - platform -> list[key]
+    - domain -> list[key]
     """
 
     def __init__(self) -> None:
@@ -470,6 +474,9 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
         self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
         self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._labels_index: dict[str, dict[str, Literal[True]]] = {}
+        self._platform_index: dict[str, dict[str, Literal[True]]] = {}
+        self._domain_index: dict[str, dict[str, Literal[True]]] = {}
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -491,6 +498,10 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
             self._device_id_index.setdefault(device_id, {})[key] = True
         if (area_id := entry.area_id) is not None:
             self._area_id_index.setdefault(area_id, {})[key] = True
+        for label in entry.labels:
+            self._labels_index.setdefault(label, {})[key] = True
+        self._platform_index.setdefault(entry.platform, {})[key] = True
+        self._domain_index.setdefault(entry.domain, {})[key] = True
 
     def _unindex_entry_value(
         self, key: str, value: str, index: dict[str, dict[str, Literal[True]]]
@@ -517,6 +528,10 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
             self._unindex_entry_value(key, device_id, self._device_id_index)
         if area_id := entry.area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
+        for label in entry.labels:
+            self._unindex_entry_value(key, label, self._labels_index)
+        self._unindex_entry_value(key, entry.platform, self._platform_index)
+        self._unindex_entry_value(key, entry.domain, self._domain_index)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
@@ -560,6 +575,21 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         data = self.data
         return [data[key] for key in self._area_id_index.get(area_id, ())]
 
+    def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
+        """Get entries for label."""
+        data = self.data
+        return [data[key] for key in self._labels_index.get(label, ())]
+
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        data = self.data
+        return [data[key] for key in self._platform_index.get(platform, ())]
+
+    def get_entries_for_domain(self, domain: str) -> list[RegistryEntry]:
+        """Get entries for domain."""
+        data = self.data
+        return [data[key] for key in self._domain_index.get(domain, ())]
+
 
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
@@ -592,7 +622,11 @@ class EntityRegistry(BaseRegistry):
         The result is indexed by device_id, then by the matching (domain, device_class)
         """
         lookup: dict[str, dict[tuple[str, str | None], str]] = {}
-        for entity in self.entities.values():
+        for entity in (
+            entity
+            for domain in {domain for domain, _ in domain_device_classes}
+            for entity in self.entities.get_entries_for_domain(domain)
+        ):
             if not entity.device_id:
                 continue
             device_class = entity.device_class or entity.original_device_class
@@ -1246,11 +1280,10 @@ class EntityRegistry(BaseRegistry):
     @callback
     def async_clear_label_id(self, label_id: str) -> None:
         """Clear label from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if label_id in entry.labels:
-                labels = entry.labels.copy()
-                labels.remove(label_id)
-                self.async_update_entity(entity_id, labels=labels)
+        for entry in self.entities.get_entries_for_label(label_id):
+            labels = entry.labels.copy()
+            labels.remove(label_id)
+            self.async_update_entity(entry.entity_id, labels=labels)
 
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
@@ -1329,7 +1362,7 @@ def async_entries_for_label(
     registry: EntityRegistry, label_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a label."""
-    return [entry for entry in registry.entities.values() if label_id in entry.labels]
+    return registry.entities.get_entries_for_label(label_id)
 
 
 @callback
@@ -86,6 +86,9 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Time pattern trackers, shared by the listeners of the same pattern
+_TIME_PATTERN_TRACKERS = "time_pattern_trackers"
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _P = ParamSpec("_P")
 
@@ -1731,14 +1734,24 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+_TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Fire the listeners of a time pattern.
+
+    Listeners of the same pattern share a tracker, so the next time the
+    pattern matches is calculated and scheduled once for all of them.
+    """
+
     hass: HomeAssistant
+    key: _TimePatternKey
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    jobs: dict[HassJob[[datetime], Coroutine[Any, Any, None] | None], None]
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1770,18 +1783,43 @@ class _TrackUTCTimeChange:
         # time when the timer was scheduled
         utc_now = time_tracker_utcnow()
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        hass.async_run_hass_job(self.job, localized_now, background=True)
         if TYPE_CHECKING:
             assert self._pattern_time_change_listener_job is not None
+        # Schedule the next match before running the listeners, which may
+        # remove themselves and with the last one cancel it
         self._cancel_callback = async_track_point_in_utc_time(
             hass,
             self._pattern_time_change_listener_job,
             self._calculate_next(utc_now + timedelta(seconds=1)),
         )
+        jobs = self.jobs
+        for job in tuple(jobs):
+            if job not in jobs:
+                continue
+            try:
+                hass.async_run_hass_job(job, localized_now, background=True)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching time change %s to %s",
+                    self.listener_job_name,
+                    job,
+                )
 
     @callback
-    def async_cancel(self) -> None:
-        """Cancel the call_at."""
+    def async_remove_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> None:
+        """Remove a listener, and cancel the call_at once there are none left."""
+        jobs = self.jobs
+        if job not in jobs:
+            return
+        del jobs[job]
+        if jobs:
+            return
+        trackers: dict[_TimePatternKey, _TrackUTCTimeChange] = self.hass.data[
+            _TIME_PATTERN_TRACKERS
+        ]
+        del trackers[self.key]
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
@@ -1811,25 +1849,41 @@ def async_track_utc_time_change(
         # misalignment we use async_track_time_interval here
         return async_track_time_interval(hass, action, timedelta(seconds=1))
 
-    job = HassJob(action, f"track time change {hour}:{minute}:{second} local={local}")
+    job = HassJob(
+        action, f"track time change {hour}:{minute}:{second} local={local} {action}"
+    )
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    key: _TimePatternKey = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    trackers: dict[_TimePatternKey, _TrackUTCTimeChange] = hass.data.setdefault(
+        _TIME_PATTERN_TRACKERS, {}
+    )
+    if (track := trackers.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        listener_job_name = (
+            f"time change listener {hour}:{minute}:{second} local={local}"
+        )
+        track = trackers[key] = _TrackUTCTimeChange(
+            hass,
+            key,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            listener_job_name,
+            {},
+        )
+        track.async_attach()
+    track.jobs[job] = None
+    return ft.partial(track.async_remove_job, job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -101,6 +101,8 @@ def request_handler_factory(
             f"Result should be None, string, bytes or StreamResponse. Got: {result}"
         )
 
+    # Used to group requests by view, e.g. for the request timings
+    handle.view_name = getattr(view, "name", None) or view.url  # type: ignore[attr-defined]
     return handle
 
 
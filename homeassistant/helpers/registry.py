@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import secrets
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -13,6 +14,9 @@ if TYPE_CHECKING:
 SAVE_DELAY = 10
 SAVE_DELAY_STARTING = 300
 
+# The number of changed entries tracked for clients to sync changes
+MAX_TRACKED_CHANGES = 5000
+
 
 class BaseRegistry(ABC):
     """Class to implement a registry."""
@@ -34,3 +38,79 @@ class BaseRegistry(ABC):
     @abstractmethod
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of registry to store in a file."""
+
+
+class RegistryChanges:
+    """Track the revision at which registry entries last changed.
+
+    Every change increases the revision. The most recent changes are kept,
+    so clients can fetch the entries changed since a revision instead of
+    the whole registry. Revisions are strings which include an id of the
+    tracker, so revisions of an earlier run are not mistaken for current
+    ones.
+    """
+
+    __slots__ = ("_id", "_revision", "_oldest", "_changes")
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._id = secrets.token_hex(4)
+        self._revision = 0
+        # Changes up to this revision are no longer tracked
+        self._oldest = 0
+        # Key -> (revision, removed), ordered by revision
+        self._changes: dict[str, tuple[int, bool]] = {}
+
+    @property
+    def revision(self) -> str:
+        """Return the current revision."""
+        return self._format(self._revision)
+
+    def _format(self, revision: int) -> str:
+        """Format a revision."""
+        return f"{self._id}-{revision}"
+
+    @callback
+    def async_changed(self, key: str, removed: bool = False) -> None:
+        """Record a change of an entry."""
+        self._revision += 1
+        changes = self._changes
+        changes.pop(key, None)
+        changes[key] = (self._revision, removed)
+        if len(changes) > MAX_TRACKED_CHANGES:
+            self._oldest = changes.pop(next(iter(changes)))[0]
+
+    @callback
+    def async_changes_since(
+        self, revision: str, limit: int
+    ) -> tuple[str, list[tuple[str, bool]], bool] | None:
+        """Return the entries changed after a revision, oldest first.
+
+        Returns the revision the changes lead to, up to limit changed keys
+        with whether they were removed, and whether more changes follow.
+        Returns None if the changes after the revision are not known.
+        """
+        tracker_id, _, number = revision.rpartition("-")
+        if (
+            tracker_id != self._id
+            or not number.isdigit()
+            or not self._oldest <= (since := int(number)) <= self._revision
+        ):
+            return None
+        newer: list[tuple[str, int, bool]] = []
+        for key, (changed, removed) in reversed(self._changes.items()):
+            if changed <= since:
+                break
+            newer.append((key, changed, removed))
+        newer.reverse()
+        if len(newer) > limit:
+            return (
+                self._format(newer[limit - 1][1]),
+                [(key, removed) for key, _, removed in newer[:limit]],
+                True,
+            )
+        return (
+            self.revision,
+            [(key, removed) for key, _, removed in newer],
+            False,
+        )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 import logging
 from typing import Any, Literal, overload
 
@@ -14,11 +14,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
+from .discovery import async_load_platform
 from .entity import Entity
 from .entity_component import EntityComponent
 from .entity_platform import EntityPlatform, async_get_platforms
 from .service import async_register_admin_service
-from .typing import ConfigType
+from .typing import ConfigType, DiscoveryInfoType
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,11 +27,19 @@ PLATFORM_RESET_LOCK = "lock_async_reset_platform_{}"
 
 
 async def async_reload_integration_platforms(
-    hass: HomeAssistant, integration_domain: str, platform_domains: Iterable[str]
+    hass: HomeAssistant,
+    integration_domain: str,
+    platform_domains: Iterable[str],
+    discovery_infos: Mapping[str, list[DiscoveryInfoType]] | None = None,
 ) -> None:
     """Reload an integration's platforms.
 
-    The platform must support being re-setup.
+    The platform must support being re-setup. Only the entities of platform
+    configs that changed are replaced.
+
+    Integrations that discover their platforms can pass the discovery info
+    for each platform domain to also only replace the entities of changed
+    discovery info, otherwise all discovered entities are removed.
 
     This functionality is only intended to be used for integrations that process
     Home Assistant data and make this available to other integrations.
@@ -44,7 +53,15 @@ async def async_reload_integration_platforms(
         return
 
     tasks = [
-        _resetup_platform(hass, integration_domain, platform_domain, unprocessed_conf)
+        _resetup_platform(
+            hass,
+            integration_domain,
+            platform_domain,
+            unprocessed_conf,
+            None
+            if discovery_infos is None
+            else discovery_infos.get(platform_domain, []),
+        )
         for platform_domain in platform_domains
     ]
 
@@ -56,6 +73,7 @@ async def _resetup_platform(
     integration_domain: str,
     platform_domain: str,
     unprocessed_config: ConfigType,
+    discovery_infos: list[DiscoveryInfoType] | None = None,
 ) -> None:
     """Resetup a platform."""
     integration = await async_get_integration(hass, platform_domain)
@@ -93,17 +111,22 @@ async def _resetup_platform(
         hass, integration_domain, platform_domain
     )
     if platform:
-        await _async_reconfig_platform(platform, root_config[platform_domain])
+        await platform.async_reconfig(root_config[platform_domain], discovery_infos)
         return
 
-    if not root_config[platform_domain]:
-        # No config for this platform
-        # and it's not loaded. Nothing to do.
-        return
+    if root_config[platform_domain]:
+        await _async_setup_platform(
+            hass, integration_domain, platform_domain, root_config[platform_domain]
+        )
 
-    await _async_setup_platform(
-        hass, integration_domain, platform_domain, root_config[platform_domain]
-    )
+    for discovery_info in discovery_infos or ():
+        await async_load_platform(
+            hass,
+            platform_domain,
+            integration_domain,
+            discovery_info,
+            unprocessed_config,
+        )
 
 
 async def _async_setup_platform(
@@ -127,15 +150,6 @@ async def _async_setup_platform(
     await asyncio.gather(*tasks)
 
 
-async def _async_reconfig_platform(
-    platform: EntityPlatform, platform_configs: list[dict[str, Any]]
-) -> None:
-    """Reconfigure an already loaded platform."""
-    await platform.async_reset()
-    tasks = [platform.async_setup(p_config) for p_config in platform_configs]
-    await asyncio.gather(*tasks)
-
-
 @overload
 async def async_integration_yaml_config(
     hass: HomeAssistant, integration_name: str
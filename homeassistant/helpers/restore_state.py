@@ -17,7 +17,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .storage import Store
 
 DATA_RESTORE_STATE = "restore_state"
@@ -33,6 +33,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long an unchanged state is kept in the dumps before its last seen time
+# is updated, the last seen times are all updated when Home Assistant stops
+STATE_LAST_SEEN_REFRESH = timedelta(hours=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -108,6 +112,14 @@ def async_get(hass: HomeAssistant) -> RestoreStateData:
     return cast(RestoreStateData, hass.data[DATA_RESTORE_STATE])
 
 
+def _stored_state_entity_id(item: dict[str, Any]) -> str:
+    """Return the entity id of a stored state, as dumped or as loaded."""
+    state = item["state"]
+    if isinstance(state, State):
+        return state.entity_id
+    return state["entity_id"]  # type: ignore[no-any-return]
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -135,10 +147,20 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            append_log=True,
+            append_log_item_id=_stored_state_entity_id,
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state, serialized extra data, last seen time and stored state
+        # of each entity in the last dump
+        self._dumped_states: dict[
+            str, tuple[State, bytes | None, datetime, dict[str, Any]]
+        ] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -214,17 +236,55 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_serialized_stored_states(self) -> list[dict[str, Any]]:
+        """Get the states which should be stored, with serialized values.
+
+        The last seen time of a stored state is only updated if its state or
+        extra data changed since the last dump, or if its last seen time is
+        older than STATE_LAST_SEEN_REFRESH. Unchanged states are not written
+        again by the append log of the store.
+        """
+        dumped_states = self._dumped_states
+        new_dumped_states: dict[
+            str, tuple[State, bytes | None, datetime, dict[str, Any]]
+        ] = {}
+        serialized_states: list[dict[str, Any]] = []
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            extra_data = stored_state.extra_data
+            extra_json = json_bytes(extra_data.as_dict()) if extra_data else None
+            last_seen = stored_state.last_seen
+            dumped = dumped_states.get(state.entity_id)
+            if (
+                dumped is None
+                or dumped[0] is not state
+                or dumped[1] != extra_json
+                or last_seen - dumped[2] >= STATE_LAST_SEEN_REFRESH
+            ):
+                dumped = (
+                    state,
+                    extra_json,
+                    last_seen,
+                    {
+                        "state": state,
+                        "extra_data": json_fragment(extra_json)
+                        if extra_json is not None
+                        else None,
+                        "last_seen": last_seen,
+                    },
+                )
+            new_dumped_states[state.entity_id] = dumped
+            serialized_states.append(dumped[3])
+        self._dumped_states = new_dumped_states
+        return serialized_states
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
-        except HomeAssistantError as exc:
+            await self.store.async_save(self._async_get_serialized_stored_states())
+        except (HomeAssistantError, TypeError) as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
     @callback
@@ -249,6 +309,9 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
+            # Store the last seen time of all the states, not only of the
+            # states that changed
+            self._dumped_states = {}
             await self.async_dump_states()
 
         # Dump states when stopping hass
@@ -6,14 +6,14 @@ import asyncio
 from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
 from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
 import logging
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, TypedDict, TypeVar, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict, TypeVar, cast
 
 import voluptuous as vol
 
@@ -131,6 +131,18 @@ CONF_MAX_EXCEEDED = "max_exceeded"
 _MAX_EXCEEDED_CHOICES = list(LOGSEVERITY) + ["SILENT"]
 DEFAULT_MAX_EXCEEDED = "WARNING"
 
+# What to do with a new run of a queued script when the queue is full
+CONF_QUEUE_OVERFLOW = "queue_overflow"
+QUEUE_OVERFLOW_COALESCE = "coalesce"
+QUEUE_OVERFLOW_DROP_NEWEST = "drop_newest"
+QUEUE_OVERFLOW_DROP_OLDEST = "drop_oldest"
+QUEUE_OVERFLOW_CHOICES = [
+    QUEUE_OVERFLOW_COALESCE,
+    QUEUE_OVERFLOW_DROP_NEWEST,
+    QUEUE_OVERFLOW_DROP_OLDEST,
+]
+DEFAULT_QUEUE_OVERFLOW = QUEUE_OVERFLOW_DROP_NEWEST
+
 ATTR_CUR = "current"
 ATTR_MAX = "max"
 
@@ -235,27 +247,48 @@ async def trace_action(
         trace_element.set_error(ex)
         raise ex
     finally:
+        trace_element.set_finished()
         trace_stack_pop(trace_stack_cv)
 
 
 def make_script_schema(
     schema: Mapping[Any, Any], default_script_mode: str, extra: int = vol.PREVENT_EXTRA
-) -> vol.Schema:
+) -> vol.All:
     """Make a schema for a component that uses the script helper."""
-    return vol.Schema(
-        {
-            **schema,
-            vol.Optional(CONF_MODE, default=default_script_mode): vol.In(
-                SCRIPT_MODE_CHOICES
-            ),
-            vol.Optional(CONF_MAX, default=DEFAULT_MAX): vol.All(
-                vol.Coerce(int), vol.Range(min=2)
-            ),
-            vol.Optional(CONF_MAX_EXCEEDED, default=DEFAULT_MAX_EXCEEDED): vol.All(
-                vol.Upper, vol.In(_MAX_EXCEEDED_CHOICES)
-            ),
-        },
-        extra=extra,
+
+    def validate_queue_overflow(config: Any) -> Any:
+        """Validate queue_overflow is only set for queued scripts."""
+        if (
+            isinstance(config, dict)
+            and CONF_QUEUE_OVERFLOW in config
+            and config.get(CONF_MODE, default_script_mode) != SCRIPT_MODE_QUEUED
+        ):
+            raise vol.Invalid(
+                f"{CONF_QUEUE_OVERFLOW} is only supported in {SCRIPT_MODE_QUEUED} mode",
+                path=[CONF_QUEUE_OVERFLOW],
+            )
+        return config
+
+    return vol.All(
+        validate_queue_overflow,
+        vol.Schema(
+            {
+                **schema,
+                vol.Optional(CONF_MODE, default=default_script_mode): vol.In(
+                    SCRIPT_MODE_CHOICES
+                ),
+                vol.Optional(CONF_MAX, default=DEFAULT_MAX): vol.All(
+                    vol.Coerce(int), vol.Range(min=2)
+                ),
+                vol.Optional(CONF_MAX_EXCEEDED, default=DEFAULT_MAX_EXCEEDED): vol.All(
+                    vol.Upper, vol.In(_MAX_EXCEEDED_CHOICES)
+                ),
+                vol.Optional(
+                    CONF_QUEUE_OVERFLOW, default=DEFAULT_QUEUE_OVERFLOW
+                ): vol.In(QUEUE_OVERFLOW_CHOICES),
+            },
+            extra=extra,
+        ),
     )
 
 
@@ -466,26 +499,26 @@ class _ScriptRun:
 
     async def _async_step(self, log_exceptions: bool) -> None:
         continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        # pylint: disable-next=protected-access
+        step = self._script._steps[self._step]
 
-        with trace_path(str(self._step)):
+        with trace_path(step.path):
             async with trace_action(
                 self._hass, self, self._stop, self._variables
             ) as trace_element:
                 if self._stop.is_set():
                     return
 
-                action = cv.determine_script_action(self._action)
-
                 if not self._action.get(CONF_ENABLED, True):
                     self._log(
-                        "Skipped disabled step %s", self._action.get(CONF_ALIAS, action)
+                        "Skipped disabled step %s",
+                        self._action.get(CONF_ALIAS, step.action),
                     )
                     trace_set_result(enabled=False)
                     return
 
                 try:
-                    handler = f"_async_{action}_step"
-                    await getattr(self, handler)()
+                    await getattr(self, step.handler)()
                 except Exception as ex:  # pylint: disable=broad-except
                     self._handle_exception(
                         ex, continue_on_error, self._log_exceptions or log_exceptions
@@ -699,9 +732,17 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        # pylint: disable-next=protected-access
+        if static_params := self._script._get_static_service_params(self._step):
+            params = {
+                **static_params,
+                "service_data": deepcopy(static_params["service_data"]),
+                "target": deepcopy(static_params["target"]),
+            }
+        else:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -1115,10 +1156,42 @@ class _ScriptRun:
 
 
 class _QueuedScriptRun(_ScriptRun):
-    """Manage queued Script sequence run."""
+    """Manage queued Script sequence run.
+
+    If render_on_start is set, only the variables passed to the run are kept
+    while the run is waiting in the queue, and the variables of the script are
+    rendered when the run starts.
+    """
 
     lock_acquired = False
 
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        script: Script,
+        variables: dict[str, Any],
+        context: Context,
+        log_exceptions: bool,
+        run_variables: _VarsType | None = None,
+        render_on_start: bool = False,
+    ) -> None:
+        """Initialize a queued run."""
+        super().__init__(hass, script, variables, context, log_exceptions)
+        self.run_variables = run_variables
+        self.render_on_start = render_on_start
+        self.queued_at = hass.loop.time()
+
+    @property
+    def stopping(self) -> bool:
+        """Return if the run has been told to stop."""
+        return self._stop.is_set()
+
+    @callback
+    def async_coalesce(self, run_variables: _VarsType | None, context: Context) -> None:
+        """Replace the variables and context of the run while it is queued."""
+        self.run_variables = run_variables
+        self._context = context
+
     async def async_run(self) -> None:
         """Run script."""
         # Wait for previous run, if any, to finish by attempting to acquire the script's
@@ -1144,8 +1217,20 @@ class _QueuedScriptRun(_ScriptRun):
         # lock so we can go ahead and start the run.
         if self._stop.is_set():
             self._finish()
-        else:
-            await super().async_run()
+            return
+        # pylint: disable-next=protected-access
+        self._script._async_record_queue_wait(self._hass.loop.time() - self.queued_at)
+        if self.render_on_start:
+            try:
+                # pylint: disable-next=protected-access
+                self._variables = self._script._async_render_run_variables(
+                    self.run_variables, cast(Context, self._context)
+                )
+            except exceptions.TemplateError:
+                self._finish()
+                raise
+            self.run_variables = None
+        await super().async_run()
 
     def _finish(self) -> None:
         if self.lock_acquired:
@@ -1219,6 +1304,14 @@ def _referenced_extract_ids(data: Any, key: str, found: set[str]) -> None:
             found.add(item_id)
 
 
+class _ScriptStep(NamedTuple):
+    """Trace path, action type and handler of a step of a sequence."""
+
+    path: str
+    action: str
+    handler: str
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -1256,6 +1349,7 @@ class Script:
         logger: logging.Logger | None = None,
         max_exceeded: str = DEFAULT_MAX_EXCEEDED,
         max_runs: int = DEFAULT_MAX,
+        queue_overflow: str = DEFAULT_QUEUE_OVERFLOW,
         running_description: str | None = None,
         script_mode: str = DEFAULT_SCRIPT_MODE,
         top_level: bool = True,
@@ -1298,11 +1392,18 @@ class Script:
         self._max_exceeded = max_exceeded
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
+        self._queue_overflow = queue_overflow
+        self._queue_waits = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._queue_dropped = 0
+        self._queue_coalesced = 0
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
         self._if_data: dict[int, _IfData] = {}
         self._parallel_scripts: dict[int, list[Script]] = {}
+        self._static_service_params: dict[int, service.ServiceParams | None] = {}
         self.variables = variables
         self._variables_dynamic = template.is_complex(variables)
         if self._variables_dynamic:
@@ -1368,6 +1469,41 @@ class Script:
         """Return the number of current runs."""
         return len(self._runs)
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of queued runs waiting to start."""
+        return len(self._queued_runs())
+
+    def _queued_runs(self) -> list[_QueuedScriptRun]:
+        """Return the queued runs waiting to start, oldest first."""
+        return [
+            run
+            for run in self._runs
+            if isinstance(run, _QueuedScriptRun)
+            and not run.lock_acquired
+            and not run.stopping
+        ]
+
+    @property
+    def queue_stats(self) -> dict[str, Any]:
+        """Return the depth of the queue and how long queued runs waited."""
+        return {
+            "depth": self.queue_depth,
+            "waits": self._queue_waits,
+            "wait_total": self._queue_wait_total,
+            "wait_max": self._queue_wait_max,
+            "dropped": self._queue_dropped,
+            "coalesced": self._queue_coalesced,
+        }
+
+    @callback
+    def _async_record_queue_wait(self, wait: float) -> None:
+        """Record how long a queued run waited before it started."""
+        self._queue_waits += 1
+        self._queue_wait_total += wait
+        if wait > self._queue_wait_max:
+            self._queue_wait_max = wait
+
     @property
     def supports_max(self) -> bool:
         """Return true if the current mode support max."""
@@ -1538,39 +1674,13 @@ class Script:
                     self._log("Already running", level=LOGSEVERITY[self._max_exceeded])
                 script_execution_set("failed_single")
                 return None
-            if self.script_mode != SCRIPT_MODE_RESTART and self.runs == self.max_runs:
-                if self._max_exceeded != "SILENT":
-                    self._log(
-                        "Maximum number of runs exceeded",
-                        level=LOGSEVERITY[self._max_exceeded],
-                    )
-                script_execution_set("failed_max_runs")
+            if (
+                self.script_mode != SCRIPT_MODE_RESTART
+                and self.runs == self.max_runs
+                and not await self._async_queue_overflow(run_variables, context)
+            ):
                 return None
 
-        # If this is a top level Script then make a copy of the variables in case they
-        # are read-only, but more importantly, so as not to leak any variables created
-        # during the run back to the caller.
-        if self.top_level:
-            if self.variables:
-                try:
-                    variables = self.variables.async_render(
-                        self._hass,
-                        run_variables,
-                    )
-                except exceptions.TemplateError as err:
-                    self._log("Error rendering variables: %s", err, level=logging.ERROR)
-                    raise
-            elif run_variables:
-                variables = dict(run_variables)
-            else:
-                variables = {}
-
-            variables["context"] = context
-        elif self._copy_variables_on_run:
-            variables = cast(dict, copy(run_variables))
-        else:
-            variables = cast(dict, run_variables)
-
         # Prevent non-allowed recursive calls which will cause deadlocks when we try to
         # stop (restart) or wait for (queued) our own script run.
         script_stack = script_stack_cv.get()
@@ -1583,13 +1693,35 @@ class Script:
             self._log("Disallowed recursion detected", level=logging.WARNING)
             return None
 
+        run: _ScriptRun
         if self.script_mode != SCRIPT_MODE_QUEUED:
-            cls = _ScriptRun
+            run = _ScriptRun(
+                self._hass,
+                self,
+                self._async_render_run_variables(run_variables, context),
+                context,
+                self._log_exceptions,
+            )
+        elif self._queue_overflow == QUEUE_OVERFLOW_DROP_NEWEST:
+            run = _QueuedScriptRun(
+                self._hass,
+                self,
+                self._async_render_run_variables(run_variables, context),
+                context,
+                self._log_exceptions,
+            )
         else:
-            cls = _QueuedScriptRun
-        run = cls(
-            self._hass, self, cast(dict, variables), context, self._log_exceptions
-        )
+            # Render the variables when the run starts, so a run which is coalesced
+            # while it is queued uses the variables of the newest call.
+            run = _QueuedScriptRun(
+                self._hass,
+                self,
+                {},
+                context,
+                self._log_exceptions,
+                run_variables,
+                render_on_start=True,
+            )
         self._runs.append(run)
         if self.script_mode == SCRIPT_MODE_RESTART:
             # When script mode is SCRIPT_MODE_RESTART, first add the new run and then
@@ -1611,6 +1743,65 @@ class Script:
             self._changed()
             raise
 
+    async def _async_queue_overflow(
+        self, run_variables: _VarsType | None, context: Context
+    ) -> bool:
+        """Handle a new run when the maximum number of runs is reached.
+
+        Returns True if the new run should be added.
+        """
+        queued = self._queued_runs()
+        if not queued or self._queue_overflow == QUEUE_OVERFLOW_DROP_NEWEST:
+            if self._max_exceeded != "SILENT":
+                self._log(
+                    "Maximum number of runs exceeded",
+                    level=LOGSEVERITY[self._max_exceeded],
+                )
+            script_execution_set("failed_max_runs")
+            return False
+
+        if self._queue_overflow == QUEUE_OVERFLOW_COALESCE:
+            # Replace the variables of the last queued run with those of the new run
+            queued[-1].async_coalesce(run_variables, context)
+            self._queue_coalesced += 1
+            script_execution_set("coalesced")
+            return False
+
+        # Drop the oldest queued run to make room for the new run
+        self._log("Maximum number of runs exceeded, dropping oldest queued run")
+        self._queue_dropped += 1
+        await queued[0].async_stop()
+        return True
+
+    def _async_render_run_variables(
+        self, run_variables: _VarsType | None, context: Context
+    ) -> dict[str, Any]:
+        """Return the variables of a new run."""
+        # If this is a top level Script then make a copy of the variables in case they
+        # are read-only, but more importantly, so as not to leak any variables created
+        # during the run back to the caller.
+        if self.top_level:
+            if self.variables:
+                try:
+                    variables = self.variables.async_render(
+                        self._hass,
+                        run_variables,
+                    )
+                except exceptions.TemplateError as err:
+                    self._log("Error rendering variables: %s", err, level=logging.ERROR)
+                    raise
+            elif run_variables:
+                variables = dict(run_variables)
+            else:
+                variables = {}
+
+            variables["context"] = context
+        elif self._copy_variables_on_run:
+            variables = cast(dict, copy(run_variables))
+        else:
+            variables = cast(dict, run_variables)
+        return variables
+
     async def _async_stop(
         self, aws: list[asyncio.Task], update_state: bool, spare: _ScriptRun | None
     ) -> None:
@@ -1642,6 +1833,31 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    @cached_property
+    def _steps(self) -> list[_ScriptStep]:
+        """Return the resolved steps of the sequence.
+
+        Resolved once, as the action type of each step does not change between
+        runs of the script.
+        """
+        steps: list[_ScriptStep] = []
+        for step, action in enumerate(self.sequence):
+            action_type = cv.determine_script_action(action)
+            steps.append(
+                _ScriptStep(str(step), action_type, f"_async_{action_type}_step")
+            )
+        return steps
+
+    def _get_static_service_params(self, step: int) -> service.ServiceParams | None:
+        """Return the parameters of a service call step without templates."""
+        if step not in self._static_service_params:
+            self._static_service_params[
+                step
+            ] = service.async_prepare_static_call_from_config(
+                self._hass, self.sequence[step]
+            )
+        return self._static_service_params[step]
+
     def _prep_repeat_script(self, step: int) -> Script:
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
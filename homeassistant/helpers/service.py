@@ -9,7 +9,7 @@ from enum import Enum
 from functools import cache, partial
 import logging
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, TypeVar, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict, TypeGuard, TypeVar, cast
 
 import voluptuous as vol
 
@@ -30,12 +30,14 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -62,6 +64,7 @@ from .typing import ConfigType, TemplateVarsType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import BulkServiceHandler, EntityPlatform
 
     _EntityT = TypeVar("_EntityT", bound=Entity)
 
@@ -72,6 +75,11 @@ _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
 ALL_SERVICE_DESCRIPTIONS_CACHE = "all_service_descriptions_cache"
+DATA_TARGET_RESOLUTION_CACHE = "service_target_resolution_cache"
+
+# Maximum number of device and area selections kept in the target resolution
+# cache
+MAX_TARGET_RESOLUTION_CACHE_SIZE = 256
 
 
 @cache
@@ -388,6 +396,47 @@ def async_prepare_call_from_config(
     }
 
 
+@callback
+def async_prepare_static_call_from_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ServiceParams | None:
+    """Prepare to call a service based on a config hash without templates.
+
+    Returns None if the parameters of the call can change between calls,
+    because the config contains templates or entity registry ids, or if the
+    config is invalid. The returned parameters are shared, callers should
+    deep copy the service data and target before calling the service.
+    """
+    if any(
+        template.is_complex(config[conf])
+        for conf in (
+            CONF_SERVICE,
+            CONF_SERVICE_TEMPLATE,
+            CONF_TARGET,
+            CONF_SERVICE_DATA,
+            CONF_SERVICE_DATA_TEMPLATE,
+        )
+        if conf in config
+    ):
+        return None
+
+    if (
+        CONF_TARGET in config
+        and CONF_ENTITY_ID in config[CONF_TARGET]
+        and not all(
+            valid_entity_id(entity_id)
+            or entity_id in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE)
+            for entity_id in cv.ensure_list(config[CONF_TARGET][CONF_ENTITY_ID])
+        )
+    ):
+        return None
+
+    try:
+        return async_prepare_call_from_config(hass, config)
+    except HomeAssistantError:
+        return None
+
+
 @bind_hass
 def extract_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
@@ -475,61 +524,143 @@ def async_extract_referenced_entity_ids(
     if not selector.device_ids and not selector.area_ids:
         return selected
 
+    resolved = _async_get_target_resolution_cache(hass).async_resolve(
+        selector.device_ids, selector.area_ids
+    )
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    return selected
+
+
+class _ResolvedTarget(NamedTuple):
+    """Devices and entities referenced by a device and area selection."""
+
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+    referenced_devices: frozenset[str]
+    indirectly_referenced: frozenset[str]
+
+
+def _async_resolve_target(
+    hass: HomeAssistant, device_ids: set[str], area_ids: set[str]
+) -> _ResolvedTarget:
+    """Resolve the devices and entities referenced by devices and areas."""
     ent_reg = entity_registry.async_get(hass)
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
-    for device_id in selector.device_ids:
-        if device_id not in dev_reg.devices:
-            selected.missing_devices.add(device_id)
-
-    for area_id in selector.area_ids:
-        if area_id not in area_reg.areas:
-            selected.missing_areas.add(area_id)
+    missing_devices = {
+        device_id for device_id in device_ids if device_id not in dev_reg.devices
+    }
+    missing_areas = {area_id for area_id in area_ids if area_id not in area_reg.areas}
 
     # Find devices for targeted areas
-    selected.referenced_devices.update(selector.device_ids)
+    referenced_devices = set(device_ids)
 
-    if selector.area_ids:
+    if area_ids:
         for device_entry in dev_reg.devices.values():
-            if device_entry.area_id in selector.area_ids:
-                selected.referenced_devices.add(device_entry.id)
-
-    if not selector.area_ids and not selected.referenced_devices:
-        return selected
-
-    entities = ent_reg.entities
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selector.area_ids
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
+            if device_entry.area_id in area_ids:
+                referenced_devices.add(device_entry.id)
+
+    indirectly_referenced: set[str] = set()
+    if area_ids or referenced_devices:
+        entities = ent_reg.entities
+        # Add indirectly referenced by area
+        indirectly_referenced.update(
+            entry.entity_id
+            for area_id in area_ids
+            # The entity's area matches a targeted area
+            for entry in entities.get_entries_for_area_id(area_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if entry.entity_category is None and entry.hidden_by is None
+        )
+        # Add indirectly referenced by device
+        indirectly_referenced.update(
+            entry.entity_id
+            for device_id in referenced_devices
+            for entry in entities.get_entries_for_device_id(device_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if (
+                entry.entity_category is None
+                and entry.hidden_by is None
+                and (
+                    # The entity's device matches a device referenced
+                    # by an area and the entity
+                    # has no explicitly set area
+                    not entry.area_id
+                    # The entity's device matches a targeted device
+                    or device_id in device_ids
+                )
             )
         )
+
+    return _ResolvedTarget(
+        frozenset(missing_devices),
+        frozenset(missing_areas),
+        frozenset(referenced_devices),
+        frozenset(indirectly_referenced),
     )
-    return selected
+
+
+class _TargetResolutionCache:
+    """Cache the devices and entities referenced by device and area targets.
+
+    The cache is keyed by the targeted devices and areas, and is cleared
+    whenever the area, device or entity registry is updated.
+    """
+
+    __slots__ = ("hass", "_cache")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._cache: dict[tuple[frozenset[str], frozenset[str]], _ResolvedTarget] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Clear the cache when a registry is updated."""
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        ):
+            self.hass.bus.async_listen(
+                event_type, self._async_registry_updated, run_immediately=True
+            )
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Clear the cache."""
+        self._cache.clear()
+
+    @callback
+    def async_resolve(
+        self, device_ids: set[str], area_ids: set[str]
+    ) -> _ResolvedTarget:
+        """Return the devices and entities referenced by devices and areas."""
+        key = (frozenset(device_ids), frozenset(area_ids))
+        if (resolved := self._cache.get(key)) is not None:
+            return resolved
+        resolved = _async_resolve_target(self.hass, device_ids, area_ids)
+        cache = self._cache
+        if len(cache) >= MAX_TARGET_RESOLUTION_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = resolved
+        return resolved
+
+
+@callback
+def _async_get_target_resolution_cache(hass: HomeAssistant) -> _TargetResolutionCache:
+    """Return the target resolution cache."""
+    cache: _TargetResolutionCache | None = hass.data.get(DATA_TARGET_RESOLUTION_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_TARGET_RESOLUTION_CACHE] = _TargetResolutionCache(hass)
+        cache.async_setup()
+    return cache
 
 
 @bind_hass
@@ -817,7 +948,7 @@ def _get_permissible_entity_candidates(
 
 
 @bind_hass
-async def entity_service_call(
+async def entity_service_call(  # noqa: C901
     hass: HomeAssistant,
     registered_entities: dict[str, Entity],
     func: str | HassJob,
@@ -902,7 +1033,11 @@ async def entity_service_call(
             )
         return None
 
-    if len(entities) == 1:
+    bulk_calls: list[tuple[BulkServiceHandler, list[Entity]]] = []
+    if isinstance(func, str) and not return_response and len(entities) > 1:
+        bulk_calls, entities = _async_split_bulk_entity_calls(entities, func)
+
+    if len(entities) == 1 and not bulk_calls:
         # Single entity case avoids creating task
         entity = entities[0]
         single_response = await _handle_entity_call(
@@ -924,6 +1059,12 @@ async def entity_service_call(
             )
             for entity in entities
         ],
+        *[
+            _handle_bulk_entity_call(
+                handler, bulk_entities, cast(dict[str, Any], data), call.context
+            )
+            for handler, bulk_entities in bulk_calls
+        ],
         return_exceptions=True,
     )
 
@@ -932,6 +1073,17 @@ async def entity_service_call(
         if isinstance(result, BaseException):
             raise result from None
         response_data[entity.entity_id] = result
+    for result in results[len(entities) :]:
+        if isinstance(result, BaseException):
+            raise result from None
+
+    # The states of the entities of bulk calls are written in one pass once
+    # all handlers have returned, polling entities are updated below
+    for _, bulk_entities in bulk_calls:
+        for entity in bulk_entities:
+            if not entity.should_poll:
+                entity.async_write_ha_state()
+        entities.extend(bulk_entities)
 
     tasks: list[asyncio.Task[None]] = []
 
@@ -953,6 +1105,51 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+@callback
+def _async_split_bulk_entity_calls(
+    entities: list[Entity], func: str
+) -> tuple[list[tuple[BulkServiceHandler, list[Entity]]], list[Entity]]:
+    """Split the entities of platforms with a bulk handler for the entity method.
+
+    Returns the bulk handlers with their entities, and the other entities.
+    """
+    bulk_entities: dict[EntityPlatform, list[Entity]] = {}
+    other_entities: list[Entity] = []
+    for entity in entities:
+        if (platform := entity.platform) is not None and (
+            func in platform.bulk_service_handlers
+        ):
+            bulk_entities.setdefault(platform, []).append(entity)
+        else:
+            other_entities.append(entity)
+
+    bulk_calls: list[tuple[BulkServiceHandler, list[Entity]]] = []
+    for platform, platform_entities in bulk_entities.items():
+        if len(platform_entities) == 1:
+            # A single entity is called the usual way
+            other_entities.append(platform_entities[0])
+        else:
+            bulk_calls.append((platform.bulk_service_handlers[func], platform_entities))
+    return bulk_calls, other_entities
+
+
+async def _handle_bulk_entity_call(
+    handler: BulkServiceHandler,
+    entities: list[Entity],
+    data: dict[str, Any],
+    context: Context,
+) -> None:
+    """Call a bulk handler for the entities of a platform.
+
+    The entities share the parallel updates semaphore of their platform, so
+    the handler takes one slot of it, like a single entity method call.
+    """
+    for entity in entities:
+        entity.async_set_context(context)
+
+    await entities[0].async_request_call(handler(entities, data))
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -1065,10 +1262,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in reg.entities.get_entries_for_platform(domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
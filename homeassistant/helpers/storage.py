@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Hashable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+import secrets
+from typing import TYPE_CHECKING, Any, Generic, TypeGuard, TypeVar, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -25,9 +26,10 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
 
 from . import json as json_helper
+from .json import json_bytes, json_fragment
 
 if TYPE_CHECKING:
     from functools import cached_property
@@ -44,6 +46,10 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+# The append log is compacted into the snapshot once it grows larger than
+# this fraction of the snapshot, and when Home Assistant stops.
+APPEND_LOG_MAX_SIZE_FRACTION = 0.1
+
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -88,6 +94,277 @@ async def async_migrator(
     return config
 
 
+class _AppendLog:
+    """Log of the changes made to a store since its last snapshot.
+
+    The snapshot is the regular storage file with a token identifying its
+    log. Every save appends one line to the log with the top level values
+    that changed. Lists of objects with an id are diffed by id, so updating
+    a single registry entry only appends that entry. When the stored data
+    is a list, its items are diffed by the id returned by item_id, and the
+    snapshot is written on every save if there is no item_id.
+
+    The state of the last written data is kept as hashes of the serialized
+    values. JSON fragments are immutable, so they are kept as is and an
+    unchanged fragment is detected without serializing it. This class is
+    only used from executor jobs that are serialized by the write lock of
+    the store.
+    """
+
+    __slots__ = (
+        "path",
+        "item_id",
+        "token",
+        "version",
+        "hashes",
+        "snapshot_size",
+        "log_size",
+        "entries",
+    )
+
+    def __init__(self, path: str, item_id: Callable[[Any], Hashable] | None) -> None:
+        """Initialize the log."""
+        self.path = path
+        self.item_id = item_id
+        self.token: str | None = None
+        self.version: tuple[Any, Any] | None = None
+        self.hashes: dict[Any, Any] = {}
+        self.snapshot_size = 0
+        self.log_size = 0
+        self.entries = 0
+
+    def load(self, snapshot_path: str, snapshot: dict[str, Any]) -> None:
+        """Replay the log on a loaded snapshot."""
+        self.entries = 0
+        token = snapshot.pop("log_id", None)
+        data = snapshot.get("data")
+        try:
+            with open(self.path, "rb") as file:
+                log = file.read()
+            self.snapshot_size = os.path.getsize(snapshot_path)
+        except FileNotFoundError:
+            return
+        lines = log.split(b"\n")
+        try:
+            header = json_util.json_loads_object(lines[0])
+        except ValueError:
+            header = {}
+        if token is None or header.get("log_id") != token or not self._supports(data):
+            # The snapshot was written after the log, or the log was never
+            # started, the log is reset with the next snapshot
+            _LOGGER.debug("Ignoring append log %s of another snapshot", self.path)
+            return
+        entries = 0
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                changes = json_util.json_loads_array(line)
+            except ValueError:
+                # Writing the line was interrupted, changes appended after
+                # it would be lost so the next save writes a snapshot
+                _LOGGER.warning("Ignoring incomplete change in %s", self.path)
+                return
+            _apply_changes(data, changes, self.item_id)
+            entries += 1
+        self.entries = entries
+        self.token = token
+        self.version = (snapshot.get("version"), snapshot.get("minor_version", 1))
+        self.log_size = len(log)
+        self.hashes = _data_hashes(data, self.item_id)
+
+    def _supports(self, stored: Any) -> TypeGuard[dict[str, Any] | list[Any]]:
+        """Return if changes to the stored data can be appended."""
+        return isinstance(stored, dict) or (
+            isinstance(stored, list) and self.item_id is not None
+        )
+
+    def append(self, data: dict[str, Any], private: bool, sync: bool) -> bool:
+        """Append the changes to the log.
+
+        Returns False if the snapshot needs to be written instead.
+        """
+        if (
+            self.token is None
+            or self.version != (data["version"], data["minor_version"])
+            or not self._supports(stored := data["data"])
+        ):
+            return False
+        try:
+            changes = self._changes(stored)
+        except TypeError:
+            # Let writing the snapshot report the data that can't be serialized
+            return False
+        if not changes:
+            return True
+        line = json_bytes(changes) + b"\n"
+        if self.log_size + len(line) > (
+            self.snapshot_size * APPEND_LOG_MAX_SIZE_FRACTION
+        ):
+            # The hashes are computed again when the snapshot is written
+            return False
+        fd = os.open(
+            self.path,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o600 if private else 0o644,
+        )
+        try:
+            os.write(fd, line)
+            if sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        self.log_size += len(line)
+        self.entries += 1
+        return True
+
+    def _changes(self, stored: dict[str, Any] | list[Any]) -> list[Any]:
+        """Return the changes since the last write and update the hashes."""
+        hashes = self.hashes
+        if isinstance(stored, list):
+            new, upserts, removed = _diff_items(
+                hashes, stored, cast(Callable[[Any], Hashable], self.item_id)
+            )
+            self.hashes = new
+            return [upserts, removed] if upserts or removed else []
+        changes: list[list[Any]] = []
+        for key, value in stored.items():
+            if isinstance(value, json_fragment):
+                if hashes.get(key) is not value:
+                    changes.append([key, value])
+                    hashes[key] = value
+                continue
+            if _is_id_list(value):
+                old = hashes.get(key)
+                new, upserts, removed = _diff_items(
+                    old if isinstance(old, dict) else {}, value, _item_id
+                )
+                if upserts or removed or key not in hashes:
+                    changes.append([key, upserts, removed])
+                hashes[key] = new
+                continue
+            serialized = json_bytes(value)
+            if hashes.get(key) != (value_hash := hash(serialized)):
+                changes.append([key, json_fragment(serialized)])
+                hashes[key] = value_hash
+        for key in [key for key in hashes if key not in stored]:
+            changes.append([key])
+            del hashes[key]
+        return changes
+
+    def snapshot(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the snapshot to write for the data."""
+        self.token = None
+        return {**data, "log_id": secrets.token_hex(8)}
+
+    def start(
+        self, snapshot_path: str, snapshot: dict[str, Any], private: bool
+    ) -> None:
+        """Start a new log after the snapshot was written.
+
+        The log is reset after writing the snapshot, so an interrupted
+        write leaves a log that does not match the snapshot and is ignored.
+        """
+        header = json_bytes({"log_id": snapshot["log_id"]}) + b"\n"
+        write_utf8_file_atomic(self.path, header, private, mode="wb")
+        self.token = snapshot["log_id"]
+        self.version = (snapshot["version"], snapshot["minor_version"])
+        self.hashes = _data_hashes(snapshot["data"], self.item_id)
+        self.snapshot_size = os.path.getsize(snapshot_path)
+        self.log_size = len(header)
+        self.entries = 0
+
+
+def _is_id_list(value: Any) -> bool:
+    """Return if a value is a list of objects with an id."""
+    return isinstance(value, list) and all(
+        isinstance(item, dict) and "id" in item for item in value
+    )
+
+
+def _item_id(item: dict[str, Any]) -> Any:
+    """Return the id of an item of a list of objects with an id."""
+    return item["id"]
+
+
+def _item_hashes(
+    items: list[Any], item_id: Callable[[Any], Hashable]
+) -> dict[Any, int]:
+    """Return the hashes of the serialized items of a list by id."""
+    return {item_id(item): hash(json_bytes(item)) for item in items}
+
+
+def _diff_items(
+    old: dict[Any, int], items: list[Any], item_id: Callable[[Any], Hashable]
+) -> tuple[dict[Any, int], list[json_fragment], list[Any]]:
+    """Return the hashes of the items and the items added or removed since old."""
+    new: dict[Any, int] = {}
+    upserts: list[json_fragment] = []
+    for item in items:
+        serialized = json_bytes(item)
+        new[key := item_id(item)] = item_hash = hash(serialized)
+        if old.get(key) != item_hash:
+            upserts.append(json_fragment(serialized))
+    removed = [key for key in old if key not in new]
+    return new, upserts, removed
+
+
+def _data_hashes(
+    data: Any, item_id: Callable[[Any], Hashable] | None
+) -> dict[Any, Any]:
+    """Return the hashes of the serialized top level values of stored data."""
+    if isinstance(data, list):
+        return _item_hashes(data, item_id) if item_id is not None else {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        key: value
+        if isinstance(value, json_fragment)
+        else _item_hashes(value, _item_id)
+        if _is_id_list(value)
+        else hash(json_bytes(value))
+        for key, value in data.items()
+    }
+
+
+def _apply_items(
+    data: list[Any],
+    upserts: list[Any],
+    removed: list[Any],
+    item_id: Callable[[Any], Hashable],
+) -> list[Any]:
+    """Return the items of a list with items added or removed by id."""
+    items = {item_id(item): item for item in data}
+    for item in upserts:
+        items[item_id(item)] = item
+    for key in removed:
+        items.pop(key, None)
+    return list(items.values())
+
+
+def _apply_changes(
+    data: dict[str, Any] | list[Any],
+    changes: list[Any],
+    item_id: Callable[[Any], Hashable] | None,
+) -> None:
+    """Apply a line of the append log to stored data."""
+    if isinstance(data, list):
+        data[:] = _apply_items(
+            data, changes[0], changes[1], cast(Callable[[Any], Hashable], item_id)
+        )
+        return
+    for change in changes:
+        key = change[0]
+        if len(change) == 1:
+            data.pop(key, None)
+        elif len(change) == 2:
+            data[key] = change[1]
+        else:
+            data[key] = _apply_items(
+                data.get(key) or [], change[1], change[2], _item_id
+            )
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -103,6 +380,8 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        append_log: bool = False,
+        append_log_item_id: Callable[[Any], Hashable] | None = None,
     ) -> None:
         """Initialize storage class."""
         self.version = version
@@ -119,6 +398,9 @@ class Store(Generic[_T]):
         self._atomic_writes = atomic_writes
         self._read_only = read_only
         self._next_write_time = 0.0
+        self._append_log: _AppendLog | None = (
+            _AppendLog(f"{self.path}.log", append_log_item_id) if append_log else None
+        )
 
     @cached_property
     def path(self):
@@ -172,9 +454,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -229,6 +509,8 @@ class Store(Generic[_T]):
                     return None
                 raise
 
+            self._async_ensure_append_log_compaction()
+
             if data == {}:
                 return None
 
@@ -265,6 +547,13 @@ class Store(Generic[_T]):
 
         return stored
 
+    def _load_data(self) -> Any:
+        """Load the stored data and replay the append log."""
+        data = json_util.load_json(self.path)
+        if (append_log := self._append_log) is not None and isinstance(data, dict):
+            append_log.load(self.path, data)
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -358,10 +647,26 @@ class Store(Generic[_T]):
             return
         await self._async_handle_write_data()
 
+    @callback
+    def _async_ensure_append_log_compaction(self) -> None:
+        """Ensure the append log is compacted when Home Assistant stops."""
+        if (append_log := self._append_log) is not None and append_log.entries:
+            self._async_ensure_final_write_listener()
+
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if (append_log := self._append_log) is None:
+            return
+        self._async_cleanup_final_write_listener()
+        async with self._write_lock:
+            if not append_log.entries or self._read_only:
+                return
+            try:
+                await self.hass.async_add_executor_job(self._compact_append_log)
+            except HomeAssistantError as err:
+                _LOGGER.error("Error compacting config for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -387,6 +692,7 @@ class Store(Generic[_T]):
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+            self._async_ensure_append_log_compaction()
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
@@ -395,6 +701,13 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if (append_log := self._append_log) is not None:
+            if append_log.append(data, self._private, self._atomic_writes):
+                _LOGGER.debug("Appended changes for %s to %s", self.key, path)
+                return
+            self._write_snapshot(append_log, path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -404,6 +717,28 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+    def _write_snapshot(
+        self, append_log: _AppendLog, path: str, data: dict[str, Any]
+    ) -> None:
+        """Write a snapshot of the data and start a new append log."""
+        snapshot = append_log.snapshot(data)
+        _LOGGER.debug("Writing snapshot for %s to %s", self.key, path)
+        json_helper.save_json(
+            path,
+            snapshot,
+            self._private,
+            encoder=self._encoder,
+            atomic_writes=self._atomic_writes,
+        )
+        append_log.start(path, snapshot, self._private)
+
+    def _compact_append_log(self) -> None:
+        """Write the snapshot with the changes of the append log applied."""
+        append_log = cast(_AppendLog, self._append_log)
+        data = self._load_data()
+        if append_log.entries:
+            self._write_snapshot(append_log, self.path, data)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -415,3 +750,8 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if (append_log := self._append_log) is not None:
+            append_log.token = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, append_log.path)
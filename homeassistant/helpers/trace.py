@@ -6,6 +6,7 @@ from collections import deque
 from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
+from datetime import datetime
 from functools import wraps
 from typing import Any, TypeVar, TypeVarTuple
 
@@ -30,6 +31,7 @@ class TraceElement:
         "_result",
         "reuse_by_child",
         "_timestamp",
+        "_timestamp_finish",
         "_variables",
     )
 
@@ -42,9 +44,13 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
+        self._timestamp_finish: datetime | None = None
 
-        self._last_variables = variables_cv.get() or {}
-        self.update_variables(variables)
+        self._last_variables: dict[str, Any] = {}
+        self._variables: dict[str, Any] = {}
+        if trace_variables_cv.get():
+            self._last_variables = variables_cv.get() or {}
+            self.update_variables(variables)
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -68,8 +74,21 @@ class TraceElement:
         old_result = self._result or {}
         self._result = {**old_result, **kwargs}
 
+    def set_finished(self) -> None:
+        """Set finish time."""
+        self._timestamp_finish = dt_util.utcnow()
+
+    @property
+    def duration(self) -> float | None:
+        """Return how long the traced step took, in seconds."""
+        if self._timestamp_finish is None:
+            return None
+        return (self._timestamp_finish - self._timestamp).total_seconds()
+
     def update_variables(self, variables: TemplateVarsType) -> None:
         """Update variables."""
+        if not trace_variables_cv.get():
+            return
         if variables is None:
             variables = {}
         last_variables = self._last_variables
@@ -115,6 +134,8 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# Whether TraceElements capture the changed variables
+trace_variables_cv: ContextVar[bool] = ContextVar("trace_variables_cv", default=True)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Iterable
 from contextlib import suppress
+from contextvars import ContextVar
 from dataclasses import dataclass
 import functools as ft
 import importlib
@@ -28,7 +29,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -47,6 +48,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 else:
     from .backports.functools import cached_property
@@ -101,6 +103,12 @@ DATA_INTEGRATIONS = "integrations"
 DATA_MISSING_PLATFORMS = "missing_platforms"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 DATA_PRELOAD_PLATFORMS = "preload_platforms"
+DATA_MANIFEST_CACHE = "integration_manifest_cache"
+MANIFEST_CACHE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_VERSION = 1
+DATA_IMPORT_PROFILE = "integration_import_profile"
+IMPORT_PROFILE_KEY = "core.import_profile"
+IMPORT_PROFILE_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -315,6 +323,388 @@ async def async_get_custom_components(
     return comps_or_future
 
 
+class _ManifestCache:
+    """Manifests of built in integrations and resolved dependencies.
+
+    The cache is persisted between restarts. Manifests are valid for the
+    Home Assistant version they were read with, dependencies also depend
+    on the installed custom integrations. In development versions, manifests
+    which changed on disk are dropped on load, with the resolved dependencies
+    of every integration depending on them.
+    """
+
+    __slots__ = ("store", "key", "check_files", "manifests", "dependencies", "dirty")
+
+    def __init__(self, store: Store[dict[str, Any]], key: list[Any]) -> None:
+        """Initialize the cache."""
+        self.store = store
+        self.key = key
+        # Built in manifests can change without a version bump in development
+        self.check_files = "dev" in __version__
+        self.manifests: dict[str, dict[str, Any]] = {}
+        self.dependencies: dict[str, list[str]] = {}
+        self.dirty = False
+
+    def load(self, data: dict[str, Any] | None) -> None:
+        """Load the cache from the stored data.
+
+        This method needs to run in an executor.
+        """
+        if data is None or data.get("ha_version") != __version__:
+            return
+        manifests = cast(dict[str, dict[str, Any]], data["manifests"])
+        dependencies: dict[str, list[str]] = {}
+        if data.get("key") == self.key:
+            dependencies = cast(dict[str, list[str]], data["dependencies"])
+        if self.check_files:
+            manifests = {
+                domain: cached
+                for domain, cached in manifests.items()
+                if _manifest_unchanged(cached)
+            }
+            # A closure is only valid if none of the manifests in it changed
+            dependencies = {
+                domain: domain_dependencies
+                for domain, domain_dependencies in dependencies.items()
+                if domain in manifests and manifests.keys() >= set(domain_dependencies)
+            }
+        self.manifests = manifests
+        self.dependencies = dependencies
+
+    async def async_save(self) -> None:
+        """Save the cache if it changed."""
+        if not self.dirty:
+            return
+        self.dirty = False
+        await self.store.async_save(
+            {
+                "ha_version": __version__,
+                "key": self.key,
+                "manifests": self.manifests,
+                "dependencies": self.dependencies,
+            }
+        )
+
+    def get_integration(self, hass: HomeAssistant, domain: str) -> Integration | None:
+        """Return a built in integration from the cache."""
+        if (cached := self.manifests.get(domain)) is None:
+            return None
+        file_path = pathlib.Path(cached["file_path"])
+        top_level_files = cached["top_level_files"]
+        integration = Integration(
+            hass,
+            cached["pkg_path"],
+            file_path,
+            cast(Manifest, dict(cached["manifest"])),
+            None if top_level_files is None else set(top_level_files),
+        )
+        if not integration.import_executor:
+            _LOGGER.warning(IMPORT_EVENT_LOOP_WARNING, integration.domain)
+        return integration
+
+    def manifest_entry(self, integration: Integration) -> dict[str, Any]:
+        """Return the cache entry of a built in integration resolved from disk.
+
+        This method needs to run in an executor.
+        """
+        top_level_files = (
+            None
+            if integration.integration_type == "virtual"
+            else sorted(integration._top_level_files)  # pylint: disable=protected-access
+        )
+        return {
+            "pkg_path": integration.pkg_path,
+            "file_path": str(integration.file_path),
+            "manifest": integration.manifest,
+            "top_level_files": top_level_files,
+            "mtimes": _manifest_mtimes(integration.file_path)
+            if self.check_files
+            else None,
+        }
+
+    @callback
+    def async_add_manifests(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Add the entries of built in integrations resolved from disk."""
+        self.manifests.update(entries)
+        self.dirty = True
+
+    @callback
+    def async_add_dependencies(self, domain: str, dependencies: set[str]) -> None:
+        """Add the resolved dependencies of an integration."""
+        self.dependencies[domain] = sorted(dependencies)
+        self.dirty = True
+
+
+def _manifest_mtimes(file_path: pathlib.Path) -> list[int]:
+    """Return the modification times of an integration directory and manifest."""
+    return [
+        file_path.stat().st_mtime_ns,
+        (file_path / "manifest.json").stat().st_mtime_ns,
+    ]
+
+
+def _manifest_unchanged(cached: dict[str, Any]) -> bool:
+    """Return if the manifest of a cache entry did not change on disk."""
+    try:
+        return bool(
+            cached["mtimes"] == _manifest_mtimes(pathlib.Path(cached["file_path"]))
+        )
+    except OSError:
+        return False
+
+
+def _custom_components_key(hass: HomeAssistant) -> list[Any]:
+    """Return a key that changes when custom integrations change.
+
+    This method needs to run in an executor.
+    """
+    if hass.config.recovery_mode or hass.config.safe_mode:
+        return ["builtin"]
+    try:
+        import custom_components  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return []
+    key: list[Any] = []
+    for path in custom_components.__path__:
+        for entry in sorted(os.scandir(path), key=lambda entry: entry.name):
+            if not entry.is_dir():
+                continue
+            try:
+                manifest_mtime = os.stat(
+                    os.path.join(entry.path, "manifest.json")
+                ).st_mtime_ns
+            except OSError:
+                manifest_mtime = None
+            key.append([entry.path, entry.stat().st_mtime_ns, manifest_mtime])
+    return key
+
+
+async def _async_load_store(
+    hass: HomeAssistant, version: int, key: str
+) -> tuple[Store[dict[str, Any]], dict[str, Any] | None]:
+    """Return a store of the loader and its data."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store: Store[dict[str, Any]] = Store(hass, version, key)
+    try:
+        data = await store.async_load()
+    except Exception as err:  # pylint: disable=broad-except
+        # The stored data is only a cache, start without it
+        _LOGGER.debug("Ignoring stored %s: %s", key, err)
+        data = None
+    return store, data
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the persisted integration manifests and dependencies."""
+    store, data = await _async_load_store(
+        hass, MANIFEST_CACHE_VERSION, MANIFEST_CACHE_KEY
+    )
+
+    def _load_cache() -> _ManifestCache:
+        """Load the cache."""
+        cache = _ManifestCache(store, _custom_components_key(hass))
+        cache.load(data)
+        return cache
+
+    hass.data[DATA_MANIFEST_CACHE] = await hass.async_add_executor_job(_load_cache)
+
+
+async def async_save_manifest_cache(hass: HomeAssistant) -> None:
+    """Persist the integration manifests and dependencies if they changed."""
+    cache: _ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+    if cache is not None:
+        await cache.async_save()
+
+
+# Set in the task importing the modules of the previous start ahead of need
+_PREWARMING: ContextVar[bool] = ContextVar("import_prewarming", default=False)
+
+# Components are profiled as (domain, None) and platforms as (domain, platform)
+_ImportKey = tuple[str, str | None]
+
+
+class _ImportProfile:
+    """Profile of the modules imported on the import executor during startup.
+
+    The profile records which components and platforms setup asked for, in
+    order, and how long importing them took. On the next start the modules
+    are imported again in that order ahead of need.
+    """
+
+    __slots__ = (
+        "store",
+        "previous",
+        "previous_waited",
+        "recording",
+        "demanded",
+        "durations",
+        "prewarmed",
+        "waited",
+        "report",
+    )
+
+    def __init__(self, store: Store[dict[str, Any]]) -> None:
+        """Initialize the profile."""
+        self.store = store
+        self.previous: list[tuple[str, str | None, float]] = []
+        self.previous_waited: float | None = None
+        self.recording = True
+        self.demanded: dict[_ImportKey, None] = {}
+        self.durations: dict[_ImportKey, float] = {}
+        self.prewarmed: set[_ImportKey] = set()
+        self.waited = 0.0
+        self.report: dict[str, Any] | None = None
+
+    @callback
+    def async_load(self, data: dict[str, Any] | None) -> None:
+        """Load the profile of the previous start from the stored data."""
+        if data is None or data.get("ha_version") != __version__:
+            return
+        imports = cast(list[list[Any]], data["imports"])
+        self.previous = [(entry[0], entry[1], entry[2]) for entry in imports]
+        self.previous_waited = cast(float, data["waited"])
+
+    async def async_save(self) -> None:
+        """Save the profile of this start."""
+        durations = self.durations
+        await self.store.async_save(
+            {
+                "ha_version": __version__,
+                "imports": [
+                    [*key, round(durations[key], 4)]
+                    for key in self.demanded
+                    if key in durations
+                ],
+                "waited": round(self.waited, 4),
+            }
+        )
+
+    @callback
+    def async_demand(self, key: _ImportKey) -> None:
+        """Record that setup needs a module."""
+        if self.recording and key not in self.demanded and not _PREWARMING.get():
+            self.demanded[key] = None
+
+    @callback
+    def async_imported(self, keys: list[_ImportKey], seconds: float) -> None:
+        """Record modules imported on the import executor."""
+        if not self.recording:
+            return
+        seconds /= len(keys)
+        prewarming = _PREWARMING.get()
+        for key in keys:
+            self.durations[key] = seconds
+            if prewarming:
+                self.prewarmed.add(key)
+            else:
+                self.waited += seconds
+
+    @callback
+    def async_finish(self) -> dict[str, Any]:
+        """Stop recording and return the report of this start."""
+        self.recording = False
+        durations = self.durations
+        modules = [key for key in self.demanded if key in durations]
+        prewarmed = [key for key in modules if key in self.prewarmed]
+        self.report = {
+            "modules": len(modules),
+            "prewarmed": len(prewarmed),
+            "seconds_saved": sum(durations[key] for key in prewarmed),
+            "seconds_waited": self.waited,
+            "previous_seconds_waited": self.previous_waited,
+        }
+        return self.report
+
+
+async def async_load_import_profile(hass: HomeAssistant) -> None:
+    """Load the import profile of the previous start and start recording."""
+    if hass.config.recovery_mode or hass.config.safe_mode:
+        return
+    store, data = await _async_load_store(
+        hass, IMPORT_PROFILE_VERSION, IMPORT_PROFILE_KEY
+    )
+    profile = _ImportProfile(store)
+    profile.async_load(data)
+    hass.data[DATA_IMPORT_PROFILE] = profile
+
+
+async def async_prewarm_imports(hass: HomeAssistant) -> None:
+    """Import the modules setup needed on the previous start ahead of need.
+
+    Modules are imported one at a time in the order setup asked for them,
+    so imports setup is waiting for never queue behind more than one of
+    them. Only integrations importing their code in the executor are
+    pre-imported and an import that fails is left for setup to handle.
+    """
+    profile: _ImportProfile | None = hass.data.get(DATA_IMPORT_PROFILE)
+    if profile is None or not profile.previous:
+        return
+    _PREWARMING.set(True)
+    integrations = await async_get_integrations(
+        hass, {domain for domain, _, _ in profile.previous}
+    )
+    # Platforms of the same integration imported in a row are imported together
+    batches: list[tuple[str, list[str] | None]] = []
+    for domain, platform, _ in profile.previous:
+        if platform is None:
+            batches.append((domain, None))
+        elif batches and batches[-1][0] == domain and (last := batches[-1][1]):
+            last.append(platform)
+        else:
+            batches.append((domain, [platform]))
+    for domain, platforms in batches:
+        if not profile.recording:
+            return
+        integration = integrations.get(domain)
+        if not isinstance(integration, Integration) or not integration.import_executor:
+            continue
+        try:
+            if platforms is None:
+                await integration.async_get_component()
+            else:
+                await integration.async_get_platforms(platforms)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to import %s ahead of need: %s", domain, err)
+
+
+@callback
+def async_finish_import_profile(hass: HomeAssistant) -> None:
+    """Stop recording the import profile and log the report of this start."""
+    profile: _ImportProfile | None = hass.data.get(DATA_IMPORT_PROFILE)
+    if profile is None:
+        return
+    report = profile.async_finish()
+    _LOGGER.info(
+        (
+            "Imported %s modules during startup, %s of them ahead of need saving"
+            " %.2fs; setup waited %.2fs for imports (previous start: %s)"
+        ),
+        report["modules"],
+        report["prewarmed"],
+        report["seconds_saved"],
+        report["seconds_waited"],
+        "unknown"
+        if report["previous_seconds_waited"] is None
+        else f"{report['previous_seconds_waited']:.2f}s",
+    )
+
+
+async def async_save_import_profile(hass: HomeAssistant) -> None:
+    """Persist the import profile of this start."""
+    profile: _ImportProfile | None = hass.data.get(DATA_IMPORT_PROFILE)
+    if profile is not None and profile.report is not None:
+        await profile.async_save()
+
+
+@callback
+def async_get_import_report(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the report of the imports done during startup."""
+    profile: _ImportProfile | None = hass.data.get(DATA_IMPORT_PROFILE)
+    return None if profile is None else profile.report
+
+
 async def async_get_config_flows(
     hass: HomeAssistant,
     type_filter: Literal["device", "helper", "hub", "service"] | None = None,
@@ -737,9 +1127,15 @@ class Integration:
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
 
+        manifest_cache: _ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
             self._all_dependencies: set[str] | None = None
+            if manifest_cache and (
+                dependencies := manifest_cache.dependencies.get(self.domain)
+            ):
+                self._all_dependencies_resolved = True
+                self._all_dependencies = set(dependencies)
         else:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
@@ -755,6 +1151,8 @@ class Integration:
         ]
         self._missing_platforms_cache = missing_platforms_cache
         self._top_level_files = top_level_files or set()
+        import_profile: _ImportProfile | None = hass.data.get(DATA_IMPORT_PROFILE)
+        self._import_profile = import_profile
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @cached_property
@@ -939,6 +1337,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if manifest_cache := self.hass.data.get(DATA_MANIFEST_CACHE):
+                manifest_cache.async_add_dependencies(self.domain, dependencies)
 
         return self._all_dependencies_resolved
 
@@ -950,11 +1350,17 @@ class Integration:
         otherwise it will load it in the event loop.
         """
         domain = self.domain
+        if (import_profile := self._import_profile) and import_profile.recording:
+            import_profile.async_demand((domain, None))
+
         if domain in (cache := self._cache):
             return cache[domain]
 
         if self._component_future:
-            return await self._component_future
+            try:
+                return await self._component_future
+            except _PrewarmImportFailed:
+                return await self.async_get_component()
 
         if debug := _LOGGER.isEnabledFor(logging.DEBUG):
             start = time.perf_counter()
@@ -978,10 +1384,17 @@ class Integration:
         self._component_future = self.hass.loop.create_future()
         try:
             try:
+                import_start = time.perf_counter()
                 comp = await self.hass.async_add_import_executor_job(
                     self._get_component, True
                 )
+                if import_profile:
+                    import_profile.async_imported(
+                        [(domain, None)], time.perf_counter() - import_start
+                    )
             except ImportError as ex:
+                if _PREWARMING.get():
+                    raise
                 load_executor = False
                 _LOGGER.debug(
                     "Failed to import %s in executor", self.domain, exc_info=ex
@@ -991,7 +1404,12 @@ class Integration:
                 comp = self._get_component()
             self._component_future.set_result(comp)
         except BaseException as ex:
-            self._component_future.set_exception(ex)
+            if isinstance(ex, ImportError) and _PREWARMING.get():
+                # Callers waiting for the import should not fail with the
+                # error of an import ahead of need
+                self._component_future.set_exception(_PrewarmImportFailed())
+            else:
+                self._component_future.set_exception(ex)
             with suppress(BaseException):
                 # Set the exception retrieved flag on the future since
                 # it will never be retrieved unless there
@@ -1080,6 +1498,10 @@ class Integration:
         in_progress_imports: dict[str, asyncio.Future[ModuleType]] = {}
         import_futures: list[tuple[str, asyncio.Future[ModuleType]]] = []
 
+        if (import_profile := self._import_profile) and import_profile.recording:
+            for platform_name in platform_names:
+                import_profile.async_demand((domain, platform_name))
+
         for platform_name in platform_names:
             full_name = f"{domain}.{platform_name}"
             if platform := self._get_platform_cached_or_raise(full_name):
@@ -1111,12 +1533,20 @@ class Integration:
             try:
                 if load_executor_platforms:
                     try:
+                        import_start = time.perf_counter()
                         platforms.update(
                             await self.hass.async_add_import_executor_job(
                                 self._load_platforms, platform_names
                             )
                         )
+                        if import_profile:
+                            import_profile.async_imported(
+                                [(domain, name) for name in load_executor_platforms],
+                                time.perf_counter() - import_start,
+                            )
                     except ImportError as ex:
+                        if _PREWARMING.get():
+                            raise
                         _LOGGER.debug(
                             "Failed to import %s platforms %s in executor",
                             domain,
@@ -1134,6 +1564,14 @@ class Integration:
                     import_future.set_result(platforms[platform_name])
 
             except BaseException as ex:
+                if isinstance(ex, ImportError) and _PREWARMING.get():
+                    # Callers waiting for the import, and later callers, should
+                    # not fail with the error of an import ahead of need
+                    for platform_name in load_executor_platforms:
+                        self._missing_platforms_cache.pop(
+                            f"{domain}.{platform_name}", None
+                        )
+                    ex = _PrewarmImportFailed()
                 for _, import_future in import_futures:
                     import_future.set_exception(ex)
                     with suppress(BaseException):
@@ -1157,8 +1595,14 @@ class Integration:
                     )
 
         if in_progress_imports:
+            retry: list[str] = []
             for platform_name, future in in_progress_imports.items():
-                platforms[platform_name] = await future
+                try:
+                    platforms[platform_name] = await future
+                except _PrewarmImportFailed:
+                    retry.append(platform_name)
+            if retry:
+                platforms.update(await self.async_get_platforms(retry))
 
         return platforms
 
@@ -1273,11 +1717,25 @@ def _version_blocked(
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    manifest_cache: _ManifestCache | None = None,
+    manifest_entries: dict[str, dict[str, Any]] | None = None,
 ) -> dict[str, Integration]:
-    """Resolve multiple integrations from root."""
+    """Resolve multiple integrations from root.
+
+    Integrations are taken from the manifest cache if one is passed, the
+    cache entries of the integrations resolved from disk are added to
+    manifest_entries for the event loop to add them to the cache.
+    """
     integrations: dict[str, Integration] = {}
     for domain in domains:
+        if manifest_cache and (
+            integration := manifest_cache.get_integration(hass, domain)
+        ):
+            integrations[domain] = integration
+            continue
         try:
             integration = Integration.resolve_from_root(hass, root_module, domain)
         except Exception:  # pylint: disable=broad-except
@@ -1285,6 +1743,10 @@ def _resolve_integrations_from_root(
         else:
             if integration:
                 integrations[domain] = integration
+                if manifest_cache and manifest_entries is not None:
+                    manifest_entries[domain] = manifest_cache.manifest_entry(
+                        integration
+                    )
     return integrations
 
 
@@ -1366,9 +1828,18 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_cache: _ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+        manifest_entries: dict[str, dict[str, Any]] = {}
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+            _resolve_integrations_from_root,
+            hass,
+            components,
+            needed,
+            manifest_cache,
+            manifest_entries,
         )
+        if manifest_cache and manifest_entries:
+            manifest_cache.async_add_manifests(manifest_entries)
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -1408,6 +1879,13 @@ class IntegrationNotLoaded(LoaderError):
         self.domain = domain
 
 
+class _PrewarmImportFailed(LoaderError):
+    """Raised to the callers waiting for an import ahead of need that failed.
+
+    They import the module themselves, falling back to the event loop.
+    """
+
+
 class CircularDependency(LoaderError):
     """Raised when a circular dependency is found when resolving components."""
 
@@ -7,11 +7,15 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from ipaddress import ip_network
 import json
 import logging
 from timeit import default_timer as timer
 from typing import TypeVar
 
+from aiohttp import web
+import voluptuous as vol
+
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
@@ -315,6 +319,75 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+async def _run_middleware(middleware, requests, count=10**5):
+    """Run requests through a middleware and print the time per request."""
+
+    async def handler(request):
+        """Handle the request."""
+        return None
+
+    size = len(requests)
+    start = timer()
+    for i in range(count):
+        await middleware(requests[i % size], handler)
+    runtime = timer() - start
+    print(f"Overhead per request: {runtime / count * 10**6:.2f}µs")
+    return runtime
+
+
+@benchmark
+async def http_security_filter(hass):
+    """Run 100k requests through the security filter middleware."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp.test_utils import make_mocked_request
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.http.security_filter import setup_security_filter
+
+    app = web.Application()
+    setup_security_filter(app)
+    urls = [
+        "/api/webhook/d2a9b8c1e5f4",
+        "/api/states/sensor.outside_temperature",
+        "/frontend_latest/chunk.4c9e2d8dc10f77b885b0.js",
+        "/api/history/period?filter_entity_id=sensor.power&minimal_response",
+    ]
+    requests = [make_mocked_request("GET", url) for url in urls]
+    return await _run_middleware(app.middlewares[0], requests)
+
+
+@benchmark
+async def http_forwarded(hass):
+    """Run 100k requests from a trusted proxy through the forwarded middleware."""
+    # pylint: disable-next=import-outside-toplevel
+    from unittest.mock import Mock
+
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp.test_utils import make_mocked_request
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.http.forwarded import async_setup_forwarded
+
+    app = web.Application()
+    async_setup_forwarded(
+        app, True, [ip_network("127.0.0.1"), ip_network("192.168.0.0/16")]
+    )
+    transport = Mock(get_extra_info=Mock(return_value=("127.0.0.1", 8123)))
+    requests = [
+        make_mocked_request(
+            "GET",
+            "/api/states",
+            headers={
+                "X-Forwarded-For": f"203.0.113.{i % 200}, 192.168.1.1",
+                "X-Forwarded-Proto": "https",
+            },
+            transport=transport,
+        )
+        for i in range(200)
+    ]
+    return await _run_middleware(app.middlewares[0], requests)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -358,3 +431,38 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def service_call_schema(hass):
+    """Call a service with an entity service schema 100k times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+
+    schema = cv.make_entity_service_schema(
+        {
+            "brightness": vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+            "transition": vol.All(vol.Coerce(float), vol.Range(min=0, max=6553)),
+            "rgb_color": vol.All(
+                vol.Coerce(tuple), vol.ExactSequence((cv.byte, cv.byte, cv.byte))
+            ),
+        }
+    )
+
+    @core.callback
+    def handle_service(call):
+        """Handle the service call."""
+
+    hass.services.async_register("light", "turn_on", handle_service, schema)
+    count = 10**5
+    payload = {
+        "entity_id": ["light.kitchen", "light.living_room"],
+        "brightness": 128,
+        "transition": 0.1,
+        "rgb_color": [255, 128, 0],
+    }
+
+    start = timer()
+    for _ in range(count):
+        await hass.services.async_call("light", "turn_on", dict(payload))
+    return timer() - start
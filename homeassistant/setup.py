@@ -5,11 +5,12 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
+from enum import StrEnum
 import logging.handlers
 import time
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Any, Final, TypedDict
+from typing import TYPE_CHECKING, Any, Final, TypedDict
 
 from . import config as conf_util, core, loader, requirements
 from .const import (
@@ -32,6 +33,9 @@ from .helpers.typing import ConfigType
 from .util import ensure_unique_string
 from .util.async_ import create_eager_task
 
+if TYPE_CHECKING:
+    from .config_entries import ConfigEntry
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_COMPONENT: Final = "component"
@@ -62,6 +66,14 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_TIMELINE is a SetupTimeline, recording the phases of every
+# setup while Home Assistant is starting.
+DATA_SETUP_TIMELINE = "setup_timeline"
+
+# DATA_CONFIG_ENTRY_SETUP_PROGRESS is a dict [str, ConfigEntrySetupProgress],
+# counting the config entries of each component set up with the component.
+DATA_CONFIG_ENTRY_SETUP_PROGRESS = "config_entry_setup_progress"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
@@ -74,6 +86,22 @@ NOTIFY_FOR_TRANSLATION_KEYS = [
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
+# How long the setup of a component waits for its config entries to be set
+# up. Entries which take longer continue to set up in the background.
+CONFIG_ENTRY_SETUP_MAX_WAIT = 60
+
+
+class SetupPhase(StrEnum):
+    """Phases of setting up an integration."""
+
+    WAIT_DEPENDENCIES = "wait_dependencies"
+    REQUIREMENTS = "requirements"
+    IMPORT = "import"
+    CONFIG_VALIDATION = "config_validation"
+    EXECUTOR_QUEUE = "executor_queue"
+    SETUP = "setup"
+    CONFIG_ENTRY_SETUP = "config_entry_setup"
+
 
 class EventComponentLoaded(TypedDict):
     """EventComponentLoaded data."""
@@ -228,10 +256,17 @@ async def _async_process_dependencies(
             after_dependencies_tasks.keys(),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
+    if timeline := async_get_setup_timeline(hass):
+        timeline.async_add_waits(
+            integration.domain, [*dependencies_tasks, *after_dependencies_tasks]
         )
+    with async_record_setup_phase(
+        hass, integration.domain, SetupPhase.WAIT_DEPENDENCIES
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -294,14 +329,16 @@ async def _async_setup_component(  # noqa: C901
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_record_setup_phase(hass, domain, SetupPhase.IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    integration_config_info = await conf_util.async_process_component_config(
-        hass, config, integration, component
-    )
+    with async_record_setup_phase(hass, domain, SetupPhase.CONFIG_VALIDATION):
+        integration_config_info = await conf_util.async_process_component_config(
+            hass, config, integration, component
+        )
     conf_util.async_handle_component_errors(hass, integration_config_info, integration)
     processed_config = conf_util.async_drop_config_annotations(
         integration_config_info, integration
@@ -373,22 +410,31 @@ async def _async_setup_component(  # noqa: C901
 
         task: Awaitable[bool] | None = None
         result: Any | bool = True
+        executor_submitted = 0.0
+        executor_started: list[float] = []
         try:
             if hasattr(component, "async_setup"):
                 task = component.async_setup(hass, processed_config)
             elif hasattr(component, "setup"):
                 # This should not be replaced with hass.async_add_executor_job because
                 # we don't want to track this task in case it blocks startup.
+                executor_submitted = time.monotonic()
                 task = hass.loop.run_in_executor(
-                    None, component.setup, hass, processed_config
+                    None,
+                    _setup_in_executor,
+                    executor_started,
+                    component.setup,
+                    hass,
+                    processed_config,
                 )
             elif not hasattr(component, "async_setup_entry"):
                 log_error("No setup or config entry setup function defined.")
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with async_record_setup_phase(hass, domain, SetupPhase.SETUP):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except TimeoutError:
             _LOGGER.error(
                 (
@@ -408,6 +454,14 @@ async def _async_setup_component(  # noqa: C901
             end = timer()
             if warn_task:
                 warn_task.cancel()
+            if executor_started and (timeline := async_get_setup_timeline(hass)):
+                # The setup span includes the time spent waiting for a worker
+                timeline.async_add_span(
+                    domain,
+                    SetupPhase.EXECUTOR_QUEUE,
+                    executor_submitted,
+                    executor_started[0],
+                )
         _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
 
         if result is False:
@@ -433,15 +487,7 @@ async def _async_setup_component(  # noqa: C901
         if entries := hass.config_entries.async_entries(
             domain, include_ignore=False, include_disabled=False
         ):
-            await asyncio.gather(
-                *(
-                    create_eager_task(
-                        entry.async_setup(hass, integration=integration),
-                        name=f"config entry setup {entry.title} {entry.domain} {entry.entry_id}",
-                    )
-                    for entry in entries
-                )
-            )
+            await _async_setup_config_entries(hass, integration, component, entries)
 
     # Cleanup
     if domain in hass.data[DATA_SETUP]:
@@ -452,6 +498,108 @@ async def _async_setup_component(  # noqa: C901
     return True
 
 
+class ConfigEntrySetupProgress:
+    """Progress of setting up the config entries of a component."""
+
+    __slots__ = ("total", "setting_up", "done", "deferred")
+
+    def __init__(self) -> None:
+        """Initialize the progress."""
+        self.total = 0
+        self.setting_up = 0
+        self.done = 0
+        # Entries which were still set up when the component stopped waiting
+        self.deferred = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the progress as a dict."""
+        return {
+            "total": self.total,
+            "queued": self.total - self.setting_up - self.done,
+            "setting_up": self.setting_up,
+            "done": self.done,
+            "deferred": self.deferred,
+        }
+
+
+@callback
+def async_get_config_entry_setup_progress(
+    hass: core.HomeAssistant,
+) -> dict[str, ConfigEntrySetupProgress]:
+    """Return the progress of setting up config entries for each component."""
+    progress: dict[str, ConfigEntrySetupProgress] = hass.data.setdefault(
+        DATA_CONFIG_ENTRY_SETUP_PROGRESS, {}
+    )
+    return progress
+
+
+async def _async_setup_config_entries(
+    hass: core.HomeAssistant,
+    integration: loader.Integration,
+    component: loader.ComponentProtocol,
+    entries: list[ConfigEntry],
+) -> None:
+    """Set up the config entries of a component concurrently.
+
+    An integration can limit how many of its entries are set up at the same
+    time with PARALLEL_ENTRY_SETUPS in its component. The component does not
+    wait longer than CONFIG_ENTRY_SETUP_MAX_WAIT for its entries, so a slow
+    or unreachable device does not hold up the integrations set up after it.
+    """
+    domain = integration.domain
+    progress = async_get_config_entry_setup_progress(hass)[
+        domain
+    ] = ConfigEntrySetupProgress()
+    progress.total = len(entries)
+    limit: int | None = getattr(component, "PARALLEL_ENTRY_SETUPS", None)
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def _async_setup_entry(entry: ConfigEntry) -> None:
+        """Set up a config entry once its integration has a free slot."""
+        async with semaphore or contextlib.nullcontext():
+            progress.setting_up += 1
+            try:
+                await entry.async_setup(hass, integration=integration)
+            finally:
+                progress.setting_up -= 1
+                progress.done += 1
+
+    tasks = [
+        hass.async_create_task(
+            _async_setup_entry(entry),
+            f"config entry setup {entry.title} {entry.domain} {entry.entry_id}",
+            eager_start=True,
+        )
+        for entry in entries
+    ]
+    done, pending = await asyncio.wait(tasks, timeout=CONFIG_ENTRY_SETUP_MAX_WAIT)
+    if pending:
+        progress.deferred = len(pending)
+        _LOGGER.warning(
+            (
+                "Setup of %s of %s %s config entries is taking over %s seconds,"
+                " continuing in the background"
+            ),
+            len(pending),
+            len(tasks),
+            domain,
+            CONFIG_ENTRY_SETUP_MAX_WAIT,
+        )
+    # Raise unexpected errors of the entries which are set up
+    await asyncio.gather(*done)
+
+
+def _setup_in_executor(
+    started: list[float],
+    setup: Callable[[core.HomeAssistant, ConfigType], bool],
+    hass: core.HomeAssistant,
+    config: ConfigType,
+) -> bool:
+    """Run the setup of a component in the executor and record when it started."""
+    started.append(time.monotonic())
+    return setup(hass, config)
+
+
 async def async_prepare_setup_platform(
     hass: core.HomeAssistant, hass_config: ConfigType, domain: str, platform_name: str
 ) -> ModuleType | None:
@@ -533,10 +681,11 @@ async def async_process_deps_reqs(
     if failed_deps := await _async_process_dependencies(hass, config, integration):
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_record_setup_phase(hass, integration.domain, SetupPhase.REQUIREMENTS):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -650,3 +799,214 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+
+
+class SetupTimeline:
+    """Timeline of the setups done while Home Assistant is starting.
+
+    Every phase of a setup is recorded as a span on the track of its
+    integration, together with the dependencies each integration waited
+    for and the bootstrap stages. The timeline can be exported in the
+    Chrome trace event format and tells which chain of setups delayed
+    startup the most.
+    """
+
+    __slots__ = ("start", "end", "spans", "waits", "stages")
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.start = time.monotonic()
+        self.end: float | None = None
+        # (domain, phase, start, end, detail)
+        self.spans: list[tuple[str, SetupPhase, float, float, str | None]] = []
+        self.waits: dict[str, set[str]] = {}
+        # (name, domains, start, end)
+        self.stages: list[tuple[str, set[str], float, float]] = []
+
+    @property
+    def recording(self) -> bool:
+        """Return if the timeline is recording."""
+        return self.end is None
+
+    @callback
+    def async_add_span(
+        self,
+        domain: str,
+        phase: SetupPhase,
+        start: float,
+        end: float,
+        detail: str | None = None,
+    ) -> None:
+        """Add a phase of a setup."""
+        if self.end is None:
+            self.spans.append((domain, phase, start, end, detail))
+
+    @callback
+    def async_add_waits(self, domain: str, dependencies: Iterable[str]) -> None:
+        """Add dependencies an integration waited for."""
+        if self.end is None:
+            self.waits.setdefault(domain, set()).update(dependencies)
+
+    @callback
+    def async_add_stage(
+        self, name: str, domains: set[str], start: float, end: float
+    ) -> None:
+        """Add a bootstrap stage."""
+        if self.end is None:
+            self.stages.append((name, domains, start, end))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop recording."""
+        if self.end is None:
+            self.end = time.monotonic()
+
+    def _domain_bounds(self) -> dict[str, tuple[float, float]]:
+        """Return when the setup of each integration started and finished."""
+        bounds: dict[str, tuple[float, float]] = {}
+        for domain, _, start, end, _ in self.spans:
+            if (current := bounds.get(domain)) is None:
+                bounds[domain] = (start, end)
+            else:
+                bounds[domain] = (min(current[0], start), max(current[1], end))
+        return bounds
+
+    def critical_path(self) -> list[dict[str, Any]]:
+        """Return the chain of setups that finished last.
+
+        The chain starts with the integration that finished last and walks
+        back through the dependency it waited for the longest. Integrations
+        that did not wait for a dependency are preceded by the integration
+        of an earlier stage that finished last before they started.
+        """
+        if not (bounds := self._domain_bounds()):
+            return []
+        stage_index: dict[str, int] = {}
+        for index, (_, domains, _, _) in enumerate(self.stages):
+            for domain in domains:
+                stage_index.setdefault(domain, index)
+
+        domain = max(bounds, key=lambda domain: bounds[domain][1])
+        path = [domain]
+        seen = {domain}
+        while True:
+            start, end = bounds[domain]
+            candidates = [
+                dep
+                for dep in self.waits.get(domain, ())
+                if dep in bounds and dep not in seen and bounds[dep][1] <= end
+            ]
+            if not candidates and (stage := stage_index.get(domain)) is not None:
+                candidates = [
+                    other
+                    for other, other_stage in stage_index.items()
+                    if other_stage < stage
+                    and other in bounds
+                    and other not in seen
+                    and bounds[other][1] <= start
+                ]
+            if not candidates:
+                break
+            domain = max(candidates, key=lambda domain: bounds[domain][1])
+            path.append(domain)
+            seen.add(domain)
+
+        phases: dict[str, dict[str, float]] = {domain: {} for domain in path}
+        for domain, phase, start, end, _ in self.spans:
+            if (domain_phases := phases.get(domain)) is not None:
+                domain_phases[phase] = domain_phases.get(phase, 0) + end - start
+        return [
+            {
+                "domain": domain,
+                "start": bounds[domain][0] - self.start,
+                "end": bounds[domain][1] - self.start,
+                "phases": phases[domain],
+            }
+            for domain in reversed(path)
+        ]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the timeline in the Chrome trace event format.
+
+        Each integration gets its own track, config entries get a track
+        of their own since they are set up concurrently.
+        """
+        tracks: dict[str, int] = {"bootstrap": 0}
+        events: list[dict[str, Any]] = []
+
+        def _event(
+            track: str, name: str, start: float, end: float, args: dict[str, Any]
+        ) -> None:
+            """Add a complete event."""
+            if (tid := tracks.get(track)) is None:
+                tid = tracks[track] = len(tracks)
+            events.append(
+                {
+                    "name": name,
+                    "cat": "setup",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round((start - self.start) * 1_000_000),
+                    "dur": round((end - start) * 1_000_000),
+                    "args": args,
+                }
+            )
+
+        for name, domains, start, end in self.stages:
+            _event("bootstrap", name, start, end, {"domains": sorted(domains)})
+        for domain, phase, start, end, detail in self.spans:
+            args: dict[str, Any] = {"domain": domain}
+            if phase is SetupPhase.WAIT_DEPENDENCIES:
+                args["dependencies"] = sorted(self.waits.get(domain, ()))
+            if detail is not None:
+                args["detail"] = detail
+            track = domain
+            if phase is SetupPhase.CONFIG_ENTRY_SETUP:
+                track = f"{domain}: {detail}"
+            _event(track, phase, start, end, args)
+
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": track},
+            }
+            for track, tid in tracks.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+
+@callback
+def async_start_setup_timeline(hass: core.HomeAssistant) -> SetupTimeline:
+    """Start recording the setup timeline."""
+    timeline = hass.data[DATA_SETUP_TIMELINE] = SetupTimeline()
+    return timeline
+
+
+@callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> SetupTimeline | None:
+    """Return the setup timeline if one was recorded."""
+    timeline: SetupTimeline | None = hass.data.get(DATA_SETUP_TIMELINE)
+    return timeline
+
+
+@contextlib.contextmanager
+def async_record_setup_phase(
+    hass: core.HomeAssistant,
+    domain: str,
+    phase: SetupPhase,
+    detail: str | None = None,
+) -> Generator[None, None, None]:
+    """Record a phase of a setup on the setup timeline."""
+    timeline: SetupTimeline | None = hass.data.get(DATA_SETUP_TIMELINE)
+    if timeline is None or not timeline.recording:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        timeline.async_add_span(domain, phase, start, time.monotonic(), detail)
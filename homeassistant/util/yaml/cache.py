@@ -0,0 +1,332 @@
+"""Cache of parsed YAML files."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.const import __version__
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.file import WriteError, write_utf8_file
+
+if TYPE_CHECKING:
+    from .loader import JSON_TYPE, Secrets
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION: Final = 1
+
+# Dependencies are stored as tuples to keep the cache file compact:
+# files as (path, mtime_ns, size, digest) and directories as (path, mtime_ns)
+# with a mtime of None when the directory did not exist.
+_FileDependency = tuple[str, int, int, bytes]
+_DirectoryDependency = tuple[str, int | None]
+
+ACTIVE_YAML_CACHE: ContextVar[YamlCache | None] = ContextVar(
+    "active_yaml_cache", default=None
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SecretReference:
+    """Placeholder for a secret, resolved every time a cached file is used.
+
+    Secret values are never written to the cache and changes to
+    the secrets files are picked up without invalidating it.
+    """
+
+    requester: str
+    name: str
+
+
+class _CacheEntry:
+    """A parsed file and everything its content depends on."""
+
+    __slots__ = ("files", "directories", "has_secrets", "payload")
+
+    def __init__(
+        self,
+        files: dict[str, _FileDependency],
+        directories: dict[str, _DirectoryDependency],
+        has_secrets: bool,
+        payload: bytes,
+    ) -> None:
+        """Initialize the entry."""
+        self.files = files
+        self.directories = directories
+        self.has_secrets = has_secrets
+        self.payload = payload
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        """Return the state to pickle."""
+        return (
+            tuple(self.files.values()),
+            tuple(self.directories.values()),
+            self.has_secrets,
+            self.payload,
+        )
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        """Restore a pickled entry."""
+        files, directories, self.has_secrets, self.payload = state
+        self.files = {dep[0]: dep for dep in files}
+        self.directories = {dep[0]: dep for dep in directories}
+
+
+class _Frame:
+    """Dependencies collected while a file is being parsed."""
+
+    __slots__ = ("files", "directories", "has_secrets", "cacheable")
+
+    def __init__(self) -> None:
+        """Initialize the frame."""
+        self.files: dict[str, _FileDependency] = {}
+        self.directories: dict[str, _DirectoryDependency] = {}
+        self.has_secrets = False
+        self.cacheable = True
+
+    def merge(self, other: _Frame | _CacheEntry) -> None:
+        """Add the dependencies of an included file."""
+        self.files.update(other.files)
+        self.directories.update(other.directories)
+        self.has_secrets |= other.has_secrets
+        if isinstance(other, _Frame):
+            self.cacheable &= other.cacheable
+
+
+def _file_digest(path: str) -> bytes:
+    """Return the digest of the content of a file."""
+    with open(path, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).digest()
+
+
+def _file_dependency(path: str) -> _FileDependency:
+    """Return the dependency on the current content of a file."""
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size, _file_digest(path))
+
+
+def _directory_mtime(path: str) -> int | None:
+    """Return the modification time of a directory or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _header() -> tuple[int, str, str]:
+    """Return the header that invalidates the cache on upgrades."""
+    return (CACHE_VERSION, __version__, sys.version)
+
+
+class YamlCache:
+    """Content addressed cache of parsed YAML files.
+
+    Files are keyed by their path and validated against the modification
+    time and size of every file and directory that contributed to their
+    content. When those changed the content hash decides if a file needs
+    to be parsed again, so touching a file does not invalidate the cache.
+
+    The parsed trees, including their file and line annotations, are kept
+    in their pickled form and unpickled on every load, so each caller gets
+    its own copy to mutate.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._entries: dict[str, _CacheEntry] = {}
+        self._used: set[str] = set()
+        self._frames: list[_Frame] = []
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load the cache file.
+
+        This method needs to run in an executor.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "rb") as file:
+                header, entries = pickle.load(file)
+        except FileNotFoundError:
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Ignoring unreadable YAML cache %s: %s", self.path, err)
+            return
+        if header != _header():
+            _LOGGER.debug("Ignoring YAML cache %s from another version", self.path)
+            return
+        self._entries = entries
+
+    def save(self) -> None:
+        """Write the cache file if it changed.
+
+        Only the entries used since the last save are kept.
+        This method needs to run in an executor.
+        """
+        if not self._dirty and self._used == self._entries.keys():
+            return
+        entries = {
+            path: entry
+            for path in self._used
+            if (entry := self._entries.get(path)) is not None
+        }
+        self._entries = entries
+        self._used = set()
+        self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(
+                self.path,
+                pickle.dumps((_header(), entries), pickle.HIGHEST_PROTOCOL),
+                mode="wb",
+            )
+        except (OSError, WriteError) as err:
+            _LOGGER.warning("Unable to write YAML cache %s: %s", self.path, err)
+
+    @contextmanager
+    def activate(self) -> Iterator[YamlCache]:
+        """Use the cache for the YAML files loaded in the block.
+
+        The cache file is updated when the block completes.
+        This method needs to run in an executor.
+        """
+        with self._lock:
+            self.load()
+            token = ACTIVE_YAML_CACHE.set(self)
+            try:
+                yield self
+            finally:
+                ACTIVE_YAML_CACHE.reset(token)
+                self._frames.clear()
+            self.save()
+
+    def load_file(
+        self,
+        fname: str | os.PathLike[str],
+        secrets: Secrets | None,
+        parse: Callable[[str | os.PathLike[str], Secrets | None], JSON_TYPE | None],
+    ) -> JSON_TYPE | None:
+        """Return the content of a file from the cache or parse it."""
+        outermost = not self._frames
+        path = os.path.abspath(fname)
+        data: JSON_TYPE | None
+        if (entry := self._valid_entry(path)) is not None:
+            data = pickle.loads(entry.payload)
+            has_secrets = entry.has_secrets
+            if not outermost:
+                self._frames[-1].merge(entry)
+        else:
+            frame = _Frame()
+            try:
+                frame.files[path] = _file_dependency(path)
+            except OSError:
+                # Files that can't be read are left to the parser
+                # to handle and are never cached
+                frame.cacheable = False
+            self._frames.append(frame)
+            try:
+                data = parse(fname, secrets)
+            finally:
+                self._frames.pop()
+            if frame.cacheable:
+                self._entries[path] = _CacheEntry(
+                    frame.files,
+                    frame.directories,
+                    frame.has_secrets,
+                    pickle.dumps(data, pickle.HIGHEST_PROTOCOL),
+                )
+                self._used.add(path)
+                self._dirty = True
+            has_secrets = frame.has_secrets
+            if not outermost:
+                self._frames[-1].merge(frame)
+        if outermost and has_secrets:
+            if secrets is None:
+                raise HomeAssistantError("Secrets not supported in this YAML file")
+            data = resolve_secrets(data, secrets)
+        return data
+
+    def add_secret(self) -> bool:
+        """Mark the file being parsed as containing secret references.
+
+        Returns False if no file is being loaded through the cache and
+        the secret needs to be resolved right away.
+        """
+        if not self._frames:
+            return False
+        self._frames[-1].has_secrets = True
+        return True
+
+    def add_directory(self, path: str) -> None:
+        """Add a directory that was listed while parsing the current file."""
+        if self._frames:
+            self._frames[-1].directories[path] = (path, _directory_mtime(path))
+
+    def mark_uncacheable(self) -> None:
+        """Mark the file being parsed as depending on something not tracked."""
+        if self._frames:
+            self._frames[-1].cacheable = False
+
+    def _valid_entry(self, path: str) -> _CacheEntry | None:
+        """Return the entry for a path if nothing it depends on changed."""
+        if (entry := self._entries.get(path)) is None:
+            return None
+        for dir_path, mtime in entry.directories.values():
+            if _directory_mtime(dir_path) != mtime:
+                return None
+        updated: list[_FileDependency] = []
+        for dependency in entry.files.values():
+            file_path, mtime_ns, size, digest = dependency
+            try:
+                stat = os.stat(file_path)
+                if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+                    continue
+                if stat.st_size != size or _file_digest(file_path) != digest:
+                    return None
+            except OSError:
+                return None
+            updated.append((file_path, stat.st_mtime_ns, size, digest))
+        if updated:
+            # The files were touched but their content is the same
+            entry.files.update((dep[0], dep) for dep in updated)
+            self._dirty = True
+        self._used.update(entry.files)
+        return entry
+
+
+def resolve_secrets(data: Any, secrets: Secrets) -> Any:
+    """Replace the secret references in a parsed tree with their values."""
+    if isinstance(data, SecretReference):
+        return secrets.get(data.requester, data.name)
+    if isinstance(data, dict):
+        if any(isinstance(key, SecretReference) for key in data):
+            items = list(data.items())
+            data.clear()
+            data.update(
+                (resolve_secrets(key, secrets), resolve_secrets(value, secrets))
+                for key, value in items
+            )
+            return data
+        for key, value in data.items():
+            if isinstance(value, (SecretReference, dict, list)):
+                data[key] = resolve_secrets(value, secrets)
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            if isinstance(value, (SecretReference, dict, list)):
+                data[index] = resolve_secrets(value, secrets)
+    return data
@@ -25,6 +25,7 @@ except ImportError:
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.frame import report
 
+from .cache import ACTIVE_YAML_CACHE, SecretReference
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -227,6 +228,17 @@ def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
     """Load a YAML file."""
+    if (yaml_cache := ACTIVE_YAML_CACHE.get()) is None or os.path.basename(
+        fname
+    ) == SECRET_YAML:
+        return _load_yaml(fname, secrets)
+    return yaml_cache.load_file(fname, secrets, _load_yaml)
+
+
+def _load_yaml(
+    fname: str | os.PathLike[str], secrets: Secrets | None = None
+) -> JSON_TYPE | None:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -353,7 +365,12 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    if yaml_cache := ACTIVE_YAML_CACHE.get():
+        # Adding or removing files changes the content of the include
+        yaml_cache.add_directory(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
+        if yaml_cache and root != directory:
+            yaml_cache.add_directory(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -480,6 +497,8 @@ def _handle_scalar_tag(
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    if yaml_cache := ACTIVE_YAML_CACHE.get():
+        yaml_cache.mark_uncacheable()
     args = node.value.split()
 
     # Check for a default value
@@ -496,6 +515,10 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
+    if (yaml_cache := ACTIVE_YAML_CACHE.get()) and yaml_cache.add_secret():
+        # Resolved after loading so secret values are never cached
+        return SecretReference(loader.get_name, node.value)  # type: ignore[return-value]
+
     return loader.secrets.get(loader.get_name, node.value)
 
 
@@ -496,7 +496,8 @@ async def test_stream_with_restricted(
         f"{const.URL_API_STREAM}?restrict=test_event1,test_event3"
     ) as resp:
         assert resp.status == HTTPStatus.OK
-        assert listen_count + 1 == _listen_count(hass)
+        # One keyed subscription per restricted event type
+        assert listen_count + 2 == _listen_count(hass)
 
         hass.bus.async_fire("test_event1")
         data = await _stream_next_event(resp.content)
@@ -508,6 +509,60 @@ async def test_stream_with_restricted(
         assert data["event_type"] == "test_event3"
 
 
+async def test_stream_with_entity_filter(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the stream filtered by entity_id and domain."""
+    async with mock_api_client.get(
+        f"{const.URL_API_STREAM}?event_type=state_changed"
+        "&entity_id=light.kitchen&domain=switch"
+    ) as resp:
+        assert resp.status == HTTPStatus.OK
+
+        hass.bus.async_fire("test_event")
+        hass.states.async_set("light.living_room", "on")
+        hass.states.async_set("light.kitchen", "on")
+        data = await _stream_next_event(resp.content)
+        assert data["event_type"] == "state_changed"
+        assert data["data"]["entity_id"] == "light.kitchen"
+
+        hass.states.async_set("sensor.temperature", "10")
+        hass.states.async_set("switch.fan", "off")
+        data = await _stream_next_event(resp.content)
+        assert data["data"]["entity_id"] == "switch.fan"
+
+
+async def test_stream_invalid_entity_filter(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the stream rejects invalid entity ids."""
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?entity_id=not_valid")
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_stream_shares_subscriptions(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test streams with the same event type share one bus listener."""
+    listen_count = _listen_count(hass)
+
+    async with mock_api_client.get(
+        f"{const.URL_API_STREAM}?entity_id=light.kitchen"
+    ) as resp1, mock_api_client.get(
+        f"{const.URL_API_STREAM}?entity_id=light.hallway"
+    ) as resp2:
+        assert resp1.status == HTTPStatus.OK
+        assert resp2.status == HTTPStatus.OK
+        assert listen_count + 1 == _listen_count(hass)
+
+        hass.states.async_set("light.hallway", "on")
+        hass.states.async_set("light.kitchen", "on")
+        data = await _stream_next_event(resp1.content)
+        assert data["data"]["entity_id"] == "light.kitchen"
+        data = await _stream_next_event(resp2.content)
+        assert data["data"]["entity_id"] == "light.hallway"
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
@@ -2575,6 +2575,47 @@ async def test_websocket_config(
     assert msg["error"]["code"] == "not_found"
 
 
+async def test_websocket_queue_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test queue stats command."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "mode": "queued",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "automation/queue_stats", "entity_id": "automation.hello"}
+    )
+
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "depth": 0,
+        "waits": 0,
+        "wait_total": 0.0,
+        "wait_max": 0.0,
+        "dropped": 0,
+        "coalesced": 0,
+    }
+
+    await client.send_json_auto_id(
+        {"type": "automation/queue_stats", "entity_id": "automation.not_exist"}
+    )
+
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
 def test_all() -> None:
     """Test module.__all__ is correctly set."""
     help_test_all(automation)
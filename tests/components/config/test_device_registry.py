@@ -440,3 +440,40 @@ async def test_remove_config_entry_from_device_fails(
     assert not response["success"]
     assert response["error"]["code"] == "home_assistant_error"
     assert response["error"]["message"] == "Integration not found"
+
+
+async def test_list_device_changes(
+    hass: HomeAssistant,
+    client: MockHAClientWebSocket,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test listing the devices changed since a revision."""
+    entry = MockConfigEntry(title=None)
+    entry.add_to_hass(hass)
+    device1 = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={("bridgeid", "0123")}
+    )
+    device2 = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={("bridgeid", "1234")}
+    )
+
+    await client.send_json_auto_id({"type": "config/device_registry/list_changes"})
+    msg = await client.receive_json()
+    revision = msg["result"]["revision"]
+    assert msg["result"]["full"]
+    assert sorted(device["id"] for device in msg["result"]["entries"]) == sorted(
+        [device1.id, device2.id]
+    )
+
+    device_registry.async_update_device(device1.id, name_by_user="Renamed")
+    device_registry.async_remove_device(device2.id)
+
+    await client.send_json_auto_id(
+        {"type": "config/device_registry/list_changes", "revision": revision}
+    )
+    msg = await client.receive_json()
+    assert not msg["result"]["full"]
+    assert msg["result"]["removed"] == [device2.id]
+    assert [
+        (device["id"], device["name_by_user"]) for device in msg["result"]["entries"]
+    ] == [(device1.id, "Renamed")]
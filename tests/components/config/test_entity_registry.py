@@ -146,6 +146,78 @@ async def test_list_entities(
     ]
 
 
+async def test_list_entity_changes(
+    hass: HomeAssistant, client: MockHAClientWebSocket
+) -> None:
+    """Test listing the entities changed since a revision."""
+    registry = async_get_entity_registry(hass)
+    for unique_id in ("3", "1", "2"):
+        registry.async_get_or_create(
+            "light", "hue", unique_id, suggested_object_id=unique_id
+        )
+
+    # Without a revision, all entries are listed by entity id
+    await client.send_json_auto_id(
+        {"type": "config/entity_registry/list_changes", "limit": 2}
+    )
+    msg = await client.receive_json()
+    revision = msg["result"]["revision"]
+    assert msg["result"]["full"]
+    assert msg["result"]["more"]
+    assert [entry["entity_id"] for entry in msg["result"]["entries"]] == [
+        "light.1",
+        "light.2",
+    ]
+    await client.send_json_auto_id(
+        {"type": "config/entity_registry/list_changes", "after": "light.2"}
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["full"]
+    assert not msg["result"]["more"]
+    assert [entry["entity_id"] for entry in msg["result"]["entries"]] == ["light.3"]
+
+    registry.async_update_entity("light.1", name="Renamed")
+    registry.async_update_entity("light.2", new_entity_id="light.4")
+    registry.async_remove("light.3")
+
+    await client.send_json_auto_id(
+        {"type": "config/entity_registry/list_changes", "revision": revision}
+    )
+    msg = await client.receive_json()
+    assert msg["result"] == {
+        "revision": ANY,
+        "full": False,
+        "more": False,
+        "removed": ["light.2", "light.3"],
+        "entries": [ANY, ANY],
+    }
+    assert [
+        (entry["entity_id"], entry["name"]) for entry in msg["result"]["entries"]
+    ] == [("light.1", "Renamed"), ("light.4", None)]
+
+    # Nothing changed since the last revision
+    await client.send_json_auto_id(
+        {
+            "type": "config/entity_registry/list_changes",
+            "revision": msg["result"]["revision"],
+        }
+    )
+    msg = await client.receive_json()
+    assert not msg["result"]["full"]
+    assert msg["result"]["entries"] == msg["result"]["removed"] == []
+
+    # Unknown revisions list all entries
+    await client.send_json_auto_id(
+        {"type": "config/entity_registry/list_changes", "revision": "unknown-1"}
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["full"]
+    assert [entry["entity_id"] for entry in msg["result"]["entries"]] == [
+        "light.1",
+        "light.4",
+    ]
+
+
 async def test_list_entities_for_display(
     hass: HomeAssistant, client: MockHAClientWebSocket
 ) -> None:
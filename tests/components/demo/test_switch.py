@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.components.demo import DOMAIN
+from homeassistant.components.demo.switch import DemoSwitch
 from homeassistant.components.switch import (
     DOMAIN as SWITCH_DOMAIN,
     SERVICE_TURN_OFF,
@@ -102,3 +103,22 @@ async def test_turn_off_without_entity_id(
 
     state = hass.states.get(switch_entity_id)
     assert state.state == STATE_OFF
+
+
+async def test_turn_off_all_with_one_command(hass: HomeAssistant) -> None:
+    """Test all switches are turned off together."""
+    await hass.services.async_call(
+        SWITCH_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: "all"}, blocking=True
+    )
+
+    with patch.object(DemoSwitch, "turn_off") as mock_turn_off:
+        await hass.services.async_call(
+            SWITCH_DOMAIN,
+            SERVICE_TURN_OFF,
+            {ATTR_ENTITY_ID: SWITCH_ENTITY_IDS},
+            blocking=True,
+        )
+
+    assert not mock_turn_off.called
+    for switch_entity_id in SWITCH_ENTITY_IDS:
+        assert hass.states.get(switch_entity_id).state == STATE_OFF
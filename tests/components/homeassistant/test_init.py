@@ -48,6 +48,7 @@ from tests.common import (
     mock_service,
     patch_yaml_files,
 )
+from tests.typing import WebSocketGenerator
 
 
 def turn_on(hass, entity_id=None, **service_data):
@@ -679,3 +680,43 @@ async def test_reload_all(
     assert len(core_config) == 1
     assert len(themes) == 1
     assert len(jinja) == 1
+
+
+async def test_state_trigger_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the evaluations and matches of state triggers are returned."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    async_mock_service(hass, "test", "automation")
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "homeassistant/state_trigger_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == []
+
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "alias": "to_on",
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": "test.entity",
+                    "to": "on",
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    hass.states.async_set("test.entity", "on")
+    hass.states.async_set("test.entity", "off")
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "homeassistant/state_trigger_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == [
+        {"name": "to_on", "entity_id": "test.entity", "evaluations": 1, "matches": 1}
+    ]
@@ -3,6 +3,7 @@
 import pytest
 
 import homeassistant.components.automation as automation
+from homeassistant.components.homeassistant.triggers import event as event_trigger
 from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
 from homeassistant.core import Context, HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -505,3 +506,72 @@ async def test_event_data_with_list(hass: HomeAssistant, calls) -> None:
     hass.bus.async_fire("test_event", {"some_attr": [1, 2, 3]})
     await hass.async_block_till_done()
     assert len(calls) == 1
+
+
+async def test_event_trigger_index(hass: HomeAssistant, calls) -> None:
+    """Test event triggers are only compared with events which have their data."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "event",
+                        "event_type": "test_event",
+                        "event_data": {"device_id": device_id, "command": "on"},
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": f"{device_id}_on"},
+                    },
+                }
+                for device_id in ("device_1", "device_2")
+            ]
+            + [
+                {
+                    "trigger": {"platform": "event", "event_type": "test_event"},
+                    "action": {"service": "test.automation", "data": {"id": "any"}},
+                },
+                {
+                    "trigger": {
+                        "platform": "event",
+                        "event_type": "test_event",
+                        "event_data": {"device_id": "device_1"},
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": "device_1"},
+                    },
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    index = event_trigger.async_get_event_trigger_index(hass)
+    triggers = index._event_types["test_event"]
+    assert triggers.keys == {"device_id": 2}
+    assert len(triggers.by_value[("device_id", "device_1")]) == 2
+    assert len(triggers.by_value[("device_id", "device_2")]) == 1
+    assert len(triggers.unindexed) == 1
+
+    hass.bus.async_fire("test_event", {"device_id": "device_1", "command": "on"})
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == ["device_1_on", "any", "device_1"]
+
+    calls.clear()
+    hass.bus.async_fire("test_event", {"device_id": "device_2", "command": "off"})
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test_event", {"device_id": ["device_1"]})
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == ["any", "any"]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert "test_event" not in index._event_types
+    assert hass.bus.async_listeners().get("test_event", 0) == 0
@@ -1745,3 +1745,100 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(calls) == 2
     assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(hass: HomeAssistant, calls) -> None:
+    """Test triggers of an entity share the comparisons of a state change."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": f"to_{state}_{index}",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": state,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": f"to_{state}_{index}"},
+                    },
+                }
+                for state in ("on", "off")
+                for index in range(2)
+            ]
+            + [
+                {
+                    "alias": "not_to_on",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "not_to": "on",
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": "not_to_on"},
+                    },
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    index = state_trigger.async_get_state_trigger_index(hass)
+    entity = index._entities["test.entity"]
+    assert len(entity.groups) == 3
+    assert len(entity.unindexed) == 1
+
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in calls) == ["to_on_0", "to_on_1"]
+
+    calls.clear()
+    hass.states.async_set("test.entity", "dimmed")
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == ["not_to_on"]
+
+    stats = {stat["name"]: stat for stat in index.async_get_stats()}
+    assert stats == {
+        "to_on_0": {
+            "name": "to_on_0",
+            "entity_id": "test.entity",
+            "evaluations": 1,
+            "matches": 1,
+        },
+        "to_on_1": {
+            "name": "to_on_1",
+            "entity_id": "test.entity",
+            "evaluations": 1,
+            "matches": 1,
+        },
+        "to_off_0": {
+            "name": "to_off_0",
+            "entity_id": "test.entity",
+            "evaluations": 0,
+            "matches": 0,
+        },
+        "to_off_1": {
+            "name": "to_off_1",
+            "entity_id": "test.entity",
+            "evaluations": 0,
+            "matches": 0,
+        },
+        "not_to_on": {
+            "name": "not_to_on",
+            "entity_id": "test.entity",
+            "evaluations": 2,
+            "matches": 1,
+        },
+    }
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert "test.entity" not in index._entities
@@ -1,13 +1,18 @@
 """The tests for the Home Assistant HTTP component."""
 
+import asyncio
+from datetime import timedelta
 from http import HTTPStatus
-from ipaddress import ip_address
+from ipaddress import ip_address, ip_network
 import os
-from unittest.mock import Mock, mock_open, patch
+import threading
+from typing import Any
+from unittest.mock import DEFAULT, Mock, mock_open, patch
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPUnauthorized
 from aiohttp.web_middlewares import middleware
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 import homeassistant.components.http as http
@@ -417,3 +422,192 @@ async def test_single_ban_file_entry(
         await manager.async_add_ban(remote_ip)
 
     assert m_open.call_count == 1
+
+
+async def test_access_from_banned_network(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator
+) -> None:
+    """Test CIDR ranges ban every address in them."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "203.0.113.0/24": {"banned_at": "2016-11-16T19:20:03"},
+            "2001:db8::/32": {"banned_at": "2016-11-16T19:20:03"},
+        },
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr in ("203.0.113.1", "203.0.113.254", "2001:db8::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.FORBIDDEN
+
+    for remote_addr in ("203.0.114.1", "2001:db9::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_expired_bans_are_compacted(hass: HomeAssistant) -> None:
+    """Test expired bans are ignored and dropped from the ban file."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 5)
+    manager = app[KEY_BAN_MANAGER]
+
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "200.201.202.203": {"banned_at": "2016-11-16T19:20:03"},
+            "100.64.0.2": {
+                "banned_at": "2016-11-16T19:20:03",
+                "expires_at": "2016-11-17T19:20:03",
+            },
+        },
+    ), patch("homeassistant.components.http.ban.write_utf8_file_atomic") as mock_write:
+        await manager.async_load()
+
+    assert manager.async_is_banned(ip_address("200.201.202.203"))
+    assert not manager.async_is_banned(ip_address("100.64.0.2"))
+    assert len(mock_write.mock_calls) == 1
+    content = mock_write.mock_calls[0][1][1]
+    assert "200.201.202.203" in content
+    assert "100.64.0.2" not in content
+
+
+async def test_temporary_ban(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a ban with a ban time expires."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 5)
+    manager = app[KEY_BAN_MANAGER]
+    m_open = mock_open()
+
+    with patch("homeassistant.components.http.ban.open", m_open, create=True):
+        await manager.async_add_ban(
+            ip_network("198.51.100.0/24"), ban_time=timedelta(hours=1)
+        )
+
+    assert "198.51.100.0/24" in m_open().write.mock_calls[0][1][0]
+    assert "expires_at" in m_open().write.mock_calls[0][1][0]
+    assert manager.async_is_banned(ip_address("198.51.100.7"))
+
+    assert list(manager.ip_network_bans_lookup) == [ip_network("198.51.100.0/24")]
+
+    freezer.tick(timedelta(hours=1, seconds=1))
+    assert not manager.async_is_banned(ip_address("198.51.100.7"))
+    assert not manager.ip_network_bans_lookup
+
+
+async def test_expired_ban_falls_back_to_broader_ban(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test an address stays banned by a broader ban once its own ban expired."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 5)
+    manager = app[KEY_BAN_MANAGER]
+
+    with patch("homeassistant.components.http.ban.open", mock_open(), create=True):
+        await manager.async_add_ban(
+            ip_address("198.51.100.7"), ban_time=timedelta(hours=1)
+        )
+        await manager.async_add_ban(ip_network("198.51.100.0/24"))
+
+    assert list(manager.ip_bans_lookup) == [ip_address("198.51.100.7")]
+
+    freezer.tick(timedelta(hours=1, seconds=1))
+    assert manager.async_is_banned(ip_address("198.51.100.7"))
+    assert not manager.ip_bans_lookup
+    assert list(manager.ip_network_bans_lookup) == [ip_network("198.51.100.0/24")]
+
+
+async def test_ban_duration(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test bans for too many login attempts expire after the ban duration."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+
+    async def unauth_handler(request):
+        """Return a mock web response."""
+        raise HTTPUnauthorized
+
+    app.router.add_get("/example", unauth_handler)
+    setup_bans(hass, app, 1, timedelta(minutes=30))
+    mock_real_ip(app)("200.201.202.204")
+
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file", return_value={}
+    ):
+        client = await aiohttp_client(app)
+
+    m_open = mock_open()
+    with patch("homeassistant.components.http.ban.open", m_open, create=True):
+        resp = await client.get("/example")
+        assert resp.status == HTTPStatus.UNAUTHORIZED
+        resp = await client.get("/example")
+        assert resp.status == HTTPStatus.FORBIDDEN
+
+    ban = app[KEY_BAN_MANAGER].ip_bans_lookup[ip_address("200.201.202.204")]
+    assert ban.expires_at == ban.banned_at + timedelta(minutes=30)
+    assert "expires_at" in m_open().write.mock_calls[0][1][0]
+
+    freezer.tick(timedelta(minutes=30, seconds=1))
+    with patch("homeassistant.components.http.ban.open", m_open, create=True):
+        resp = await client.get("/example")
+    assert resp.status == HTTPStatus.UNAUTHORIZED
+
+
+async def test_ban_duration_config(hass: HomeAssistant) -> None:
+    """Test the ban duration is passed from the config to the ban middleware."""
+    with patch("homeassistant.components.http.setup_bans") as mock_setup:
+        await async_setup_component(
+            hass, "http", {"http": {http.CONF_IP_BAN_DURATION: {"hours": 2}}}
+        )
+
+    assert mock_setup.mock_calls[0][1][3] == timedelta(hours=2)
+
+
+async def test_add_ban_waits_for_compaction(hass: HomeAssistant) -> None:
+    """Test a ban is not appended while the ban file is rewritten."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 5)
+    manager = app[KEY_BAN_MANAGER]
+    write_started = threading.Event()
+    write_continue = threading.Event()
+    calls: list[str] = []
+
+    def mock_write(*args: Any) -> None:
+        calls.append("compact")
+        write_started.set()
+        write_continue.wait()
+
+    m_open = mock_open()
+    m_open.side_effect = lambda *args, **kwargs: calls.append("append") or DEFAULT
+
+    with patch(
+        "homeassistant.components.http.ban.write_utf8_file_atomic", mock_write
+    ), patch("homeassistant.components.http.ban.open", m_open, create=True):
+        compact_task = hass.async_create_task(manager._async_compact())
+        await hass.async_add_executor_job(write_started.wait)
+        add_task = hass.async_create_task(
+            manager.async_add_ban(ip_address("198.51.100.7"))
+        )
+        await asyncio.sleep(0)
+        assert calls == ["compact"]
+        write_continue.set()
+        await compact_task
+        await add_task
+
+    assert calls == ["compact", "append"]
@@ -14,6 +14,7 @@ from homeassistant.auth.providers.legacy_api_password import (
     LegacyApiPasswordAuthProvider,
 )
 import homeassistant.components.http as http
+from homeassistant.components.http.request_timing import async_get_request_timings
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_HASS
 from homeassistant.helpers.network import NoURLAvailableError
@@ -453,6 +454,30 @@ async def test_cors_defaults(hass: HomeAssistant) -> None:
     assert mock_setup.mock_calls[0][1][1] == ["https://cast.home-assistant.io"]
 
 
+async def test_request_timing_disabled_by_default(hass: HomeAssistant) -> None:
+    """Test request timing is only set up when enabled."""
+    assert await async_setup_component(hass, "http", {})
+    assert async_get_request_timings(hass) is None
+
+
+async def test_request_timing_enabled(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test requests are timed per view when enabled."""
+    assert await async_setup_component(
+        hass, "http", {"http": {http.CONF_REQUEST_TIMING: True}}
+    )
+    assert await async_setup_component(hass, "api", {})
+    client = await hass_client()
+
+    resp = await client.get("/api/")
+    assert resp.status == HTTPStatus.OK
+
+    timings = async_get_request_timings(hass)
+    assert timings is not None
+    assert timings.stats["api:status"].count == 1
+
+
 async def test_storing_config(
     hass: HomeAssistant, aiohttp_client: ClientSessionGenerator, unused_tcp_port_factory
 ) -> None:
@@ -461,6 +486,7 @@ async def test_storing_config(
         http.CONF_SERVER_PORT: unused_tcp_port_factory(),
         "use_x_forwarded_for": True,
         "trusted_proxies": ["192.168.1.100"],
+        "ip_ban_duration": {"hours": 1},
     }
 
     assert await async_setup_component(hass, http.DOMAIN, {http.DOMAIN: config})
@@ -472,6 +498,7 @@ async def test_storing_config(
 
     restored = await hass.components.http.async_get_last_config()
     restored["trusted_proxies"][0] = ip_network(restored["trusted_proxies"][0])
+    restored["ip_ban_duration"] = timedelta(seconds=restored["ip_ban_duration"])
 
     assert restored == http.HTTP_SCHEMA(config)
 
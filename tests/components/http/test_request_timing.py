@@ -0,0 +1,101 @@
+"""Test request timing middleware."""
+
+from http import HTTPStatus
+
+from aiohttp import web
+from aiohttp.web_exceptions import HTTPNotFound
+
+from homeassistant.components.http.request_timing import (
+    DATA_REQUEST_TIMINGS,
+    LATENCY_BUCKETS,
+    UNMATCHED_ROUTE,
+    RequestTimings,
+    RequestTimingStats,
+    setup_request_timing,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.http import HomeAssistantView
+
+from tests.typing import ClientSessionGenerator
+
+
+async def test_request_timing_middleware(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator
+) -> None:
+    """Test requests are recorded per view."""
+    app = web.Application()
+
+    class MockView(HomeAssistantView):
+        """Mock view."""
+
+        url = "/"
+        name = "api:mock"
+        requires_auth = False
+
+        async def post(self, request: web.Request) -> web.Response:
+            """Return a response."""
+            return web.Response(text="hello")
+
+    async def mock_not_found(request: web.Request) -> web.Response:
+        """Raise not found."""
+        raise HTTPNotFound
+
+    MockView().register(hass, app, app.router)
+    app.router.add_get("/missing", mock_not_found)
+    setup_request_timing(hass, app)
+    client = await aiohttp_client(app)
+
+    resp = await client.post("/", data=b"12345")
+    assert resp.status == HTTPStatus.OK
+    resp = await client.get("/missing")
+    assert resp.status == HTTPStatus.NOT_FOUND
+    resp = await client.get("/nowhere")
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+    timings: RequestTimings = hass.data[DATA_REQUEST_TIMINGS]
+    assert set(timings.stats) == {"api:mock", "/missing", UNMATCHED_ROUTE}
+
+    stats = timings.stats["api:mock"].as_dict()
+    assert stats["count"] == 1
+    assert stats["bytes_in"] == 5
+    assert stats["bytes_out"] == 5
+    assert stats["status"] == {"200": 1}
+    assert timings.stats["/missing"].as_dict()["status"] == {"404": 1}
+
+
+async def test_request_timing_listener(hass: HomeAssistant) -> None:
+    """Test listeners receive every recorded request."""
+    timings = RequestTimings()
+    calls = []
+    remove = timings.async_add_listener(lambda *args: calls.append(args))
+
+    timings.async_record("api:states", 0.2, 10, 20, 200)
+    assert calls == [("api:states", 0.2, 10, 20, 200)]
+
+    remove()
+    timings.async_record("api:states", 0.2)
+    assert len(calls) == 1
+    assert timings.stats["api:states"].count == 2
+
+    timings.async_reset()
+    assert timings.as_dict() == {
+        "buckets": list(LATENCY_BUCKETS[:-1]),
+        "timings": {},
+    }
+
+
+def test_request_timing_percentiles() -> None:
+    """Test percentiles are estimated from the histogram."""
+    stats = RequestTimingStats()
+    assert stats.percentile(0.5) == 0
+
+    for _ in range(90):
+        stats.async_record(0.001, 0, 0, 200)
+    for _ in range(9):
+        stats.async_record(0.3, 0, 0, 200)
+    stats.async_record(30, 0, 0, 500)
+
+    assert 0 < stats.percentile(0.5) <= 0.005
+    assert 0.25 < stats.percentile(0.95) <= 0.5
+    assert stats.percentile(1) == 10
+    assert stats.status_counts == {200: 99, 500: 1}
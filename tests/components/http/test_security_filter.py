@@ -2,6 +2,7 @@
 
 import asyncio
 from http import HTTPStatus
+from unittest.mock import patch
 
 from aiohttp import web
 import pytest
@@ -158,3 +159,27 @@ async def test_bad_requests_with_unsafe_bytes(
     if fail_on_query_string:
         message = "Filtered a request with unsafe byte query string:"
     assert message in caplog.text
+
+
+async def test_validated_requests_are_cached(
+    aiohttp_client: ClientSessionGenerator,
+) -> None:
+    """Test a request that passed the filters is not checked again."""
+    app = web.Application()
+    app.router.add_get("/{all:.*}", mock_handler)
+
+    setup_security_filter(app)
+
+    mock_api_client = await aiohttp_client(app)
+    resp = await mock_api_client.get("/api/webhook/abc", params={"test": "123"})
+    assert resp.status == HTTPStatus.OK
+
+    with patch("homeassistant.components.http.security_filter.FILTERS") as mock_filters:
+        mock_filters.search.return_value = None
+        resp = await mock_api_client.get("/api/webhook/abc", params={"test": "123"})
+        assert resp.status == HTTPStatus.OK
+        assert not mock_filters.search.called
+
+        resp = await mock_api_client.get("/api/webhook/abc", params={"test": "456"})
+        assert resp.status == HTTPStatus.OK
+        assert mock_filters.search.called
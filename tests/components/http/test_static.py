@@ -1,12 +1,19 @@
 """The tests for http static files."""
 
+import gzip
 from pathlib import Path
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
 from aiohttp.web_exceptions import HTTPForbidden
 import pytest
 
-from homeassistant.components.http.static import CachingStaticResource, _get_file_path
+from homeassistant.components.http.static import (
+    CACHE_HEADER,
+    CachingStaticResource,
+    _accepts_gzip,
+    _get_file_path,
+)
 from homeassistant.core import EVENT_HOMEASSISTANT_START, HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGRED_CORS
 from homeassistant.setup import async_setup_component
@@ -59,3 +66,127 @@ async def test_static_path_blocks_anchors(
     # changes we still block it.
     with pytest.raises(HTTPForbidden):
         _get_file_path(canonical_url, tmp_path)
+
+
+async def test_fingerprinted_asset_served_from_memory(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test content hashed assets are indexed, precompressed and cached."""
+    content = b"console.log('hello');" * 100
+    (tmp_path / "app.0123abcd4567ef89.js").write_bytes(content)
+    hass.http.register_static_path("/assets", str(tmp_path))
+
+    resp = await mock_http_client.get("/assets/app.0123abcd4567ef89.js")
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Cache-Control"].endswith("immutable")
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert await resp.read() == content
+    etag = resp.headers["ETag"]
+    assert etag.startswith('"')
+
+    with patch(
+        "homeassistant.components.http.static._asset_signature"
+    ) as mock_asset_signature:
+        resp = await mock_http_client.get(
+            "/assets/app.0123abcd4567ef89.js", headers={"Accept-Encoding": "identity"}
+        )
+        assert resp.status == 200
+        assert "Content-Encoding" not in resp.headers
+        assert resp.headers["ETag"] == etag
+        assert await resp.read() == content
+
+        resp = await mock_http_client.get(
+            "/assets/app.0123abcd4567ef89.js", headers={"If-None-Match": etag}
+        )
+        assert resp.status == 304
+
+        resp = await mock_http_client.get(
+            "/assets/app.0123abcd4567ef89.js",
+            headers={"Accept-Encoding": "gzip;q=0, identity"},
+        )
+        assert resp.status == 200
+        assert "Content-Encoding" not in resp.headers
+        assert await resp.read() == content
+
+    # The file is not checked again until the revalidate interval passed
+    assert not mock_asset_signature.called
+
+    (tmp_path / "app.0123abcd4567ef89.js").write_bytes(b"modified")
+    resp = await mock_http_client.get("/assets/app.0123abcd4567ef89.js")
+    assert resp.headers["ETag"] == etag
+
+    with patch("homeassistant.components.http.static.ASSET_REVALIDATE_INTERVAL", 0):
+        # A modified file is indexed again
+        resp = await mock_http_client.get("/assets/app.0123abcd4567ef89.js")
+        assert resp.status == 200
+        assert resp.headers["ETag"] != etag
+        assert await resp.read() == b"modified"
+
+        (tmp_path / "app.0123abcd4567ef89.js").unlink()
+        resp = await mock_http_client.get("/assets/app.0123abcd4567ef89.js")
+        assert resp.status == 404
+
+
+async def test_fingerprinted_asset_prefers_precompressed(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test a precompressed sibling is used for the gzip variant."""
+    content = b"body { color: red; }" * 100
+    (tmp_path / "style.0123abcd4567ef89.css").write_bytes(content)
+    (tmp_path / "style.0123abcd4567ef89.css.gz").write_bytes(gzip.compress(content))
+    hass.http.register_static_path("/assets", str(tmp_path))
+
+    with patch("homeassistant.components.http.static.gzip.compress") as mock_compress:
+        resp = await mock_http_client.get("/assets/style.0123abcd4567ef89.css")
+
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.read() == content
+    assert not mock_compress.called
+
+    # A modified precompressed variant is read again
+    (tmp_path / "style.0123abcd4567ef89.css.gz").write_bytes(
+        gzip.compress(content, compresslevel=1)
+    )
+    with patch("homeassistant.components.http.static.ASSET_REVALIDATE_INTERVAL", 0):
+        resp = await mock_http_client.get("/assets/style.0123abcd4567ef89.css")
+
+    assert resp.status == 200
+    assert await resp.read() == content
+    assert resp.content_length == len(gzip.compress(content, compresslevel=1))
+
+
+@pytest.mark.parametrize("filename", ["index.js", "cam-20241019.jpg"])
+async def test_plain_asset_not_marked_immutable(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path, filename: str
+) -> None:
+    """Test files without a content hash keep the regular cache headers."""
+    (tmp_path / filename).write_bytes(b"content")
+    hass.http.register_static_path("/assets", str(tmp_path))
+
+    resp = await mock_http_client.get(f"/assets/{filename}")
+    assert resp.status == 200
+    assert resp.headers["Cache-Control"] == CACHE_HEADER
+    assert await resp.read() == b"content"
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("", False),
+        ("gzip", True),
+        ("GZIP, deflate", True),
+        ("deflate, gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, identity", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip, *;q=0", True),
+        ("gzip;q=0, *", False),
+        ("identity", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding: str, expected: bool) -> None:
+    """Test parsing if gzip is accepted."""
+    assert _accepts_gzip(accept_encoding) is expected
@@ -0,0 +1,39 @@
+"""Test the HTTP websocket API."""
+
+from homeassistant.components.http.request_timing import (
+    DATA_REQUEST_TIMINGS,
+    RequestTimings,
+)
+from homeassistant.core import HomeAssistant
+
+from tests.typing import WebSocketGenerator
+
+
+async def test_request_timings(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test we can get request timings when they are enabled."""
+    ws_client = await hass_ws_client(hass)
+
+    await ws_client.send_json({"id": 1, "type": "http/request_timings"})
+    response = await ws_client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"enabled": False}
+
+    timings = RequestTimings()
+    hass.data[DATA_REQUEST_TIMINGS] = timings
+    ws_client = await hass_ws_client(hass)
+
+    await ws_client.send_json({"id": 1, "type": "ping"})
+    await ws_client.receive_json()
+    await ws_client.send_json({"id": 2, "type": "integration/descriptions"})
+    await ws_client.receive_json()
+
+    await ws_client.send_json({"id": 3, "type": "http/request_timings", "reset": True})
+    response = await ws_client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["enabled"] is True
+    assert result["timings"]["websocket_api:ping"]["count"] == 1
+    assert result["timings"]["websocket_api:integration/descriptions"]["count"] == 1
+    assert set(timings.stats) == {"websocket_api:http/request_timings"}
@@ -1453,6 +1453,47 @@ async def test_websocket_config(
     assert msg["error"]["code"] == "not_found"
 
 
+async def test_websocket_queue_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test queue stats command."""
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                "hello": {
+                    "mode": "queued",
+                    "sequence": [{"service": "light.turn_on"}],
+                },
+            },
+        },
+    )
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "script/queue_stats", "entity_id": "script.hello"}
+    )
+
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "depth": 0,
+        "waits": 0,
+        "wait_total": 0.0,
+        "wait_max": 0.0,
+        "dropped": 0,
+        "coalesced": 0,
+    }
+
+    await client.send_json_auto_id(
+        {"type": "script/queue_stats", "entity_id": "script.not_exist"}
+    )
+
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
 async def test_script_service_changed_entity_id(hass: HomeAssistant) -> None:
     """Test the script service works for scripts with overridden entity_id."""
     entity_reg = er.async_get(hass)
@@ -115,6 +115,43 @@ async def test_reloadable_can_remove(hass: HomeAssistant, start_ha) -> None:
     assert len(hass.states.async_all()) == 1
 
 
+@pytest.mark.parametrize(("count", "domain"), [(2, "template")])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "template": [
+                {
+                    "sensor": {
+                        "name": "unchanged",
+                        "state": "{{ states('sensor.test_sensor') }}",
+                    },
+                },
+                {"sensor": {"name": "changed", "state": "old"}},
+            ],
+        },
+    ],
+)
+async def test_reloadable_keeps_unchanged_entities(
+    hass: HomeAssistant, start_ha
+) -> None:
+    """Test reloading only replaces the entities of changed sections."""
+    hass.states.async_set("sensor.test_sensor", "mytest")
+    await hass.async_block_till_done()
+    unchanged_state = hass.states.get("sensor.unchanged")
+    assert unchanged_state.state == "mytest"
+    assert hass.states.get("sensor.changed").state == "old"
+
+    await async_yaml_patch_helper(hass, "partial_change_configuration.yaml")
+    assert hass.states.get("sensor.unchanged") is unchanged_state
+    assert hass.states.get("sensor.changed").state == "new"
+    assert len(hass.states.async_all()) == 3
+
+    hass.states.async_set("sensor.test_sensor", "updated")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.unchanged").state == "updated"
+
+
 @pytest.mark.parametrize(("count", "domain"), [(1, "sensor")])
 @pytest.mark.parametrize(
     "config",
@@ -1638,3 +1638,166 @@ async def test_trace_blueprint_automation(
     assert trace["script_execution"] == "error"
     assert trace["item_id"] == "sun"
     assert trace.get("trigger", UNDEFINED) == "event 'blueprint_event'"
+
+
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+async def test_trace_mode_sampled(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain, prefix
+) -> None:
+    """Test only 1 in sample_rate runs is traced in sampled mode."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"event": "some_event"}, {"event": "another_event"}],
+    }
+    # Sample 1 in 3 runs of all scripts and automations
+    assert await async_setup_component(
+        hass, "trace", {"trace": {"mode": "sampled", "sample_rate": 3}}
+    )
+    await _setup_automation_or_script(hass, domain, [sun_config])
+
+    client = await hass_ws_client()
+
+    for _ in range(4):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 2
+
+    await client.send_json(
+        {"id": next_id(), "type": "trace/stats", "domain": domain, "item_id": "sun"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    stats = response["result"]["sun"]
+    assert stats["started"] == 4
+    assert stats["failed"] == 0
+    assert stats["runs"]["count"] == 4
+    assert stats["steps"].keys() == {f"{prefix}/0", f"{prefix}/1"}
+    assert stats["steps"][f"{prefix}/0"]["count"] == 4
+    assert sum(stats["steps"][f"{prefix}/0"]["buckets"]) == 4
+
+
+async def test_trace_mode_error(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test only failed runs are traced in error mode, without variables."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {"variables": {"fail": "{{ trigger.event.data.fail }}"}},
+            {"if": "{{ fail }}", "then": {"service": "test.not_existing"}},
+        ],
+        "trace": {"mode": "error"},
+    }
+    assert await async_setup_component(hass, "automation", {"automation": sun_config})
+
+    client = await hass_ws_client()
+
+    hass.bus.async_fire("test_event", {"fail": False})
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test_event", {"fail": True})
+    await hass.async_block_till_done()
+
+    await client.send_json(
+        {"id": next_id(), "type": "trace/list", "domain": "automation"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], "automation", "sun")
+    assert len(traces) == 1
+    assert traces[0]["error"] == "Service test.not_existing not found."
+
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": "automation",
+            "item_id": "sun",
+            "run_id": traces[0]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]["trace"]
+    assert "changed_variables" not in trace["trigger/0"][0]
+    assert "changed_variables" not in trace["action/0"][0]
+
+    await client.send_json(
+        {"id": next_id(), "type": "trace/stats", "domain": "automation"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sun"]["started"] == 2
+    assert response["result"]["sun"]["failed"] == 1
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_stats_removed(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test the statistics of a removed script or automation are dropped."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": {"mode": "stats"},
+    }
+    # A bare trace key uses the default settings
+    assert await async_setup_component(hass, "trace", {"trace": None})
+    if domain == "script":
+        config = {
+            "sun": {"sequence": sun_config["action"], "trace": sun_config["trace"]}
+        }
+    else:
+        config = [sun_config]
+    assert await async_setup_component(hass, domain, {domain: config})
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/stats", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sun"]["started"] == 1
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={domain: {} if domain == "script" else []},
+    ):
+        await hass.services.async_call(domain, "reload", blocking=True)
+
+    await client.send_json({"id": next_id(), "type": "trace/stats", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {}
@@ -23,15 +23,23 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    ConfigEntrySetupProgress,
+    async_get_config_entry_setup_progress,
+    async_setup_component,
+    async_start_setup_timeline,
+)
 from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    MockModule,
     MockUser,
     async_mock_service,
+    mock_integration,
     mock_platform,
 )
 from tests.typing import (
@@ -2509,6 +2517,93 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+    tmp_path,
+) -> None:
+    """Test the report of the imports done during startup."""
+    await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] is None
+
+    hass.config.config_dir = str(tmp_path)
+    await loader.async_load_import_profile(hass)
+    loader.async_finish_import_profile(hass)
+    await websocket_client.send_json({"id": 8, "type": "integration/import_info"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "modules": 0,
+        "prewarmed": 0,
+        "seconds_saved": 0,
+        "seconds_waited": 0,
+        "previous_seconds_waited": None,
+    }
+
+
+async def test_integration_setup_trace(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the timeline of the setups done during startup."""
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] is None
+
+    timeline = async_start_setup_timeline(hass)
+    mock_integration(hass, MockModule("comp"))
+    assert await async_setup_component(hass, "comp", {})
+    timeline.async_stop()
+
+    await websocket_client.send_json({"id": 8, "type": "integration/setup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert [step["domain"] for step in msg["result"]["critical_path"]] == ["comp"]
+    trace = msg["result"]["trace"]
+    assert trace["displayTimeUnit"] == "ms"
+    assert {event["name"] for event in trace["traceEvents"]} >= {
+        "thread_name",
+        "import",
+        "config_validation",
+        "setup",
+    }
+
+
+async def test_integration_config_entry_setup_progress(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the progress of setting up the config entries of integrations."""
+    progress = async_get_config_entry_setup_progress(hass)[
+        "comp"
+    ] = ConfigEntrySetupProgress()
+    progress.total = 3
+    progress.setting_up = 1
+    progress.done = 1
+    progress.deferred = 1
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "integration/config_entry_setup_progress"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "comp": {
+            "total": 3,
+            "queued": 1,
+            "setting_up": 1,
+            "done": 1,
+            "deferred": 1,
+        }
+    }
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -1375,6 +1375,79 @@ async def test_state_attribute_boolean(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_state_multiple_states(hass: HomeAssistant) -> None:
+    """Test with multiple and unhashable required states in condition."""
+    config = {
+        "condition": "state",
+        "entity_id": "sensor.temperature",
+        "attribute": "attribute1",
+        "state": ["low", "medium", ["high"]],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100, {"attribute1": "medium"})
+    assert test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": True}}],
+            "entity_id/0": [
+                {
+                    "result": {
+                        "result": True,
+                        "state": "medium",
+                        "wanted_state": "medium",
+                    }
+                }
+            ],
+        }
+    )
+
+    hass.states.async_set("sensor.temperature", 100, {"attribute1": ["high"]})
+    assert test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": True}}],
+            "entity_id/0": [
+                {
+                    "result": {
+                        "result": True,
+                        "state": ["high"],
+                        "wanted_state": ["high"],
+                    }
+                }
+            ],
+        }
+    )
+
+    hass.states.async_set("sensor.temperature", 100, {"attribute1": "off"})
+    assert not test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": False}}],
+            "entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": "off",
+                        "wanted_state": ["high"],
+                    }
+                }
+            ],
+        }
+    )
+
+    config["state"] = ["low", "medium"]
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100, {"attribute1": ["low"]})
+    assert not test(hass)
+
+    hass.states.async_set("sensor.temperature", 100, {"attribute1": "low"})
+    assert test(hass)
+
+
 async def test_state_entity_registry_id(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
@@ -2167,6 +2240,22 @@ async def test_condition_template_invalid_results(hass: HomeAssistant) -> None:
     assert not test(hass)
 
 
+async def test_condition_template_static(hass: HomeAssistant) -> None:
+    """Test template condition without any jinja."""
+    config = {"condition": "template", "value_template": " True "}
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    assert test(hass)
+    assert_condition_trace({"": [{"result": {"result": True, "entities": []}}]})
+
+    config = {"condition": "template", "value_template": "off"}
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    assert not test(hass)
+
+
 def _find_run_id(traces, trace_type, item_id):
     """Find newest run_id for a script or automation."""
     for _trace in reversed(traces):
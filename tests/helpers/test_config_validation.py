@@ -6,6 +6,7 @@ import enum
 import logging
 import os
 from socket import _GLOBAL_DEFAULT_TIMEOUT
+from typing import Any
 from unittest.mock import Mock, patch
 import uuid
 
@@ -498,6 +499,38 @@ def test_entity_service_schema() -> None:
         assert "metadata" not in validated
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("light.kitchen", ["light.kitchen"]),
+        ("Light.Kitchen", ["light.kitchen"]),
+        ("light.kitchen, light.living_room", ["light.kitchen", "light.living_room"]),
+        (
+            ["light.kitchen", "light.living_room"],
+            ["light.kitchen", "light.living_room"],
+        ),
+        (
+            ["light.kitchen", "Light.Living_Room"],
+            ["light.kitchen", "light.living_room"],
+        ),
+        ("all", "all"),
+        ("None", "none"),
+    ],
+)
+def test_entity_service_schema_entity_ids(value: Any, expected: Any) -> None:
+    """Test entity IDs validated by make_entity_service_schema."""
+    schema = cv.make_entity_service_schema({})
+    assert schema({"entity_id": value}) == {"entity_id": expected}
+
+
+def test_entity_service_schema_invalid_entity_ids() -> None:
+    """Test invalid entity IDs are rejected by make_entity_service_schema."""
+    schema = cv.make_entity_service_schema({})
+    for value in ("invalid_entity", "light.kitchen, invalid_entity"):
+        with pytest.raises(vol.Invalid):
+            schema({"entity_id": value})
+
+
 def test_entity_service_schema_with_metadata() -> None:
     """Test make_entity_service_schema with overridden metadata key."""
     schema = cv.make_entity_service_schema({vol.Required("metadata"): cv.positive_int})
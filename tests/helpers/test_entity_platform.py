@@ -11,6 +11,7 @@ import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
 from homeassistant.core import (
+    Context,
     CoreState,
     HomeAssistant,
     ServiceCall,
@@ -1515,6 +1516,74 @@ async def test_platforms_sharing_services(hass: HomeAssistant) -> None:
     assert entity2 in entities
 
 
+async def test_bulk_service_handler(hass: HomeAssistant) -> None:
+    """Test a bulk handler is called once for the entities of its platform."""
+
+    class HelloEntity(MockEntity):
+        """Entity with a hello method."""
+
+        async def async_hello(self, some: str) -> None:
+            """Say hello."""
+            self._values["state"] = f"hello {some}"
+            self.async_write_ha_state()
+
+    entity_platform1 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = HelloEntity(entity_id="mock_integration.entity_1", should_poll=False)
+    entity2 = HelloEntity(entity_id="mock_integration.entity_2", should_poll=False)
+    await entity_platform1.async_add_entities([entity1, entity2])
+
+    entity_platform2 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity3 = HelloEntity(entity_id="mock_integration.entity_3", should_poll=False)
+    entity4 = HelloEntity(entity_id="mock_integration.entity_4", should_poll=False)
+    await entity_platform2.async_add_entities([entity3, entity4])
+    entity1.parallel_updates = entity2.parallel_updates = asyncio.Semaphore(1)
+
+    bulk_calls = []
+
+    async def hello_all(entities: list[Entity], data: dict[str, Any]) -> None:
+        bulk_calls.append((entities, data))
+        assert entities[0].parallel_updates.locked()
+        for entity in entities:
+            entity._values["state"] = f"bulk hello {data['some']}"
+
+    entity_platform1.async_register_entity_service(
+        "hello", {"some": str}, "async_hello"
+    )
+    entity_platform1.async_register_bulk_service_handler("async_hello", hello_all)
+
+    context = Context()
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": "all", "some": "there"},
+        blocking=True,
+        context=context,
+    )
+
+    assert bulk_calls == [([entity1, entity2], {"some": "there"})]
+    assert not entity1.parallel_updates.locked()
+    for entity_id in ("mock_integration.entity_1", "mock_integration.entity_2"):
+        state = hass.states.get(entity_id)
+        assert state.state == "bulk hello there"
+        assert state.context is context
+    for entity_id in ("mock_integration.entity_3", "mock_integration.entity_4"):
+        assert hass.states.get(entity_id).state == "hello there"
+
+    # A single entity is called the usual way
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": "mock_integration.entity_1", "some": "you"},
+        blocking=True,
+    )
+    assert len(bulk_calls) == 1
+    assert hass.states.get("mock_integration.entity_1").state == "hello you"
+
+
 async def test_register_entity_service_response_data(hass: HomeAssistant) -> None:
     """Test an entity service that does supports response data."""
 
@@ -2187,3 +2256,50 @@ async def test_device_type_error_checking(
     assert len(device_registry.devices) == 0
     assert len(entity_registry.entities) == number_of_entities
     assert len(hass.states.async_all()) == number_of_entities
+
+
+async def test_reconfig_only_replaces_changed_configs(hass: HomeAssistant) -> None:
+    """Test reconfiguring a platform keeps the entities of unchanged configs."""
+
+    async def async_setup_platform(
+        hass: HomeAssistant,
+        config: ConfigType,
+        async_add_entities: entity_platform.AddEntitiesCallback,
+        discovery_info: DiscoveryInfoType | None = None,
+    ) -> None:
+        """Add an entity for each name in the config or discovery info."""
+        names = (discovery_info or config)["names"]
+        async_add_entities(MockEntity(name=name) for name in names)
+
+    platform = MockPlatform(async_setup_platform=async_setup_platform)
+    ent_platform = MockEntityPlatform(hass, platform=platform)
+    await ent_platform.async_setup({"names": ["one", "two"]})
+    await ent_platform.async_setup({"names": ["three"]})
+    await ent_platform.async_setup({}, {"names": ["four"]})
+    await hass.async_block_till_done()
+    unchanged = ent_platform.entities["test_domain.one"]
+    assert set(ent_platform.entities) == {
+        "test_domain.one",
+        "test_domain.two",
+        "test_domain.three",
+        "test_domain.four",
+    }
+
+    await ent_platform.async_reconfig(
+        [{"names": ["one", "two"]}, {"names": ["five"]}], [{"names": ["four"]}]
+    )
+    await hass.async_block_till_done()
+    assert set(ent_platform.entities) == {
+        "test_domain.one",
+        "test_domain.two",
+        "test_domain.four",
+        "test_domain.five",
+    }
+    assert ent_platform.entities["test_domain.one"] is unchanged
+    assert hass.states.get("test_domain.three") is None
+
+    # Without discovery info the discovered entities are removed
+    await ent_platform.async_reconfig([{"names": ["one", "two"]}])
+    await hass.async_block_till_done()
+    assert set(ent_platform.entities) == {"test_domain.one", "test_domain.two"}
+    assert ent_platform.entities["test_domain.one"] is unchanged
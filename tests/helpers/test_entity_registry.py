@@ -1847,3 +1847,32 @@ async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
 
     assert not er.async_entries_for_label(entity_registry, "unknown")
     assert not er.async_entries_for_label(entity_registry, "")
+
+
+async def test_entries_for_indexes(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries from the indexes."""
+    hue_light = entity_registry.async_get_or_create(
+        domain="light", platform="hue", unique_id="123"
+    )
+    hue_sensor = entity_registry.async_get_or_create(
+        domain="sensor", platform="hue", unique_id="456"
+    )
+    mqtt_sensor = entity_registry.async_get_or_create(
+        domain="sensor", platform="mqtt", unique_id="789"
+    )
+    hue_light = entity_registry.async_update_entity(hue_light.entity_id, labels={"a"})
+    mqtt_sensor = entity_registry.async_update_entity(
+        mqtt_sensor.entity_id, labels={"a", "b"}
+    )
+    entities = entity_registry.entities
+
+    assert entities.get_entries_for_platform("hue") == [hue_sensor, hue_light]
+    assert entities.get_entries_for_domain("sensor") == [hue_sensor, mqtt_sensor]
+    assert entities.get_entries_for_label("a") == [hue_light, mqtt_sensor]
+    assert entities.get_entries_for_label("b") == [mqtt_sensor]
+
+    # Removed entries are removed from the indexes
+    entity_registry.async_remove(mqtt_sensor.entity_id)
+    assert entities.get_entries_for_domain("sensor") == [hue_sensor]
+    assert not entities.get_entries_for_label("b")
+    assert not entities.get_entries_for_platform("mqtt")
@@ -3903,6 +3903,105 @@ async def test_periodic_task_minute(
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_shared_pattern(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test listeners of the same time pattern share a tracker."""
+    runs: list[tuple[str, datetime]] = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    unsubs = [
+        async_track_utc_time_change(
+            hass,
+            callback(lambda x, name=name: runs.append((name, x))),
+            minute="/5",
+            second=0,
+        )
+        for name in ("first", "second")
+    ]
+    unsub_other = async_track_utc_time_change(
+        hass, callback(lambda x: runs.append(("other", x))), minute="/5", second=30
+    )
+    assert len(hass.data["time_pattern_trackers"]) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert [name for name, _ in runs] == ["first", "second"]
+    assert runs[0][1] == runs[1][1]
+
+    runs.clear()
+    unsubs[0]()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert [name for name, _ in runs] == ["other", "second"]
+
+    unsubs[1]()
+    unsub_other()
+    assert not hass.data["time_pattern_trackers"]
+
+    runs.clear()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == []
+
+
+async def test_periodic_task_shared_pattern_listener_raises(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a listener raising does not stop the others of its time pattern."""
+    runs: list[datetime] = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    @callback
+    def raising_listener(now: datetime) -> None:
+        raise ValueError("boom")
+
+    unsub_raising = async_track_utc_time_change(
+        hass, raising_listener, minute="/5", second=0
+    )
+    unsub = async_track_utc_time_change(
+        hass, callback(lambda x: runs.append(x)), minute="/5", second=0
+    )
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert "Error while dispatching time change" in caplog.text
+    assert "boom" in caplog.text
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+    unsub_raising()
+    unsub()
+
+
 async def test_periodic_task_hour(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
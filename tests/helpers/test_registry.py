@@ -1,12 +1,18 @@
 """Tests for the registry."""
 
 from typing import Any
+from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
 
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import storage
-from homeassistant.helpers.registry import SAVE_DELAY, SAVE_DELAY_STARTING, BaseRegistry
+from homeassistant.helpers.registry import (
+    SAVE_DELAY,
+    SAVE_DELAY_STARTING,
+    BaseRegistry,
+    RegistryChanges,
+)
 
 from tests.common import async_fire_time_changed
 
@@ -50,3 +56,56 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+async def test_registry_changes(hass: HomeAssistant) -> None:
+    """Test tracking the changes of registry entries."""
+    changes = RegistryChanges()
+    start = changes.revision
+
+    changes.async_changed("a")
+    changes.async_changed("b")
+    after_b = changes.revision
+    changes.async_changed("a")
+    changes.async_changed("b", removed=True)
+
+    assert changes.async_changes_since(start, 10) == (
+        changes.revision,
+        [("a", False), ("b", True)],
+        False,
+    )
+    assert changes.async_changes_since(after_b, 10) == (
+        changes.revision,
+        [("a", False), ("b", True)],
+        False,
+    )
+    # More changes follow than the limit
+    revision, changed, more = changes.async_changes_since(start, 1)
+    assert changed == [("a", False)]
+    assert more
+    assert changes.async_changes_since(revision, 1) == (
+        changes.revision,
+        [("b", True)],
+        False,
+    )
+    assert changes.async_changes_since(changes.revision, 1) == (
+        changes.revision,
+        [],
+        False,
+    )
+
+    # Revisions of another tracker or in the future are unknown
+    assert changes.async_changes_since(RegistryChanges().revision, 10) is None
+    assert changes.async_changes_since(f"{start[:-2]}-100", 10) is None
+    assert changes.async_changes_since("invalid", 10) is None
+
+    # Evicted changes are unknown
+    with patch("homeassistant.helpers.registry.MAX_TRACKED_CHANGES", 2):
+        changes.async_changed("c")
+    assert changes.async_changes_since(start, 10) is None
+    assert changes.async_changes_since(after_b, 10) is None
+    assert changes.async_changes_since(revision, 10) == (
+        changes.revision,
+        [("b", True), ("c", False)],
+        False,
+    )
@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,7 +18,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_LAST_SEEN_REFRESH,
     STORAGE_KEY,
+    ExtraStoredData,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -386,6 +390,94 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_only_serializes_changed_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that states are only serialized again when they changed."""
+    extra_data = {"value": 1}
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data."""
+
+        @property
+        def extra_restore_state_data(self) -> ExtraStoredData:
+            """Return the extra data, which is changed in place."""
+            return RestoredExtraData(extra_data)
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = [RestoreEntity(), RestoreEntity(), MockRestoreEntity()]
+    for index, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{index}"
+    await platform.async_add_entities(entities)
+    data = async_get(hass)
+
+    async def _async_dump_states() -> list[Any]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return mock_write_data.mock_calls[0][1][0]
+
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+    written_states = await _async_dump_states()
+    assert [json_round_trip(state)["extra_data"] for state in written_states] == [
+        None,
+        None,
+        {"value": 1},
+    ]
+
+    hass.states.async_set("input_boolean.b0", "off")
+    extra_data["value"] = 2
+    changed_states = await _async_dump_states()
+    assert changed_states[0] is not written_states[0]
+    assert changed_states[1] is written_states[1]
+    assert changed_states[2] is not written_states[2]
+    assert json_round_trip(changed_states[0])["state"]["state"] == "off"
+    assert json_round_trip(changed_states[2])["extra_data"] == {"value": 2}
+
+    # The last seen time of unchanged states is refreshed eventually
+    freezer.tick(STATE_LAST_SEEN_REFRESH)
+    refreshed_states = await _async_dump_states()
+    assert refreshed_states[1] is not changed_states[1]
+    assert json_round_trip(refreshed_states[1])["last_seen"] == (
+        dt_util.utcnow().isoformat()
+    )
+
+
+async def test_dump_at_stop_refreshes_last_seen(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that the last seen time of all states is stored at stop."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await platform.async_add_entities([entity])
+    hass.states.async_set(entity.entity_id, "on")
+    data = async_get(hass)
+
+    with patch("homeassistant.helpers.restore_state.Store.async_save"):
+        data.async_setup_dump()
+        await hass.async_block_till_done()
+
+    freezer.tick(STATE_LAST_SEEN_REFRESH / 2)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+
+    periodic_states = mock_write_data.mock_calls[0][1][0]
+    stop_states = mock_write_data.mock_calls[-1][1][0]
+    assert periodic_states[0] is not stop_states[0]
+    assert json_round_trip(stop_states[0])["last_seen"] == (
+        dt_util.utcnow().isoformat()
+    )
+
+
 async def test_load_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     entity = RestoreEntity()
@@ -7,6 +7,7 @@ from functools import reduce
 import logging
 import operator
 from types import MappingProxyType
+from typing import Any
 from unittest import mock
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
@@ -38,6 +39,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -280,6 +282,103 @@ async def test_calling_service_basic(
     )
 
 
+async def test_calling_service_static_params(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test service steps prepared once run like service steps prepared per run."""
+    calls = async_mock_service(hass, "test", "script")
+    entry = entity_registry.async_get_or_create("light", "test", "1")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "service": "test.script",
+                "target": {"entity_id": ["light.kitchen", "light.hallway"]},
+                "data": {"brightness": 100, "rgb_color": [255, 0, 0]},
+            },
+            {"service": "test.script", "entity_id": "light.kitchen"},
+            {"service": "test.script", "target": {"entity_id": "all"}},
+            {"service": "test.script", "target": {"entity_id": entry.id}},
+            {"service": "test.script", "data": {"value": "{{ value }}"}},
+            {"service": "{{ 'test.script' }}", "data": {"hello": "world"}},
+        ]
+    )
+    assert [
+        service.async_prepare_static_call_from_config(hass, step) is None
+        for step in sequence
+    ] == [False, False, False, True, True, True]
+
+    async def async_run(script_obj: script.Script, value: int) -> list:
+        calls.clear()
+        await script_obj.async_run(MappingProxyType({"value": value}), Context())
+        await hass.async_block_till_done()
+        action_trace = {
+            path: [
+                {**element.as_dict(), "changed_variables": None, "timestamp": None}
+                for element in elements
+            ]
+            for path, elements in trace.trace_get().items()
+        }
+        return [
+            [(call.domain, call.service, call.data) for call in calls],
+            action_trace,
+        ]
+
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    with patch(
+        "homeassistant.helpers.service.async_prepare_static_call_from_config",
+        return_value=None,
+    ):
+        per_run_script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+        expected = [await async_run(per_run_script_obj, value) for value in (1, 2)]
+
+    assert [await async_run(script_obj, value) for value in (1, 2)] == expected
+    assert expected[0][0][0] == (
+        "test",
+        "script",
+        {
+            "entity_id": ["light.kitchen", "light.hallway"],
+            "brightness": 100,
+            "rgb_color": [255, 0, 0],
+        },
+    )
+
+    # Entity registry ids are resolved on each run
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.bowl")
+    calls.clear()
+    await script_obj.async_run(MappingProxyType({"value": 3}), Context())
+    await hass.async_block_till_done()
+    assert calls[3].data == {"entity_id": ["light.bowl"]}
+
+
+async def test_calling_service_static_params_mutated(hass: HomeAssistant) -> None:
+    """Test a service changing nested static params does not change later runs."""
+    values = []
+
+    @callback
+    def mutate_service(call: ServiceCall) -> None:
+        values.append(list(call.data["rgb_color"]))
+        call.data["rgb_color"].append(0)
+        call.data["entity_id"].append("light.hallway")
+
+    hass.services.async_register("test", "script", mutate_service)
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "service": "test.script",
+            "target": {"entity_id": ["light.kitchen"]},
+            "data": {"rgb_color": [255, 0, 0]},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    for _ in range(2):
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert values == [[255, 0, 0], [255, 0, 0]]
+    assert sequence[0]["data"] == {"rgb_color": [255, 0, 0]}
+    assert sequence[0]["target"] == {"entity_id": ["light.kitchen"]}
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -4315,6 +4414,139 @@ async def test_script_mode_queued(hass: HomeAssistant) -> None:
         assert events[3].data["value"] == 2
 
 
+@pytest.mark.parametrize(
+    ("queue_overflow", "values", "dropped", "coalesced"),
+    [
+        ("drop_newest", [1, 2, 3], 0, 0),
+        ("drop_oldest", [1, 3, 4], 1, 0),
+        ("coalesce", [1, 2, 4], 0, 1),
+    ],
+)
+async def test_script_mode_queued_overflow(
+    hass: HomeAssistant,
+    queue_overflow: str,
+    values: list[int],
+    dropped: int,
+    coalesced: int,
+) -> None:
+    """Test new runs of a queued script when the queue is full."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": event, "event_data": {"value": "{{ value }}"}},
+            {"wait_template": "{{ states.switch.test.state == 'off' }}"},
+        ]
+    )
+    script_obj = script.Script(
+        hass,
+        sequence,
+        "Test Name",
+        "test_domain",
+        script_mode="queued",
+        max_runs=3,
+        queue_overflow=queue_overflow,
+    )
+
+    wait_started_flag = async_watch_for_action(script_obj, "wait template")
+    hass.states.async_set("switch.test", "on")
+    hass.async_create_task(
+        script_obj.async_run(MappingProxyType({"value": 1}), Context())
+    )
+    await asyncio.wait_for(wait_started_flag.wait(), 1)
+    for value in (2, 3, 4):
+        hass.async_create_task(
+            script_obj.async_run(MappingProxyType({"value": value}), Context())
+        )
+        await asyncio.sleep(0)
+
+    assert script_obj.queue_depth == 2
+    assert [event.data["value"] for event in events] == [1]
+
+    hass.states.async_set("switch.test", "off")
+    await hass.async_block_till_done()
+
+    assert not script_obj.is_running
+    assert [event.data["value"] for event in events] == values
+    stats = script_obj.queue_stats
+    assert stats["depth"] == 0
+    assert stats["waits"] == len(values)
+    assert stats["wait_max"] >= stats["wait_total"] / len(values) > 0
+    assert stats["dropped"] == dropped
+    assert stats["coalesced"] == coalesced
+
+
+@pytest.mark.parametrize(
+    ("queue_overflow", "value"),
+    [
+        ("drop_newest", "before"),
+        ("drop_oldest", "after"),
+        ("coalesce", "after"),
+    ],
+)
+async def test_script_mode_queued_render_variables(
+    hass: HomeAssistant, queue_overflow: str, value: str
+) -> None:
+    """Test when the variables of a queued run are rendered."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": event, "event_data": {"value": "{{ value }}"}},
+            {"wait_template": "{{ states.switch.test.state == 'off' }}"},
+        ]
+    )
+    script_obj = script.Script(
+        hass,
+        sequence,
+        "Test Name",
+        "test_domain",
+        script_mode="queued",
+        max_runs=2,
+        queue_overflow=queue_overflow,
+        variables=cv.SCRIPT_VARIABLES_SCHEMA({"value": "{{ states('sensor.test') }}"}),
+    )
+
+    wait_started_flag = async_watch_for_action(script_obj, "wait template")
+    hass.states.async_set("switch.test", "on")
+    hass.states.async_set("sensor.test", "before")
+    hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.wait_for(wait_started_flag.wait(), 1)
+    hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.sleep(0)
+    hass.states.async_set("sensor.test", "after")
+
+    hass.states.async_set("switch.test", "off")
+    await hass.async_block_till_done()
+
+    assert [event.data["value"] for event in events] == ["before", value]
+
+
+@pytest.mark.parametrize(
+    ("config", "default_script_mode", "valid"),
+    [
+        ({}, "single", True),
+        ({"mode": "queued", "queue_overflow": "coalesce"}, "single", True),
+        ({"queue_overflow": "coalesce"}, "queued", True),
+        ({"queue_overflow": "coalesce"}, "single", False),
+        ({"mode": "restart", "queue_overflow": "drop_oldest"}, "queued", False),
+        ({"mode": "parallel", "queue_overflow": "drop_newest"}, "single", False),
+    ],
+)
+def test_make_script_schema_queue_overflow(
+    config: dict[str, Any], default_script_mode: str, valid: bool
+) -> None:
+    """Test queue_overflow is only accepted for queued scripts."""
+    schema = script.make_script_schema({}, default_script_mode)
+    if valid:
+        assert schema(config)["queue_overflow"] == config.get(
+            "queue_overflow", "drop_newest"
+        )
+        return
+    with pytest.raises(vol.Invalid, match="only supported in queued mode"):
+        schema(config)
+
+
 async def test_script_mode_queued_cancel(hass: HomeAssistant) -> None:
     """Test canceling with a queued run."""
     script_obj = script.Script(
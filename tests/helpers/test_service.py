@@ -32,6 +32,7 @@ from homeassistant.core import (
     SupportsResponse,
 )
 from homeassistant.helpers import (
+    area_registry as ar,
     device_registry as dr,
     entity_registry as er,
     service,
@@ -42,6 +43,7 @@ from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockUser,
     async_mock_service,
@@ -564,6 +566,48 @@ async def test_extract_entity_ids_from_devices(hass: HomeAssistant, area_mock) -
     )
 
 
+async def test_extract_entity_ids_target_resolution_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test resolved areas are cached until a registry is updated."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    area = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=area.id)
+    entity_registry.async_get_or_create(
+        "light", "test", "1", device_id=device.id, suggested_object_id="ceiling"
+    )
+    call = ServiceCall("light", "turn_on", {"area_id": area.id})
+
+    with patch(
+        "homeassistant.helpers.service._async_resolve_target",
+        wraps=service._async_resolve_target,
+    ) as mock_resolve:
+        assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+        assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+        assert len(mock_resolve.mock_calls) == 1
+
+        entity_registry.async_get_or_create(
+            "light", "test", "2", device_id=device.id, suggested_object_id="bowl"
+        )
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.ceiling",
+            "light.bowl",
+        }
+        assert len(mock_resolve.mock_calls) == 2
+
+        device_registry.async_update_device(device.id, area_id=None)
+        assert await service.async_extract_entity_ids(hass, call) == set()
+        assert len(mock_resolve.mock_calls) == 3
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
@@ -18,6 +18,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
+from homeassistant.helpers.json import save_json
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -851,3 +852,201 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_append_log_round_trip(tmpdir: py.path.local) -> None:
+    """Test saving changes to the append log and loading them."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+
+        def _store() -> storage.Store:
+            return storage.Store(
+                hass, MOCK_VERSION_2, MOCK_KEY, atomic_writes=True, append_log=True
+            )
+
+        def _read(path: str) -> list[str]:
+            with open(path, encoding="utf8") as file:
+                return file.read().splitlines()
+
+        store = _store()
+        items = [{"id": str(index), "name": f"Item {index}"} for index in range(100)]
+        await store.async_save({"items": items, "other": 1})
+        snapshot = await hass.async_add_executor_job(_read, store.path)
+        assert len(await hass.async_add_executor_job(_read, f"{store.path}.log")) == 1
+
+        items[5] = {"id": "5", "name": "Renamed"}
+        del items[10]
+        await store.async_save({"items": items, "other": 1})
+        await store.async_save({"items": items, "added": True})
+
+        # Only the changes are appended, the snapshot is untouched
+        assert await hass.async_add_executor_job(_read, store.path) == snapshot
+        log = await hass.async_add_executor_job(_read, f"{store.path}.log")
+        assert [json.loads(line) for line in log[1:]] == [
+            [["items", [{"id": "5", "name": "Renamed"}], ["10"]]],
+            [["added", True], ["other"]],
+        ]
+
+        expected = {"items": items, "added": True}
+        assert await _store().async_load() == expected
+
+        # A new version writes a snapshot
+        store = storage.Store(
+            hass, MOCK_VERSION_2, MOCK_KEY, minor_version=2, append_log=True
+        )
+        await store.async_load()
+        await store.async_save(expected)
+        assert await hass.async_add_executor_job(_read, store.path) != snapshot
+        assert len(await hass.async_add_executor_job(_read, f"{store.path}.log")) == 1
+
+        # The log is compacted once it grows beyond a fraction of the snapshot
+        for index in range(200):
+            items[0] = {"id": "0", "name": f"Renamed {index}"}
+            await store.async_save(expected)
+        log = await hass.async_add_executor_job(_read, f"{store.path}.log")
+        assert 1 < len(log) < 20
+        assert (await store.async_load())["items"][0]["name"] == "Renamed 199"
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(
+            os.path.exists, f"{store.path}.log"
+        )
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_list(tmpdir: py.path.local) -> None:
+    """Test the items of stored lists are appended by id."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+
+        def _key(item: dict[str, Any]) -> str:
+            return item["key"]
+
+        def _store() -> storage.Store:
+            return storage.Store(
+                hass, MOCK_VERSION_2, MOCK_KEY, append_log=True, append_log_item_id=_key
+            )
+
+        def _read(path: str) -> list[str]:
+            with open(path, encoding="utf8") as file:
+                return file.read().splitlines()
+
+        items = [{"key": str(index), "value": index} for index in range(500)]
+        store = _store()
+        await store.async_save(items)
+
+        # Items are diffed by id, not by position
+        items[1] = {"key": "1", "value": "changed"}
+        items.insert(0, {"key": "added", "value": "added"})
+        del items[100]
+        await store.async_save(items)
+        log = await hass.async_add_executor_job(_read, f"{store.path}.log")
+        assert [json.loads(line) for line in log[1:]] == [
+            [
+                [{"key": "added", "value": "added"}, {"key": "1", "value": "changed"}],
+                ["99"],
+            ],
+        ]
+
+        loaded = await _store().async_load()
+        assert sorted(loaded, key=_key) == sorted(items, key=_key)
+
+        # Lists without an item id are written as snapshots
+        store = storage.Store(hass, MOCK_VERSION_2, "no_item_id", append_log=True)
+        await store.async_save(items)
+        await store.async_save(items[:10])
+        assert len(await hass.async_add_executor_job(_read, f"{store.path}.log")) == 1
+        assert await store.async_load() == items[:10]
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the append log is compacted into the snapshot on final write."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+
+        def _store() -> storage.Store:
+            return storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, append_log=True)
+
+        def _read(path: str) -> list[str]:
+            with open(path, encoding="utf8") as file:
+                return file.read().splitlines()
+
+        items = [{"id": str(index), "name": f"Item {index}"} for index in range(100)]
+        store = _store()
+        await store.async_save({"items": items})
+        items[5] = {"id": "5", "name": "Renamed"}
+        await store.async_save({"items": items})
+        assert len(await hass.async_add_executor_job(_read, f"{store.path}.log")) == 2
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        # The snapshot holds the changes and can be read without the log
+        assert len(await hass.async_add_executor_job(_read, f"{store.path}.log")) == 1
+        snapshot = json.loads(
+            "\n".join(await hass.async_add_executor_job(_read, store.path))
+        )
+        assert snapshot["data"] == {"items": items}
+
+        # A log replayed on load is compacted as well
+        store = _store()
+        await store.async_load()
+        await store.async_save({"items": items[:50]})
+        assert len(await hass.async_add_executor_job(_read, f"{store.path}.log")) == 2
+        store = _store()
+        assert await store.async_load() == {"items": items[:50]}
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert len(await hass.async_add_executor_job(_read, f"{store.path}.log")) == 1
+        assert await _store().async_load() == {"items": items[:50]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_ignored(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test incomplete changes and logs of other snapshots are not loaded."""
+    async with async_test_home_assistant() as hass:
+        hass.config.config_dir = await hass.async_add_executor_job(
+            tmpdir.mkdir, "temp_storage"
+        )
+
+        def _store() -> storage.Store:
+            return storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, append_log=True)
+
+        def _append(path: str, content: bytes) -> None:
+            with open(path, "ab") as file:
+                file.write(content)
+
+        store = _store()
+        await store.async_save({"value": 1})
+        await store.async_save({"value": 2})
+        await hass.async_add_executor_job(_append, f"{store.path}.log", b'[["value", 3')
+
+        store = _store()
+        assert await store.async_load() == {"value": 2}
+        assert "Ignoring incomplete change" in caplog.text
+
+        # The next save writes a snapshot without the incomplete change
+        await store.async_save({"value": 4})
+        assert await _store().async_load() == {"value": 4}
+
+        # A log that was not reset after writing the snapshot is ignored
+        await hass.async_add_executor_job(
+            save_json,
+            store.path,
+            {"version": MOCK_VERSION_2, "key": MOCK_KEY, "data": {"hello": "world"}},
+        )
+        assert await _store().async_load() == {"hello": "world"}
+
+        await hass.async_stop(force=True)
@@ -132,6 +132,7 @@ def test_secrets(mock_is_file, event_loop, mock_hass_config_yaml: None) -> None:
         "cors_allowed_origins": ["http://google.com"],
         "ip_ban_enabled": True,
         "login_attempts_threshold": -1,
+        "request_timing": False,
         "server_port": 8123,
         "ssl_profile": "modern",
         "use_x_frame_options": True,
@@ -1567,6 +1567,26 @@ async def test_serviceregistry_call_with_blocking_done_in_time(
     assert len(calls) == 1
 
 
+async def test_serviceregistry_call_schema_default_factory(
+    hass: HomeAssistant,
+) -> None:
+    """Test the schema of a service is run for each call with the same data."""
+    calls = []
+    counter = iter(range(10))
+    schema = vol.Schema({vol.Optional("name", default=lambda: next(counter)): int})
+
+    @ha.callback
+    def service_handler(call):
+        """Service handler callback."""
+        calls.append(call)
+
+    hass.services.async_register("test_domain", "test_service", service_handler, schema)
+
+    for _ in range(2):
+        await hass.services.async_call("test_domain", "test_service", {}, blocking=True)
+    assert [call.data["name"] for call in calls] == [0, 1]
+
+
 async def test_serviceregistry_call_non_existing_with_blocking(
     hass: HomeAssistant,
 ) -> None:
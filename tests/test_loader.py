@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import pathlib
 import sys
 import threading
 from typing import Any
@@ -1693,3 +1694,205 @@ async def test_has_services(hass: HomeAssistant, enable_custom_integrations) ->
     assert integration.has_services is False
     integration = await loader.async_get_integration(hass, "test_with_services")
     assert integration.has_services is True
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test manifests and dependencies are persisted between restarts."""
+    await loader.async_load_manifest_cache(hass)
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    dependencies = integration.all_dependencies
+    await loader.async_save_manifest_cache(hass)
+    assert loader.MANIFEST_CACHE_KEY in hass_storage
+
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    await loader.async_load_manifest_cache(hass)
+    with patch(
+        "homeassistant.loader.Integration.resolve_from_root"
+    ) as mock_resolve_from_root:
+        cached = await loader.async_get_integration(hass, "logbook")
+    assert not mock_resolve_from_root.called
+    assert cached is not integration
+    assert cached.manifest == integration.manifest
+    assert cached.file_path == integration.file_path
+    assert cached.all_dependencies_resolved
+    assert cached.all_dependencies == dependencies
+
+
+async def test_manifest_cache_invalidated_on_manifest_change(
+    hass: HomeAssistant,
+) -> None:
+    """Test dependencies are resolved again when a manifest they use changed."""
+    await loader.async_load_manifest_cache(hass)
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    assert "http" in integration.all_dependencies
+    await loader.async_save_manifest_cache(hass)
+
+    manifest_mtimes = loader._manifest_mtimes
+
+    def mock_manifest_mtimes(file_path: pathlib.Path) -> list[int]:
+        mtimes = manifest_mtimes(file_path)
+        if file_path.name == "http":
+            return [mtime + 1 for mtime in mtimes]
+        return mtimes
+
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    with patch("homeassistant.loader._manifest_mtimes", mock_manifest_mtimes):
+        await loader.async_load_manifest_cache(hass)
+    cache = hass.data[loader.DATA_MANIFEST_CACHE]
+    assert "logbook" in cache.manifests
+    assert "http" not in cache.manifests
+    assert "logbook" not in cache.dependencies
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert not integration.all_dependencies_resolved
+    assert await integration.resolve_dependencies()
+    assert "http" in cache.manifests
+    assert "logbook" in cache.dependencies
+
+
+async def test_manifest_cache_invalidated_on_upgrade(hass: HomeAssistant) -> None:
+    """Test the manifest cache is not used after an upgrade."""
+    await loader.async_load_manifest_cache(hass)
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    await loader.async_save_manifest_cache(hass)
+
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    with patch("homeassistant.loader.__version__", "2099.1.0"):
+        await loader.async_load_manifest_cache(hass)
+    cache = hass.data[loader.DATA_MANIFEST_CACHE]
+    assert cache.manifests == {}
+    assert cache.dependencies == {}
+    assert not (
+        await loader.async_get_integration(hass, "logbook")
+    ).all_dependencies_resolved
+
+
+async def test_import_profile(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test modules imported during startup are imported ahead of need next time."""
+    imported: list[str] = []
+
+    def mock_import(module: str, *args: Any, **kwargs: Any) -> Any:
+        imported.append(module)
+        return MagicMock()
+
+    await loader.async_load_import_profile(hass)
+    integration = _get_test_integration(
+        hass, "executor_import", False, import_executor=True
+    )
+    with patch("homeassistant.loader.importlib.import_module", mock_import):
+        await integration.async_get_component()
+        await integration.async_get_platforms(["sensor", "light"])
+    loader.async_finish_import_profile(hass)
+    report = loader.async_get_import_report(hass)
+    assert report["modules"] == 3
+    assert report["prewarmed"] == 0
+    assert report["seconds_saved"] == 0
+    assert report["seconds_waited"] > 0
+    assert report["previous_seconds_waited"] is None
+    await loader.async_save_import_profile(hass)
+    assert loader.IMPORT_PROFILE_KEY in hass_storage
+
+    # Start again
+    for key in ("executor_import", "executor_import.sensor", "executor_import.light"):
+        hass.data[loader.DATA_COMPONENTS].pop(key)
+    imported.clear()
+    await loader.async_load_import_profile(hass)
+    integration = _get_test_integration(
+        hass, "executor_import", False, import_executor=True
+    )
+    hass.data[loader.DATA_INTEGRATIONS]["executor_import"] = integration
+    with patch("homeassistant.loader.importlib.import_module", mock_import):
+        await hass.async_create_task(loader.async_prewarm_imports(hass))
+        assert imported == [
+            "homeassistant.components.executor_import",
+            "homeassistant.components.executor_import.sensor",
+            "homeassistant.components.executor_import.light",
+        ]
+        await integration.async_get_component()
+        await integration.async_get_platforms(["sensor", "light"])
+    assert len(imported) == 3
+
+    loader.async_finish_import_profile(hass)
+    new_report = loader.async_get_import_report(hass)
+    assert new_report["modules"] == 3
+    assert new_report["prewarmed"] == 3
+    assert new_report["seconds_saved"] > 0
+    assert new_report["seconds_waited"] == 0
+    assert new_report["previous_seconds_waited"] == round(report["seconds_waited"], 4)
+
+
+async def test_import_profile_prewarm_does_not_import_in_loop(
+    hass: HomeAssistant,
+) -> None:
+    """Test a failed import ahead of need is not retried in the event loop."""
+    await loader.async_load_import_profile(hass)
+    profile = hass.data[loader.DATA_IMPORT_PROFILE]
+    profile.previous = [("executor_import", None, 0.1)]
+    integration = _get_test_integration(
+        hass, "executor_import", False, import_executor=True
+    )
+    hass.data[loader.DATA_INTEGRATIONS]["executor_import"] = integration
+
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=ImportError("not installed"),
+    ) as mock_import:
+        await hass.async_create_task(loader.async_prewarm_imports(hass))
+    assert mock_import.call_count == 1
+    assert "executor_import" not in hass.data[loader.DATA_COMPONENTS]
+
+
+@pytest.mark.parametrize("platform", [None, "sensor"])
+async def test_import_profile_prewarm_failure_with_concurrent_import(
+    hass: HomeAssistant, platform: str | None
+) -> None:
+    """Test an import waiting for a failed import ahead of need imports itself."""
+    await loader.async_load_import_profile(hass)
+    profile = hass.data[loader.DATA_IMPORT_PROFILE]
+    profile.previous = [("executor_import", platform, 0.1)]
+    integration = _get_test_integration(
+        hass, "executor_import", False, import_executor=True
+    )
+    hass.data[loader.DATA_INTEGRATIONS]["executor_import"] = integration
+    if platform is not None:
+        # Only import the platform ahead of need
+        hass.data[loader.DATA_COMPONENTS]["executor_import"] = MagicMock()
+
+    import_started = threading.Event()
+    import_continue = threading.Event()
+    calls = 0
+
+    def mock_import(module: str, *args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            import_started.set()
+            import_continue.wait()
+            raise ImportError("deadlock")
+        return MagicMock()
+
+    with patch("homeassistant.loader.importlib.import_module", mock_import):
+        prewarm_task = hass.async_create_task(loader.async_prewarm_imports(hass))
+        await hass.async_add_executor_job(import_started.wait)
+        if platform is None:
+            import_task = hass.async_create_task(integration.async_get_component())
+        else:
+            import_task = hass.async_create_task(
+                integration.async_get_platforms([platform])
+            )
+        await asyncio.sleep(0)
+        import_continue.set()
+        await prewarm_task
+        result = await import_task
+
+    assert calls == 2
+    if platform is None:
+        assert hass.data[loader.DATA_COMPONENTS]["executor_import"] is result
+    else:
+        assert result.keys() == {platform}
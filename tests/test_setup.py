@@ -2,6 +2,7 @@
 
 import asyncio
 import threading
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -16,6 +17,7 @@ from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
     PLATFORM_SCHEMA_BASE,
 )
+from homeassistant.helpers.typing import ConfigType
 
 from .common import (
     MockConfigEntry,
@@ -849,3 +851,170 @@ async def test_async_prepare_setup_platform(
         await setup.async_prepare_setup_platform(hass, {}, "button", "test") is None
     )
     assert button_platform is not None
+
+
+async def test_setup_timeline(hass: HomeAssistant) -> None:
+    """Test the setup timeline records the phases of each setup."""
+    timeline = setup.async_start_setup_timeline(hass)
+
+    def setup_slow(hass: HomeAssistant, config: ConfigType) -> bool:
+        """Set up the slow dependency in the executor."""
+        time.sleep(0.01)
+        return True
+
+    mock_integration(hass, MockModule("slow_dep", setup=setup_slow))
+    mock_integration(hass, MockModule("fast_dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["slow_dep", "fast_dep"]))
+    mock_integration(hass, MockModule("other"))
+
+    assert await setup.async_setup_component(hass, "other", {})
+    assert await setup.async_setup_component(hass, "comp", {})
+    timeline.async_stop()
+    assert setup.async_get_setup_timeline(hass) is timeline
+    assert timeline.waits == {"comp": {"slow_dep", "fast_dep"}}
+
+    phases = {(domain, phase) for domain, phase, _, _, _ in timeline.spans}
+    assert {
+        ("comp", setup.SetupPhase.WAIT_DEPENDENCIES),
+        ("comp", setup.SetupPhase.REQUIREMENTS),
+        ("comp", setup.SetupPhase.IMPORT),
+        ("comp", setup.SetupPhase.CONFIG_VALIDATION),
+        ("comp", setup.SetupPhase.SETUP),
+        ("slow_dep", setup.SetupPhase.EXECUTOR_QUEUE),
+        ("slow_dep", setup.SetupPhase.SETUP),
+    } <= phases
+
+    critical_path = timeline.critical_path()
+    assert [step["domain"] for step in critical_path] == ["slow_dep", "comp"]
+    assert critical_path[0]["phases"][setup.SetupPhase.SETUP] >= 0.01
+
+    trace = timeline.chrome_trace()
+    tracks = {
+        event["args"]["name"]: event["tid"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert tracks.keys() == {"bootstrap", "other", "comp", "slow_dep", "fast_dep"}
+    wait = next(
+        event
+        for event in trace["traceEvents"]
+        if event["name"] == setup.SetupPhase.WAIT_DEPENDENCIES
+    )
+    assert wait["tid"] == tracks["comp"]
+    assert wait["args"]["dependencies"] == ["fast_dep", "slow_dep"]
+    assert wait["dur"] >= 10000
+
+    # Nothing is recorded once the timeline is stopped
+    spans = len(timeline.spans)
+    mock_integration(hass, MockModule("late"))
+    assert await setup.async_setup_component(hass, "late", {})
+    assert len(timeline.spans) == spans
+
+
+async def test_setup_timeline_critical_path_stages(hass: HomeAssistant) -> None:
+    """Test the critical path crosses bootstrap stages."""
+    timeline = setup.SetupTimeline()
+    timeline.start = start = 0.0
+    timeline.async_add_stage("stage 1", {"a", "b"}, start, start + 3)
+    timeline.async_add_stage("stage 2", {"c", "d"}, start + 3, start + 5)
+    timeline.async_add_span("a", setup.SetupPhase.SETUP, start, start + 1)
+    timeline.async_add_span("b", setup.SetupPhase.SETUP, start, start + 3)
+    timeline.async_add_span("c", setup.SetupPhase.SETUP, start + 3, start + 4)
+    timeline.async_add_span(
+        "d", setup.SetupPhase.WAIT_DEPENDENCIES, start + 3, start + 4
+    )
+    timeline.async_add_span("d", setup.SetupPhase.SETUP, start + 4, start + 5)
+    timeline.async_add_waits("d", ["c"])
+
+    assert timeline.critical_path() == [
+        {"domain": "b", "start": 0, "end": 3, "phases": {"setup": 3}},
+        {"domain": "c", "start": 3, "end": 4, "phases": {"setup": 1}},
+        {
+            "domain": "d",
+            "start": 3,
+            "end": 5,
+            "phases": {"wait_dependencies": 1, "setup": 1},
+        },
+    ]
+
+
+async def test_config_entry_setup_parallel_limit(
+    hass: HomeAssistant, mock_handlers
+) -> None:
+    """Test the number of config entries set up at the same time is limited."""
+    setting_up = 0
+    max_setting_up = 0
+
+    async def async_setup_entry(
+        hass: HomeAssistant, entry: config_entries.ConfigEntry
+    ) -> bool:
+        nonlocal setting_up, max_setting_up
+        setting_up += 1
+        max_setting_up = max(max_setting_up, setting_up)
+        await asyncio.sleep(0)
+        setting_up -= 1
+        return True
+
+    module = MockModule("comp", async_setup_entry=async_setup_entry)
+    module.PARALLEL_ENTRY_SETUPS = 2
+    mock_integration(hass, module)
+    mock_platform(hass, "comp.config_flow", None)
+    entries = [MockConfigEntry(domain="comp") for _ in range(5)]
+    for entry in entries:
+        entry.add_to_hass(hass)
+
+    assert await setup.async_setup_component(hass, "comp", {})
+    assert max_setting_up == 2
+    assert all(
+        entry.state is config_entries.ConfigEntryState.LOADED for entry in entries
+    )
+    assert setup.async_get_config_entry_setup_progress(hass)["comp"].as_dict() == {
+        "total": 5,
+        "queued": 0,
+        "setting_up": 0,
+        "done": 5,
+        "deferred": 0,
+    }
+
+
+async def test_config_entry_setup_continues_in_background(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, mock_handlers
+) -> None:
+    """Test slow config entries do not hold up the setup of their component."""
+    unreachable = asyncio.Event()
+
+    async def async_setup_entry(
+        hass: HomeAssistant, entry: config_entries.ConfigEntry
+    ) -> bool:
+        if entry.data.get("unreachable"):
+            await unreachable.wait()
+        return True
+
+    mock_integration(hass, MockModule("comp", async_setup_entry=async_setup_entry))
+    mock_platform(hass, "comp.config_flow", None)
+    slow_entry = MockConfigEntry(domain="comp", data={"unreachable": True})
+    slow_entry.add_to_hass(hass)
+    fast_entry = MockConfigEntry(domain="comp")
+    fast_entry.add_to_hass(hass)
+
+    with patch.object(setup, "CONFIG_ENTRY_SETUP_MAX_WAIT", 0.01):
+        assert await setup.async_setup_component(hass, "comp", {})
+    assert "comp" in hass.config.components
+    assert fast_entry.state is config_entries.ConfigEntryState.LOADED
+    assert slow_entry.state is config_entries.ConfigEntryState.SETUP_IN_PROGRESS
+    assert (
+        "Setup of 1 of 2 comp config entries is taking over 0.01 seconds" in caplog.text
+    )
+    progress = setup.async_get_config_entry_setup_progress(hass)["comp"]
+    assert progress.as_dict() == {
+        "total": 2,
+        "queued": 0,
+        "setting_up": 1,
+        "done": 1,
+        "deferred": 1,
+    }
+
+    unreachable.set()
+    await hass.async_block_till_done()
+    assert slow_entry.state is config_entries.ConfigEntryState.LOADED
+    assert progress.done == 2
@@ -0,0 +1,126 @@
+"""Test the cache of parsed YAML files."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.config import load_yaml_config_file
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.yaml import Secrets, YamlCache, loader as yaml_loader
+
+
+def _load(config_dir: Path, yaml_cache: YamlCache) -> tuple[dict, int]:
+    """Load the configuration and return it with the number of parsed files."""
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as mock_parse:
+        config = load_yaml_config_file(
+            str(config_dir / "configuration.yaml"), Secrets(config_dir), yaml_cache
+        )
+    return config, mock_parse.call_count
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    """Return a configuration directory with includes and secrets."""
+    (tmp_path / "configuration.yaml").write_text(
+        "http:\n  api_password: !secret http_pw\n"
+        "sensor: !include sensor.yaml\n"
+        "automation: !include_dir_list automations\n"
+    )
+    (tmp_path / "sensor.yaml").write_text("- platform: template\n")
+    (tmp_path / "secrets.yaml").write_text("http_pw: abc123\n")
+    (tmp_path / "automations").mkdir()
+    (tmp_path / "automations" / "one.yaml").write_text("alias: one\n")
+    return tmp_path
+
+
+def test_unchanged_files_are_not_parsed(config_dir: Path) -> None:
+    """Test unchanged files are loaded from the cache with their annotations."""
+    cache_path = str(config_dir / ".storage" / "core.yaml_cache")
+    config, parsed = _load(config_dir, YamlCache(cache_path))
+    assert parsed == 4
+    assert os.path.isfile(cache_path)
+
+    cached_config, parsed = _load(config_dir, YamlCache(cache_path))
+    assert parsed == 1  # Only secrets.yaml
+    assert cached_config == config
+    assert cached_config["sensor"][0]["platform"].__config_file__ == str(
+        config_dir / "sensor.yaml"
+    )
+    assert cached_config["sensor"][0]["platform"].__line__ == 1
+
+    # The cached tree is a copy the caller can mutate
+    cached_config["sensor"].append({})
+    assert _load(config_dir, YamlCache(cache_path))[0] == config
+
+
+def test_changed_files_are_parsed(config_dir: Path) -> None:
+    """Test only changed files are parsed again."""
+    yaml_cache = YamlCache(str(config_dir / "yaml_cache"))
+    _load(config_dir, yaml_cache)
+
+    (config_dir / "sensor.yaml").write_text("- platform: group\n")
+    config, parsed = _load(config_dir, yaml_cache)
+    # configuration.yaml, sensor.yaml and secrets.yaml
+    assert parsed == 3
+    assert config["sensor"] == [{"platform": "group"}]
+    assert config["automation"] == [{"alias": "one"}]
+
+    # Touching a file without changing it does not invalidate the cache
+    os.utime(config_dir / "sensor.yaml", ns=(0, 0))
+    assert _load(config_dir, yaml_cache)[1] == 1
+
+
+def test_added_files_invalidate_include_dirs(config_dir: Path) -> None:
+    """Test adding a file to an included directory is picked up."""
+    yaml_cache = YamlCache(str(config_dir / "yaml_cache"))
+    _load(config_dir, yaml_cache)
+
+    (config_dir / "automations" / "two.yaml").write_text("alias: two\n")
+    config, _ = _load(config_dir, yaml_cache)
+    assert config["automation"] == [{"alias": "one"}, {"alias": "two"}]
+
+
+def test_secrets_are_not_cached(config_dir: Path) -> None:
+    """Test secrets are resolved on every load and never written to the cache."""
+    cache_path = config_dir / "yaml_cache"
+    yaml_cache = YamlCache(str(cache_path))
+    assert _load(config_dir, yaml_cache)[0]["http"]["api_password"] == "abc123"
+    assert b"abc123" not in cache_path.read_bytes()
+
+    (config_dir / "secrets.yaml").write_text("http_pw: def456\n")
+    config, parsed = _load(config_dir, yaml_cache)
+    assert parsed == 1
+    assert config["http"]["api_password"] == "def456"
+
+    (config_dir / "secrets.yaml").write_text("other: value\n")
+    with pytest.raises(HomeAssistantError, match="Secret http_pw not defined"):
+        _load(config_dir, yaml_cache)
+
+
+def test_env_var_is_not_cached(
+    config_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test files using environment variables are always parsed."""
+    (config_dir / "sensor.yaml").write_text("- platform: !env_var SENSOR_PLATFORM\n")
+    yaml_cache = YamlCache(str(config_dir / "yaml_cache"))
+    monkeypatch.setenv("SENSOR_PLATFORM", "template")
+    assert _load(config_dir, yaml_cache)[0]["sensor"] == [{"platform": "template"}]
+
+    monkeypatch.setenv("SENSOR_PLATFORM", "group")
+    config, parsed = _load(config_dir, yaml_cache)
+    assert config["sensor"] == [{"platform": "group"}]
+    # The automations directory is still cached
+    assert parsed == 3
+
+
+def test_unreadable_cache_is_ignored(config_dir: Path) -> None:
+    """Test a corrupt cache file is ignored."""
+    cache_path = config_dir / "yaml_cache"
+    cache_path.write_bytes(b"not a cache")
+    config, parsed = _load(config_dir, YamlCache(str(cache_path)))
+    assert parsed == 4
+    assert config["automation"] == [{"alias": "one"}]